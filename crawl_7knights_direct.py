@@ -22,7 +22,7 @@ def get_inven_posts(board_url: str, max_posts: int = 10):
     response = requests.get(board_url, headers=headers, timeout=30)
     response.encoding = 'utf-8'
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, 'lxml')
     
     # 게시글 링크 찾기
     links = soup.select('a.subject-link')[:max_posts]
@@ -307,20 +307,8 @@ class AlertManager:
         if not posts or not issue.related_posts:
             return False
         
-        # 현재 시간 기준 N시간 전
-        now = datetime.now()
-        cutoff_time = now - timedelta(hours=hours)
-        
-        # 이슈 관련 게시글 중 기간 내 게시글 수 계산
-        related_post_urls = set(issue.related_posts)
-        recent_count = 0
-        
-        for post in posts:
-            if post.url in related_post_urls:
-                if post.created_at and post.created_at >= cutoff_time:
-                    recent_count += 1
-        
-        return recent_count >= min_posts
+        # 이슈 관련 게시글 중 기간 내 게시글 수 계산 (count_posts_in_period와 동일한 루프)
+        return self.count_posts_in_period(posts, issue, hours) >= min_posts
     
     def count_posts_in_period(
         self,
@@ -341,18 +329,15 @@ class AlertManager:
         if not posts or not issue.related_posts:
             return 0
         
-        now = datetime.now()
-        cutoff_time = now - timedelta(hours=hours)
-        
+        # 현재 시간 기준 N시간 전
+        cutoff_time = datetime.now() - timedelta(hours=hours)
         related_post_urls = set(issue.related_posts)
-        count = 0
         
-        for post in posts:
-            if post.url in related_post_urls:
-                if post.created_at and post.created_at >= cutoff_time:
-                    count += 1
-        
-        return count
+        return sum(
+            1 for post in posts
+            if post.url in related_post_urls
+            and post.created_at and post.created_at >= cutoff_time
+        )
     
     def generate_alerts(
         self,
@@ -397,8 +382,9 @@ class AlertManager:
         # 긴급 알림 확인 및 생성
         if include_urgent:
             for issue in issues:
-                if self.classify_urgent_alert(posts, issue):
-                    post_count = self.count_posts_in_period(posts, issue)
+                # 기간 내 게시글 수를 한 번만 계산해 분류와 알림 생성에 함께 사용
+                post_count = self.count_posts_in_period(posts, issue, self.URGENT_HOURS)
+                if post_count >= self.URGENT_MIN_POSTS:
                     alert = self.create_urgent_alert(issue, game_id, post_count)
                     alerts.append(alert)
         
@@ -10,14 +10,19 @@ Requirements: 1.1, 1.3, 2.1, 2.3, 4.4
 
 import logging
 import random
-from typing import List, Optional
-from urllib.parse import urlparse, urljoin
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, HTTPError
+from urllib3.util.retry import Retry
 
 from crawler.models.data_models import CrawlerConfig, PostContent, Comment
-from crawler.utils.rate_limiter import RateLimiter
+from crawler.utils.rate_limiter import RateLimiter, extract_domain
+from crawler.utils.robots import fetch_robots_parser
 from crawler.parsers.base import ParserRegistry, ContentParser
 from crawler.parsers.generic import GenericParser
 from crawler.parsers.inven import InvenParser
@@ -37,6 +42,21 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
 ]
 
+POOL_CONNECTIONS = 20  # 커넥션 풀을 유지할 호스트 수
+POOL_MAXSIZE = 20      # 호스트당 keep-alive 커넥션 수
+SLOW_FETCH_SECONDS = 10.0  # 이 시간 이상 걸린 요청은 경고 로그
+
+# 일시적 서버 과부하(503)만 전송 계층에서 재시도 (Retry-After 준수)
+# 429는 RateLimiter의 도메인별 백오프로 처리하고, 404/403/410 등은 재시도 없이 즉시 실패
+TRANSIENT_RETRY = Retry(
+    total=2,
+    status_forcelist=[503],
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    backoff_factor=0.5,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
 
 class ContentCrawler:
     """콘텐츠 크롤러
@@ -75,9 +95,21 @@ class ContentCrawler:
             "Upgrade-Insecure-Requests": "1",
         })
         
+        # 호스트별 keep-alive 커넥션 풀 (사이트별 병렬 크롤링 시 커넥션 재사용)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=TRANSIENT_RETRY
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         # 타임아웃 설정
         self.connect_timeout = 10  # 연결 타임아웃 (초)
         self.read_timeout = 30     # 읽기 타임아웃 (초)
+        
+        # robots.txt 파서 캐시 ("scheme://domain" -> 파서, 가져오지 못한 경우 None)
+        self._robots_parsers: Dict[str, Optional[RobotFileParser]] = {}
     
     def _register_default_parsers(self) -> None:
         """기본 파서 등록
@@ -104,13 +136,58 @@ class ContentCrawler:
     
     def _extract_domain(self, url: str) -> str:
         """URL에서 도메인 추출"""
+        return extract_domain(url)
+    
+    def _fetch_robots_txt(self, robots_url: str, timeout: float) -> requests.Response:
+        """크롤러 세션으로 robots.txt 요청
+        
+        게시글 요청과 같은 헤더/커넥션 풀을 사용하고 도메인별 요청 간격을 지킨다.
+        
+        Args:
+            robots_url: robots.txt URL
+            timeout: 요청 타임아웃 (초)
+            
+        Returns:
+            HTTP 응답
+        """
+        self.rate_limiter.wait(self._extract_domain(robots_url))
+        return self.session.get(
+            robots_url,
+            headers={"User-Agent": self._get_random_user_agent()},
+            timeout=timeout
+        )
+    
+    def _is_allowed_by_robots(self, url: str) -> bool:
+        """robots.txt 기준 URL 크롤링 허용 여부 (도메인별로 한 번만 가져옴)
+        
+        Args:
+            url: 확인할 URL
+            
+        Returns:
+            크롤링 허용 여부. robots.txt 요청이 실패한 경우 허용, 5xx 응답이면 차단
+        """
         parsed = urlparse(url)
-        return parsed.netloc
+        if not parsed.netloc:
+            return True
+        
+        # 일시 중단된 도메인은 robots.txt도 요청하지 않음 (이후 Rate limiting 단계에서 차단)
+        if self.rate_limiter.is_domain_suspended(parsed.netloc):
+            return True
+        
+        origin = f"{parsed.scheme or 'https'}://{parsed.netloc}"
+        if origin not in self._robots_parsers:
+            self._robots_parsers[origin] = fetch_robots_parser(
+                f"{origin}/robots.txt", self._fetch_robots_txt
+            )
+        
+        parser = self._robots_parsers[origin]
+        return parser is None or parser.can_fetch("*", url)
     
     def _fetch_html(self, url: str) -> Optional[str]:
         """URL에서 HTML 가져오기
         
         Requirements: 5.1, 5.2, 5.3
+        - robots.txt 준수 (설정 시)
         - Rate limiting 적용
         - HTTP 429 응답 시 지수 백오프
         - 재시도 횟수 초과 시 None 반환
@@ -123,6 +200,11 @@ class ContentCrawler:
         """
         domain = self._extract_domain(url)
         
+        # robots.txt 확인 (도메인별로 한 번만 가져옴)
+        if self.config.respect_robots_txt and not self._is_allowed_by_robots(url):
+            logger.warning(f"robots.txt에 의해 차단된 URL: {url}")
+            return None
+        
         # Rate limiting 적용
         wait_result = self.rate_limiter.wait(domain)
         if wait_result < 0:
@@ -133,11 +215,17 @@ class ContentCrawler:
         headers = {"User-Agent": self._get_random_user_agent()}
         
         try:
+            started = time.monotonic()
             response = self.session.get(
                 url,
                 headers=headers,
                 timeout=(self.connect_timeout, self.read_timeout)
             )
+            elapsed = time.monotonic() - started
+            if elapsed >= SLOW_FETCH_SECONDS:
+                logger.warning(f"느린 응답: {url} ({elapsed:.1f}초, HTTP {response.status_code})")
+            else:
+                logger.debug(f"응답 시간: {url} ({elapsed:.2f}초)")
             
             # HTTP 429 처리
             if response.status_code == 429:
@@ -4,17 +4,28 @@ AnalysisDataStore 클래스 구현
 Requirements: 1.1, 6.1
 - 분석 결과 저장 및 로드
 - 게임별 최신 분석 결과 조회
+
+분석 결과는 gzip으로 압축해 저장한다. (이전 버전의 비압축 .json 파일도 조회/로드 가능)
 """
 
 import os
-import json
-import glob
+import gzip
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict
 
+import orjson
+
 from crawler.models.analysis_models import GameAnalysisResult
 
 
+ANALYSIS_FILE_PREFIX = "analysis_"  # 분석 결과 파일명 접두사
+ANALYSIS_FILE_SUFFIX = ".json.gz"  # 분석 결과 파일 확장자 (gzip 압축 JSON)
+LEGACY_ANALYSIS_FILE_SUFFIX = ".json"  # 이전 버전의 비압축 분석 결과 파일 확장자
+ANALYSIS_COMPRESS_LEVEL = 1  # gzip 압축 레벨 (JSON은 낮은 레벨에서도 압축률이 높음)
+SUMMARY_CACHE_SIZE = 256  # 분석 요약 캐시 최대 항목 수
+
+
 class AnalysisDataStore:
     """분석 결과 저장소 클래스
     
@@ -33,6 +44,9 @@ class AnalysisDataStore:
         """
         self.base_dir = base_dir
         os.makedirs(self.base_dir, exist_ok=True)
+        
+        # 분석 요약 캐시 ((게임 ID, 최신 파일, mtime, 크기, 파일 수) 기준)
+        self._summary_cache = lru_cache(maxsize=SUMMARY_CACHE_SIZE)(self._compute_summary)
     
     def _get_game_dir(self, game_id: str) -> str:
         """게임별 디렉토리 경로 반환
@@ -52,10 +66,40 @@ class AnalysisDataStore:
             analyzed_at: 분석 시간
             
         Returns:
-            파일명 (analysis_YYYYMMDD_HHMMSS.json)
+            파일명 (analysis_YYYYMMDD_HHMMSS.json.gz)
         """
         timestamp = analyzed_at.strftime("%Y%m%d_%H%M%S")
-        return f"analysis_{timestamp}.json"
+        return f"{ANALYSIS_FILE_PREFIX}{timestamp}{ANALYSIS_FILE_SUFFIX}"
+    
+    @staticmethod
+    def _is_analysis_entry(entry: os.DirEntry) -> bool:
+        """분석 결과 파일(analysis_*.json.gz/.json) 여부"""
+        return (
+            entry.name.startswith(ANALYSIS_FILE_PREFIX)
+            and entry.name.endswith((ANALYSIS_FILE_SUFFIX, LEGACY_ANALYSIS_FILE_SUFFIX))
+            and entry.is_file()
+        )
+    
+    def _scan_analysis_files(self, game_dir: str) -> List[str]:
+        """디렉토리의 분석 결과 파일 경로 목록 (analysis_*.json.gz/.json, 파일명순 정렬)
+        
+        os.scandir 한 번으로 디렉토리를 읽고, DirEntry에 캐시된 파일 타입 정보를 사용한다.
+        
+        Args:
+            game_dir: 게임별 디렉토리 경로
+            
+        Returns:
+            분석 결과 파일 경로 목록. 디렉토리가 없으면 빈 목록
+        """
+        try:
+            with os.scandir(game_dir) as entries:
+                files = [entry.path for entry in entries if self._is_analysis_entry(entry)]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        
+        # 파일명에 분석 시간이 포함되어 있으므로 파일명 정렬 = 시간순 정렬
+        files.sort()
+        return files
     
     def save_analysis(self, game_id: str, result: GameAnalysisResult) -> str:
         """분석 결과 저장
@@ -70,19 +114,45 @@ class AnalysisDataStore:
         Returns:
             저장된 파일 경로
         """
+        return self.save_analyses(game_id, [result])[0]
+    
+    def save_analyses(self, game_id: str, results: List[GameAnalysisResult]) -> List[str]:
+        """여러 분석 결과를 한 번에 저장
+        
+        게임별 디렉토리는 한 번만 생성하고, 각 결과를 파일 하나씩 저장한다.
+        
+        Args:
+            game_id: 게임 ID
+            results: 저장할 분석 결과 목록
+            
+        Returns:
+            저장된 파일 경로 목록 (results 순서)
+        """
         # 게임별 디렉토리 생성
         game_dir = self._get_game_dir(game_id)
         os.makedirs(game_dir, exist_ok=True)
         
-        # 파일명 생성 및 저장
-        filename = self._get_analysis_filename(result.analyzed_at)
-        filepath = os.path.join(game_dir, filename)
-        
-        data = result.to_dict()
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        filepaths = []
+        for result in results:
+            # 파일명 생성 및 저장
+            filename = self._get_analysis_filename(result.analyzed_at)
+            filepath = os.path.join(game_dir, filename)
+            
+            # orjson은 UTF-8 바이트를 바로 생성 (json.dump(ensure_ascii=False, indent=2)와 동일한 형식)
+            # mtime=0으로 같은 결과는 항상 같은 압축 바이트가 되도록 함
+            data = orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2)
+            with open(filepath, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=ANALYSIS_COMPRESS_LEVEL, mtime=0))
+            
+            # 같은 분석 시간의 이전 비압축 파일은 새 파일로 대체
+            legacy_path = filepath[:-len(ANALYSIS_FILE_SUFFIX)] + LEGACY_ANALYSIS_FILE_SUFFIX
+            if os.path.exists(legacy_path):
+                os.remove(legacy_path)
+            
+            filepaths.append(filepath)
         
-        return filepath
+        self._summary_cache.cache_clear()
+        return filepaths
     
     def load_analysis(self, filepath: str) -> Optional[GameAnalysisResult]:
         """분석 결과 로드
@@ -97,10 +167,14 @@ class AnalysisDataStore:
             return None
         
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if filepath.endswith(".gz"):
+                with gzip.open(filepath, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, "rb") as f:
+                    data = orjson.loads(f.read())
             return GameAnalysisResult.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (orjson.JSONDecodeError, gzip.BadGzipFile, EOFError, KeyError, ValueError):
             return None
     
     def get_latest_analysis(self, game_id: str) -> Optional[GameAnalysisResult]:
@@ -115,23 +189,13 @@ class AnalysisDataStore:
         Returns:
             최신 분석 결과. 없으면 None
         """
-        game_dir = self._get_game_dir(game_id)
-        
-        if not os.path.exists(game_dir):
-            return None
-        
-        # 분석 파일 목록 조회 (analysis_*.json 패턴)
-        pattern = os.path.join(game_dir, "analysis_*.json")
-        files = glob.glob(pattern)
+        # 분석 파일 목록 조회 (파일명 기준 정렬, 최신 파일이 마지막)
+        files = self.list_analyses(game_id)
         
         if not files:
             return None
         
-        # 파일명 기준 정렬 (최신 파일이 마지막)
-        files.sort()
-        latest_file = files[-1]
-        
-        return self.load_analysis(latest_file)
+        return self.load_analysis(files[-1])
     
     def list_analyses(self, game_id: str) -> List[str]:
         """게임별 분석 결과 파일 목록 조회
@@ -142,16 +206,7 @@ class AnalysisDataStore:
         Returns:
             분석 결과 파일 경로 목록 (시간순 정렬)
         """
-        game_dir = self._get_game_dir(game_id)
-        
-        if not os.path.exists(game_dir):
-            return []
-        
-        pattern = os.path.join(game_dir, "analysis_*.json")
-        files = glob.glob(pattern)
-        files.sort()
-        
-        return files
+        return self._scan_analysis_files(self._get_game_dir(game_id))
     
     def get_all_game_ids(self) -> List[str]:
         """저장된 모든 게임 ID 목록 조회
@@ -159,17 +214,21 @@ class AnalysisDataStore:
         Returns:
             게임 ID 목록
         """
-        if not os.path.exists(self.base_dir):
+        try:
+            with os.scandir(self.base_dir) as entries:
+                game_dirs = [entry for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
             return []
         
         game_ids = []
-        for item in os.listdir(self.base_dir):
-            item_path = os.path.join(self.base_dir, item)
-            if os.path.isdir(item_path):
-                # 해당 디렉토리에 분석 파일이 있는지 확인
-                pattern = os.path.join(item_path, "analysis_*.json")
-                if glob.glob(pattern):
-                    game_ids.append(item)
+        for game_dir in game_dirs:
+            # 해당 디렉토리에 분석 파일이 있는지 확인 (첫 파일을 찾으면 중단)
+            try:
+                with os.scandir(game_dir.path) as entries:
+                    if any(self._is_analysis_entry(entry) for entry in entries):
+                        game_ids.append(game_dir.name)
+            except FileNotFoundError:
+                continue
         
         return sorted(game_ids)
     
@@ -184,6 +243,7 @@ class AnalysisDataStore:
         """
         if os.path.exists(filepath):
             os.remove(filepath)
+            self._summary_cache.cache_clear()
             return True
         return False
     
@@ -213,21 +273,57 @@ class AnalysisDataStore:
     def get_analysis_summary(self, game_id: str) -> Optional[Dict]:
         """게임별 분석 요약 정보 조회
         
+        최신 분석 파일과 파일 수가 바뀌지 않았으면 캐시된 요약을 반환한다.
+        
         Args:
             game_id: 게임 ID
             
         Returns:
             분석 요약 정보 딕셔너리. 없으면 None
         """
-        latest = self.get_latest_analysis(game_id)
-        if not latest:
+        files = self.list_analyses(game_id)
+        if not files:
             return None
         
-        files = self.list_analyses(game_id)
+        latest_file = files[-1]
+        try:
+            stat = os.stat(latest_file)
+        except OSError:
+            return None
+        
+        summary = self._summary_cache(
+            game_id, latest_file, stat.st_mtime_ns, stat.st_size, len(files)
+        )
+        # 캐시된 딕셔너리가 호출자에 의해 변경되지 않도록 복사본 반환
+        return dict(summary) if summary else None
+    
+    def _compute_summary(
+        self,
+        game_id: str,
+        latest_file: str,
+        mtime_ns: int,
+        size: int,
+        total_analyses: int
+    ) -> Optional[Dict]:
+        """분석 요약 정보 계산 (mtime_ns, size는 캐시 키로만 사용)
+        
+        Args:
+            game_id: 게임 ID
+            latest_file: 최신 분석 결과 파일 경로
+            mtime_ns: 최신 파일 수정 시각 (나노초)
+            size: 최신 파일 크기
+            total_analyses: 분석 결과 파일 수
+            
+        Returns:
+            분석 요약 정보 딕셔너리. 로드 실패 시 None
+        """
+        latest = self.load_analysis(latest_file)
+        if not latest:
+            return None
         
         return {
             "game_id": game_id,
-            "total_analyses": len(files),
+            "total_analyses": total_analyses,
             "latest_analyzed_at": latest.analyzed_at.isoformat(),
             "total_posts": latest.total_posts,
             "total_comments": latest.total_comments,
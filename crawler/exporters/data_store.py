@@ -8,11 +8,12 @@ Requirements: 6.1, 6.3
 """
 
 import os
-import json
 from datetime import datetime
 from typing import List, Dict, Optional
 from collections import defaultdict
 
+import orjson
+
 from crawler.models.data_models import PostContent, CrawlerConfig
 
 
@@ -127,9 +128,10 @@ class DataStore:
             filename = f"{base_filename}_{date_key}.json"
             filepath = os.path.join(self.output_dir, filename)
             
+            # 전체를 바이트로 직렬화한 뒤 한 번에 기록 (작은 write 호출 반복 방지)
             data = [post.to_dict() for post in posts]
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
             saved_files[date_key] = filepath
         
@@ -147,8 +149,8 @@ class DataStore:
         Returns:
             로드된 게시글 목록
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
         
         posts = [PostContent.from_dict(item) for item in data]
         return posts
@@ -31,7 +31,7 @@ class IssueSeverity(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentResult:
     """감성 분석 결과
     
@@ -70,7 +70,7 @@ class SentimentResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordCluster:
     """키워드 클러스터
     
@@ -108,7 +108,7 @@ class KeywordCluster:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedIssue:
     """탐지된 이슈
     
@@ -161,7 +161,7 @@ class DetectedIssue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendPoint:
     """트렌드 데이터 포인트
     
@@ -190,7 +190,7 @@ class TrendPoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendData:
     """트렌드 데이터
     
@@ -219,7 +219,7 @@ class TrendData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HotPost:
     """핫 게시글
     
@@ -280,7 +280,7 @@ class HotPost:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameAnalysisResult:
     """게임 분석 결과
     
@@ -315,7 +315,21 @@ class GameAnalysisResult:
     
     @classmethod
     def from_dict(cls, data: dict) -> "GameAnalysisResult":
-        """딕셔너리에서 객체 생성"""
+        """딕셔너리에서 객체 생성
+        
+        hot_issues, bug_issues는 issues의 이슈를 중복 포함하므로,
+        내용이 같은 이슈 딕셔너리는 한 번만 변환하고 같은 객체를 공유한다.
+        """
+        parsed: Dict[str, tuple] = {}  # issue_id -> (원본 딕셔너리, DetectedIssue)
+        
+        def to_issue(item: dict) -> DetectedIssue:
+            cached = parsed.get(item.get("issue_id"))
+            if cached is not None and cached[0] == item:
+                return cached[1]
+            issue = DetectedIssue.from_dict(item)
+            parsed[item.get("issue_id")] = (item, issue)
+            return issue
+        
         return cls(
             game_id=data["game_id"],
             analyzed_at=datetime.fromisoformat(data["analyzed_at"]),
@@ -323,8 +337,8 @@ class GameAnalysisResult:
             total_comments=data["total_comments"],
             sentiment_distribution=data["sentiment_distribution"],
             sentiment_avg=data["sentiment_avg"],
-            issues=[DetectedIssue.from_dict(i) for i in data.get("issues", [])],
-            hot_issues=[DetectedIssue.from_dict(i) for i in data.get("hot_issues", [])],
-            bug_issues=[DetectedIssue.from_dict(i) for i in data.get("bug_issues", [])],
+            issues=[to_issue(i) for i in data.get("issues", [])],
+            hot_issues=[to_issue(i) for i in data.get("hot_issues", [])],
+            bug_issues=[to_issue(i) for i in data.get("bug_issues", [])],
             sentiment_trend=TrendData.from_dict(data["sentiment_trend"]) if data.get("sentiment_trend") else None
         )
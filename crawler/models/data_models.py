@@ -155,6 +155,7 @@ class CrawlerConfig:
     - 관련성 임계값, 최대 댓글 페이지 수
     - 캐시 TTL, Jitter 범위
     - Google API 설정
+    - robots.txt 준수 여부
     """
     output_dir: str = "data"
     default_delay: float = 3.0
@@ -165,6 +166,7 @@ class CrawlerConfig:
     jitter_range: Tuple[float, float] = (0.5, 2.0)
     google_api_key: Optional[str] = None
     google_cse_id: Optional[str] = None
+    respect_robots_txt: bool = False
     
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -177,7 +179,8 @@ class CrawlerConfig:
             "cache_ttl": self.cache_ttl,
             "jitter_range": list(self.jitter_range),
             "google_api_key": self.google_api_key,
-            "google_cse_id": self.google_cse_id
+            "google_cse_id": self.google_cse_id,
+            "respect_robots_txt": self.respect_robots_txt
         }
     
     @classmethod
@@ -193,5 +196,6 @@ class CrawlerConfig:
             cache_ttl=data.get("cache_ttl", 3600),
             jitter_range=jitter_range,
             google_api_key=data.get("google_api_key"),
-            google_cse_id=data.get("google_cse_id")
+            google_cse_id=data.get("google_cse_id"),
+            respect_robots_txt=data.get("respect_robots_txt", False)
         )
@@ -11,9 +11,12 @@ Requirements: 1.1, 1.2, 2.1, 3.1, 4.1, 5.1, 6.1
 
 import logging
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+from urllib.parse import urlparse
 
 from crawler.models.data_models import (
     CrawlerConfig, 
@@ -31,6 +34,8 @@ from crawler.utils.url_deduplicator import deduplicate_urls
 
 logger = logging.getLogger(__name__)
 
+MAX_CRAWL_WORKERS = 16  # 사이트(도메인) 병렬 처리 최대 스레드 수
+
 
 @dataclass
 class CrawlResult:
@@ -42,6 +47,7 @@ class CrawlResult:
     total_searched: int = 0
     total_crawled: int = 0
     total_failed: int = 0
+    total_comments: int = 0  # 수집한 게시글의 댓글 수 합계
     keywords_used: List[str] = field(default_factory=list)
     sites_crawled: List[str] = field(default_factory=list)
     started_at: Optional[datetime] = None
@@ -70,6 +76,7 @@ class CrawlResult:
             "total_searched": self.total_searched,
             "total_crawled": self.total_crawled,
             "total_failed": self.total_failed,
+            "total_comments": self.total_comments,
             "success_rate": self.success_rate,
             "keywords_used": self.keywords_used,
             "sites_crawled": self.sites_crawled,
@@ -173,11 +180,14 @@ class CrawlerOrchestrator:
         save_results: bool = True,
         output_format: str = "json",
         game_id: Optional[str] = None,
-        auto_analyze: bool = False
+        auto_analyze: bool = False,
+        parallel: bool = True
     ) -> CrawlResult:
         """크롤링 수행
         
         키워드와 사이트 목록을 받아 전체 크롤링 프로세스를 수행한다.
+        검색은 사이트 순서대로 순차 수행하고, parallel이면 게시글 크롤링을 도메인별 스레드로 나눈다.
+        같은 도메인은 하나의 스레드에서 순차 처리하여 Rate limiting을 유지한다.
         
         Requirements: 1.1, 1.2, 2.1, 3.1, 4.1, 5.1, 6.1
         
@@ -189,6 +199,7 @@ class CrawlerOrchestrator:
             output_format: 출력 형식 ("json" 또는 "csv")
             game_id: 게임 ID (게임별 저장 경로 사용 시)
             auto_analyze: 크롤링 후 자동 분석 수행 여부
+            parallel: 도메인별 병렬 크롤링 여부
             
         Returns:
             CrawlResult: 크롤링 결과
@@ -214,29 +225,21 @@ class CrawlerOrchestrator:
             unique_urls = deduplicate_urls([r.url for r in all_search_results])
             logger.info(f"중복 제거 후: {len(unique_urls)}개 URL")
             
-            # URL과 SearchResult 매핑
-            url_to_result = {r.url: r for r in all_search_results}
-            
             # 3. 콘텐츠 크롤링
-            for url in unique_urls:
-                search_result = url_to_result.get(url)
-                keyword = keywords[0] if keywords else ""
-                
-                try:
-                    post = self.content_crawler.crawl_post(url, keyword)
-                    
-                    if post:
-                        self.data_store.add_post(post)
-                        result.posts.append(post)
-                        result.total_crawled += 1
-                        logger.debug(f"크롤링 성공: {url}")
-                    else:
-                        result.total_failed += 1
-                        result.errors.append(f"크롤링 실패: {url}")
-                        
-                except Exception as e:
+            keyword = keywords[0] if keywords else ""
+            for url, post, error in self._crawl_all_urls(unique_urls, keyword, parallel):
+                if post:
+                    self.data_store.add_post(post)
+                    result.posts.append(post)
+                    result.total_crawled += 1
+                    result.total_comments += len(post.comments)
+                    logger.debug(f"크롤링 성공: {url}")
+                elif error is None:
+                    result.total_failed += 1
+                    result.errors.append(f"크롤링 실패: {url}")
+                else:
                     result.total_failed += 1
-                    error_msg = f"크롤링 에러: {url} - {str(e)}"
+                    error_msg = f"크롤링 에러: {url} - {str(error)}"
                     result.errors.append(error_msg)
                     logger.error(error_msg)
             
@@ -278,6 +281,8 @@ class CrawlerOrchestrator:
     ) -> List[SearchResult]:
         """모든 사이트에서 검색 수행
         
+        검색 어댑터는 사이트와 관계없이 같은 검색 엔진에 요청하므로 사이트를 순차로 검색한다.
+        
         Args:
             keywords: 검색 키워드 목록
             sites: 대상 사이트 목록
@@ -303,6 +308,48 @@ class CrawlerOrchestrator:
         
         return all_results
     
+    def _crawl_all_urls(
+        self,
+        urls: List[str],
+        keyword: str,
+        parallel: bool = True
+    ) -> List[tuple]:
+        """URL 목록의 게시글 크롤링
+        
+        도메인별로 URL을 묶어 도메인 단위로 병렬 처리한다.
+        같은 도메인의 URL은 한 스레드에서 순차로 요청하므로 도메인별 요청 간격이 유지된다.
+        
+        Args:
+            urls: 크롤링할 URL 목록
+            keyword: 검색 키워드
+            parallel: 도메인별 병렬 크롤링 여부
+            
+        Returns:
+            입력 순서대로 (URL, PostContent 또는 None, 예외 또는 None) 튜플 목록
+        """
+        def crawl_one(url: str) -> tuple:
+            try:
+                return (url, self.content_crawler.crawl_post(url, keyword), None)
+            except Exception as e:
+                return (url, None, e)
+        
+        by_domain: Dict[str, List[int]] = defaultdict(list)
+        for i, url in enumerate(urls):
+            by_domain[urlparse(url).netloc].append(i)
+        
+        if not parallel or len(by_domain) < 2:
+            return [crawl_one(url) for url in urls]
+        
+        def crawl_domain(indices: List[int]) -> List[tuple]:
+            return [(i, crawl_one(urls[i])) for i in indices]
+        
+        outcomes: List[tuple] = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=min(MAX_CRAWL_WORKERS, len(by_domain))) as executor:
+            for domain_outcomes in executor.map(crawl_domain, by_domain.values()):
+                for i, outcome in domain_outcomes:
+                    outcomes[i] = outcome
+        return outcomes
+    
     def _save_results(
         self, 
         posts: List[PostContent], 
@@ -398,6 +445,7 @@ class CrawlerOrchestrator:
                     self.data_store.add_post(post)
                     result.posts.append(post)
                     result.total_crawled += 1
+                    result.total_comments += len(post.comments)
                     
                     # 사이트 목록 업데이트
                     if post.site and post.site not in result.sites_crawled:
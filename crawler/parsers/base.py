@@ -4,12 +4,16 @@ ContentParser 추상 클래스 및 ParserRegistry 구현
 Requirements: 4.1, 4.2
 - ContentParser ABC: 사이트별 파서의 기본 인터페이스
 - ParserRegistry: 도메인별 파서 등록 및 조회
+- CommentContainers: 댓글 영역만 파싱하는 BeautifulSoup 생성
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
+from bs4 import BeautifulSoup, SoupStrainer
+
 from crawler.models.data_models import PostContent, Comment
 
 
@@ -58,6 +62,44 @@ class ContentParser(ABC):
         pass
 
 
+class CommentContainers:
+    """댓글 컨테이너만 파싱하는 BeautifulSoup 생성기
+    
+    클래스로 식별되는 댓글 컨테이너는 SoupStrainer로 걸러 본문/네비게이션 등을 트리로 만들지 않는다.
+    여러 클래스를 가진 요소도 일치하도록 클래스 속성 전체에 공백 경계 정규식을 적용한다.
+    SoupStrainer는 클래스 조건과 id 조건을 OR로 묶을 수 없으므로,
+    id로만 식별되는 컨테이너가 HTML에 있으면 전체 문서를 파싱한다.
+    """
+    
+    def __init__(self, classes: Iterable[str], ids: Iterable[str] = ()):
+        """
+        Args:
+            classes: 댓글 컨테이너 클래스 목록
+            ids: id로만 식별되는 댓글 컨테이너 id 목록
+        """
+        class_names = '|'.join(map(re.escape, classes))
+        self.strainer = SoupStrainer(class_=re.compile(rf'(?:^|\s)(?:{class_names})(?:\s|$)'))
+        
+        id_names = '|'.join(map(re.escape, ids))
+        self.id_pattern = (
+            re.compile(rf'id\s*=\s*["\']?(?:{id_names})(?=["\'\s/>])', re.IGNORECASE)
+            if id_names else None
+        )
+    
+    def make_soup(self, html: str) -> BeautifulSoup:
+        """댓글 파싱용 BeautifulSoup 생성
+        
+        Args:
+            html: HTML 문자열
+            
+        Returns:
+            댓글 컨테이너만 담은 BeautifulSoup (id 컨테이너가 있으면 전체 문서)
+        """
+        if self.id_pattern is not None and self.id_pattern.search(html):
+            return BeautifulSoup(html, 'lxml')
+        return BeautifulSoup(html, 'lxml', parse_only=self.strainer)
+
+
 class ParserRegistry:
     """파서 레지스트리
     
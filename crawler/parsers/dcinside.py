@@ -13,10 +13,17 @@ from typing import List, Optional
 
 from bs4 import BeautifulSoup
 
-from crawler.parsers.base import ContentParser
+from crawler.parsers.base import CommentContainers, ContentParser
 from crawler.models.data_models import PostContent, Comment
 
 
+# 디시인사이드 댓글 영역 컨테이너 (클래스, id)
+COMMENT_CONTAINERS = CommentContainers(
+    classes=('reply_list', 'comment_list', 'cmt_list', 'reply_box'),
+    ids=('comment_list',)
+)
+
+
 class DCInsideParser(ContentParser):
     """디시인사이드(dcinside.com) 전용 파서
     
@@ -88,7 +95,7 @@ class DCInsideParser(ContentParser):
         Returns:
             List[Comment]: 파싱된 댓글 목록
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = COMMENT_CONTAINERS.make_soup(html)
         comments = []
         
         # 디시인사이드 댓글 영역 선택자들
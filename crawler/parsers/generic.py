@@ -85,6 +85,9 @@ class GenericParser(ContentParser):
         # 제목 추출
         title = self._extract_title(soup)
         
+        # 댓글 추출 (같은 트리 재사용, 본문 추출이 태그를 제거하기 전에 수행)
+        comments = self._parse_comments_from_soup(soup)
+        
         # 본문 추출
         body = self._extract_body(soup)
         
@@ -98,9 +101,6 @@ class GenericParser(ContentParser):
         view_count = self._extract_count(soup, ['view', 'hit', '조회'])
         like_count = self._extract_count(soup, ['like', 'recommend', '추천', '좋아요'])
         
-        # 댓글 추출
-        comments = self.parse_comments(html)
-        
         return PostContent(
             url=url,
             title=title,
@@ -123,7 +123,17 @@ class GenericParser(ContentParser):
         Returns:
             List[Comment]: 파싱된 댓글 목록
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self._parse_comments_from_soup(BeautifulSoup(html, 'lxml'))
+    
+    def _parse_comments_from_soup(self, soup: BeautifulSoup) -> List[Comment]:
+        """파싱된 트리에서 댓글 추출 (트리를 변경하지 않음)
+        
+        Args:
+            soup: 파싱된 HTML 트리
+            
+        Returns:
+            List[Comment]: 파싱된 댓글 목록
+        """
         comments = []
         
         # 댓글 영역 찾기
@@ -13,10 +13,17 @@ from typing import List, Optional
 
 from bs4 import BeautifulSoup
 
-from crawler.parsers.base import ContentParser
+from crawler.parsers.base import CommentContainers, ContentParser
 from crawler.models.data_models import PostContent, Comment
 
 
+# 인벤 댓글 영역 컨테이너 (클래스, id)
+COMMENT_CONTAINERS = CommentContainers(
+    classes=('comment-list', 'commentList', 'reply-list', 'cmtList'),
+    ids=('comment-list',)
+)
+
+
 class InvenParser(ContentParser):
     """인벤(inven.co.kr) 전용 파서
     
@@ -87,7 +94,7 @@ class InvenParser(ContentParser):
         Returns:
             List[Comment]: 파싱된 댓글 목록
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = COMMENT_CONTAINERS.make_soup(html)
         comments = []
         
         # 인벤 댓글 영역 선택자들
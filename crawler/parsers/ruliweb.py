@@ -11,12 +11,110 @@ import re
 from datetime import datetime
 from typing import List, Optional
 
+import soupsieve
 from bs4 import BeautifulSoup
 
-from crawler.parsers.base import ContentParser
+from crawler.parsers.base import CommentContainers, ContentParser
 from crawler.models.data_models import PostContent, Comment
 
 
+# 루리웹 댓글 영역 컨테이너 (클래스, id)
+COMMENT_CONTAINERS = CommentContainers(
+    classes=('comment_view', 'comment_list', 'reply_list', 'board_comment'),
+    ids=('comment',)
+)
+
+
+def _compile_selectors(selectors: List[str]) -> tuple:
+    """선택자 목록을 (그룹 선택자, 우선순위별 개별 선택자 목록)으로 컴파일"""
+    return (
+        soupsieve.compile(', '.join(selectors)),
+        [soupsieve.compile(selector) for selector in selectors]
+    )
+
+
+def _select_in_priority(tag, compiled: tuple):
+    """그룹 선택자로 트리를 한 번만 탐색한 뒤 선택자 우선순위 순으로 일치 요소 목록 반환
+
+    선택자마다 soup.select()를 반복 호출한 것과 같은 결과를 선택자 순서대로 내보낸다.
+    일치하는 요소가 없는 선택자는 건너뛴다.
+    """
+    group, selectors = compiled
+    matches = group.select(tag)
+    if not matches:
+        return
+    for selector in selectors:
+        found = [element for element in matches if selector.match(element)]
+        if found:
+            yield found
+
+
+def _select_one_in_priority(tag, compiled: tuple):
+    """선택자 우선순위 순으로 선택자별 첫 번째 일치 요소 반환 (select_one 반복과 동일)"""
+    for found in _select_in_priority(tag, compiled):
+        yield found[0]
+
+
+# 게시글 영역 선택자 (우선순위 순, 모듈 로드 시 한 번만 컴파일)
+TITLE_SELECTORS = _compile_selectors([
+    '.board_main .subject_text',
+    '.board_main_top .subject',
+    '.view_title .subject',
+    'h1.subject',
+    '.article_title',
+    '.subject_inner_text'
+])
+BODY_SELECTORS = _compile_selectors([
+    '.board_main .view_content',
+    '.board_main_view .content',
+    '.article_content',
+    '.view_content',
+    '#content .content',
+    '.source_url + div'
+])
+AUTHOR_SELECTORS = _compile_selectors([
+    '.board_main .user_info .nick',
+    '.board_main_top .nick',
+    '.user_view .nick',
+    '.writer .nick',
+    '.nickname'
+])
+DATE_SELECTORS = _compile_selectors([
+    '.board_main .regdate',
+    '.board_main_top .regdate',
+    '.user_view .regdate',
+    '.article_info .date',
+    'time.date'
+])
+VIEW_SELECTORS = _compile_selectors([
+    '.board_main .hit',
+    '.board_main_top .hit',
+    '.article_info .hit',
+    '.view_count',
+    '.read_count'
+])
+LIKE_SELECTORS = _compile_selectors([
+    '.board_main .like',
+    '.recommend_btn .like_value',
+    '.article_info .recommend',
+    '.like_count',
+    '.vote_up'
+])
+
+# 댓글 영역 선택자
+COMMENT_SELECTORS = _compile_selectors([
+    '.comment_view .comment_element',
+    '.comment_list .comment_item',
+    '.reply_list .reply_item',
+    '#comment .comment_element',
+    '.board_comment .comment'
+])
+COMMENT_AUTHOR_SELECTORS = _compile_selectors(['.nick', '.nickname', '.writer', '.author', '.user_info'])
+COMMENT_CONTENT_SELECTORS = _compile_selectors(['.text', '.content', '.comment_content', '.reply_content', '.comment_text'])
+COMMENT_DATE_SELECTORS = _compile_selectors(['.date', '.time', 'time', '.regdate', '.comment_date'])
+COMMENT_LIKE_SELECTORS = _compile_selectors(['.like', '.recommend', '.vote', '.good', '.like_count'])
+
+
 class RuliwebParser(ContentParser):
     """루리웹(ruliweb.com) 전용 파서
     
@@ -88,23 +186,11 @@ class RuliwebParser(ContentParser):
         Returns:
             List[Comment]: 파싱된 댓글 목록
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = COMMENT_CONTAINERS.make_soup(html)
         comments = []
         
-        # 루리웹 댓글 영역 선택자들
-        comment_selectors = [
-            '.comment_view .comment_element',
-            '.comment_list .comment_item',
-            '.reply_list .reply_item',
-            '#comment .comment_element',
-            '.board_comment .comment'
-        ]
-        
-        comment_items = []
-        for selector in comment_selectors:
-            comment_items = soup.select(selector)
-            if comment_items:
-                break
+        # 루리웹 댓글 영역 선택자 중 처음 일치하는 선택자의 댓글 목록 사용
+        comment_items = next(_select_in_priority(soup, COMMENT_SELECTORS), [])
         
         for item in comment_items:
             comment = self._parse_comment_item(item)
@@ -119,22 +205,10 @@ class RuliwebParser(ContentParser):
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """제목 추출"""
-        # 루리웹 제목 선택자들
-        title_selectors = [
-            '.board_main .subject_text',
-            '.board_main_top .subject',
-            '.view_title .subject',
-            'h1.subject',
-            '.article_title',
-            '.subject_inner_text'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                if text:
-                    return text
+        for element in _select_one_in_priority(soup, TITLE_SELECTORS):
+            text = element.get_text(strip=True)
+            if text:
+                return text
         
         # 폴백: h1 태그
         h1 = soup.find('h1')
@@ -149,68 +223,36 @@ class RuliwebParser(ContentParser):
         for tag in soup.find_all(['script', 'style']):
             tag.decompose()
         
-        # 루리웹 본문 선택자들
-        body_selectors = [
-            '.board_main .view_content',
-            '.board_main_view .content',
-            '.article_content',
-            '.view_content',
-            '#content .content',
-            '.source_url + div'
-        ]
-        
-        for selector in body_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(separator='\n', strip=True)
-                if len(text) > 10:
-                    return self._clean_text(text)
+        for element in _select_one_in_priority(soup, BODY_SELECTORS):
+            text = element.get_text(separator='\n', strip=True)
+            if len(text) > 10:
+                return self._clean_text(text)
         
         return ""
     
     def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """작성자 추출"""
-        author_selectors = [
-            '.board_main .user_info .nick',
-            '.board_main_top .nick',
-            '.user_view .nick',
-            '.writer .nick',
-            '.nickname'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                if text:
-                    return text
+        for element in _select_one_in_priority(soup, AUTHOR_SELECTORS):
+            text = element.get_text(strip=True)
+            if text:
+                return text
         
         return None
     
     def _extract_date(self, soup: BeautifulSoup) -> Optional[datetime]:
         """날짜 추출"""
-        date_selectors = [
-            '.board_main .regdate',
-            '.board_main_top .regdate',
-            '.user_view .regdate',
-            '.article_info .date',
-            'time.date'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                # datetime 속성 확인
-                if element.has_attr('datetime'):
-                    try:
-                        return datetime.fromisoformat(element['datetime'].replace('Z', '+00:00'))
-                    except (ValueError, TypeError):
-                        pass
-                
-                text = element.get_text(strip=True)
-                parsed = self._parse_date_string(text)
-                if parsed:
-                    return parsed
+        for element in _select_one_in_priority(soup, DATE_SELECTORS):
+            # datetime 속성 확인
+            if element.has_attr('datetime'):
+                try:
+                    return datetime.fromisoformat(element['datetime'].replace('Z', '+00:00'))
+                except (ValueError, TypeError):
+                    pass
+            
+            text = element.get_text(strip=True)
+            parsed = self._parse_date_string(text)
+            if parsed:
+                return parsed
         
         return None
     
@@ -248,21 +290,11 @@ class RuliwebParser(ContentParser):
     
     def _extract_view_count(self, soup: BeautifulSoup) -> int:
         """조회수 추출"""
-        view_selectors = [
-            '.board_main .hit',
-            '.board_main_top .hit',
-            '.article_info .hit',
-            '.view_count',
-            '.read_count'
-        ]
-        
-        for selector in view_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                numbers = re.findall(r'[\d,]+', text)
-                if numbers:
-                    return int(numbers[0].replace(',', ''))
+        for element in _select_one_in_priority(soup, VIEW_SELECTORS):
+            text = element.get_text(strip=True)
+            numbers = re.findall(r'[\d,]+', text)
+            if numbers:
+                return int(numbers[0].replace(',', ''))
         
         # 텍스트에서 조회수 패턴 찾기
         text = soup.get_text()
@@ -274,21 +306,11 @@ class RuliwebParser(ContentParser):
     
     def _extract_like_count(self, soup: BeautifulSoup) -> int:
         """추천수 추출"""
-        like_selectors = [
-            '.board_main .like',
-            '.recommend_btn .like_value',
-            '.article_info .recommend',
-            '.like_count',
-            '.vote_up'
-        ]
-        
-        for selector in like_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                numbers = re.findall(r'[\d,]+', text)
-                if numbers:
-                    return int(numbers[0].replace(',', ''))
+        for element in _select_one_in_priority(soup, LIKE_SELECTORS):
+            text = element.get_text(strip=True)
+            numbers = re.findall(r'[\d,]+', text)
+            if numbers:
+                return int(numbers[0].replace(',', ''))
         
         # 텍스트에서 추천 패턴 찾기
         text = soup.get_text()
@@ -302,24 +324,18 @@ class RuliwebParser(ContentParser):
         """개별 댓글 아이템 파싱"""
         # 작성자 추출
         author = ""
-        author_selectors = ['.nick', '.nickname', '.writer', '.author', '.user_info']
-        for selector in author_selectors:
-            author_elem = item.select_one(selector)
-            if author_elem:
-                author = author_elem.get_text(strip=True)
-                break
+        author_elem = next(_select_one_in_priority(item, COMMENT_AUTHOR_SELECTORS), None)
+        if author_elem:
+            author = author_elem.get_text(strip=True)
         
         if not author:
             author = "익명"
         
         # 내용 추출
         content = ""
-        content_selectors = ['.text', '.content', '.comment_content', '.reply_content', '.comment_text']
-        for selector in content_selectors:
-            content_elem = item.select_one(selector)
-            if content_elem:
-                content = content_elem.get_text(strip=True)
-                break
+        content_elem = next(_select_one_in_priority(item, COMMENT_CONTENT_SELECTORS), None)
+        if content_elem:
+            content = content_elem.get_text(strip=True)
         
         if not content:
             # 전체 텍스트에서 추출
@@ -332,29 +348,23 @@ class RuliwebParser(ContentParser):
         
         # 날짜 추출
         created_at = None
-        date_selectors = ['.date', '.time', 'time', '.regdate', '.comment_date']
-        for selector in date_selectors:
-            date_elem = item.select_one(selector)
-            if date_elem:
-                if date_elem.has_attr('datetime'):
-                    try:
-                        created_at = datetime.fromisoformat(date_elem['datetime'].replace('Z', '+00:00'))
-                    except (ValueError, TypeError):
-                        pass
-                else:
-                    created_at = self._parse_date_string(date_elem.get_text(strip=True))
-                break
+        date_elem = next(_select_one_in_priority(item, COMMENT_DATE_SELECTORS), None)
+        if date_elem:
+            if date_elem.has_attr('datetime'):
+                try:
+                    created_at = datetime.fromisoformat(date_elem['datetime'].replace('Z', '+00:00'))
+                except (ValueError, TypeError):
+                    pass
+            else:
+                created_at = self._parse_date_string(date_elem.get_text(strip=True))
         
         # 추천수 추출
         like_count = 0
-        like_selectors = ['.like', '.recommend', '.vote', '.good', '.like_count']
-        for selector in like_selectors:
-            like_elem = item.select_one(selector)
-            if like_elem:
-                numbers = re.findall(r'\d+', like_elem.get_text(strip=True))
-                if numbers:
-                    like_count = int(numbers[0])
-                break
+        like_elem = next(_select_one_in_priority(item, COMMENT_LIKE_SELECTORS), None)
+        if like_elem:
+            numbers = re.findall(r'\d+', like_elem.get_text(strip=True))
+            if numbers:
+                like_count = int(numbers[0])
         
         return Comment(
             author=author,
@@ -333,7 +333,7 @@ class DirectCrawlAdapter(SearchAdapter):
             response = requests.get(board_url, headers=headers, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
             
             # 사이트별 게시글 목록 파싱
             posts = self._parse_board_list(soup, site, board_url)
@@ -3,7 +3,8 @@
 
 from crawler.utils.relevance_filter import RelevanceFilter
 from crawler.utils.url_deduplicator import deduplicate_urls, deduplicate_search_results, normalize_url
-from crawler.utils.rate_limiter import RateLimiter
+from crawler.utils.rate_limiter import RateLimiter, extract_domain
+from crawler.utils.robots import fetch_robots_parser
 
 __all__ = [
     "RelevanceFilter",
@@ -11,6 +12,8 @@ __all__ = [
     "deduplicate_search_results",
     "normalize_url",
     "RateLimiter",
+    "extract_domain",
+    "fetch_robots_parser",
 ]
 
 # Lazy import to avoid circular dependency
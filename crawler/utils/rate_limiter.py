@@ -11,7 +11,8 @@ import time
 import random
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from crawler.models.data_models import CrawlerConfig
@@ -19,6 +20,21 @@ from crawler.models.data_models import CrawlerConfig
 
 logger = logging.getLogger(__name__)
 
+DOMAIN_CACHE_SIZE = 4096  # URL -> 도메인 변환 캐시 최대 항목 수
+
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def extract_domain(url: str) -> str:
+    """URL에서 도메인(netloc) 추출 (URL별 캐시)
+    
+    Args:
+        url: URL 문자열
+        
+    Returns:
+        도메인 문자열
+    """
+    return urlparse(url).netloc
+
 
 class RateLimiter:
     """도메인별 요청 속도 제어 및 지수 백오프 처리
@@ -54,8 +70,8 @@ class RateLimiter:
         self._last_request_time: Dict[str, float] = {}
         # 도메인별 현재 재시도 횟수
         self._retry_counts: Dict[str, int] = {}
-        # 도메인별 일시 중단 상태
-        self._suspended_domains: Dict[str, bool] = {}
+        # 일시 중단된 도메인 집합
+        self._suspended_domains: Set[str] = set()
     
     def _extract_domain(self, url_or_domain: str) -> str:
         """URL 또는 도메인에서 도메인 추출
@@ -67,8 +83,7 @@ class RateLimiter:
             도메인 문자열
         """
         if url_or_domain.startswith(('http://', 'https://')):
-            parsed = urlparse(url_or_domain)
-            return parsed.netloc
+            return extract_domain(url_or_domain)
         return url_or_domain
     
     def set_domain_delay(self, domain: str, delay: float) -> None:
@@ -176,7 +191,7 @@ class RateLimiter:
         domain = self._extract_domain(domain)
         
         # 도메인이 일시 중단 상태인지 확인
-        if self._suspended_domains.get(domain, False):
+        if domain in self._suspended_domains:
             logger.warning(f"도메인 '{domain}'이 일시 중단 상태입니다.")
             return -1.0
         
@@ -236,7 +251,7 @@ class RateLimiter:
                 f"도메인 '{domain}' 재시도 횟수 초과 ({current_retry}/{self.max_retries}). "
                 "해당 도메인 크롤링을 일시 중단합니다."
             )
-            self._suspended_domains[domain] = True
+            self._suspended_domains.add(domain)
             return (False, 0.0)
         
         # 지수 백오프 계산: 2^(retry_count) 초
@@ -267,6 +282,16 @@ class RateLimiter:
         domain = self._extract_domain(domain)
         self._retry_counts[domain] = 0
     
+    def suspend(self, domain: str) -> None:
+        """도메인 크롤링 일시 중단
+        
+        Args:
+            domain: 도메인 문자열
+        """
+        domain = self._extract_domain(domain)
+        self._suspended_domains.add(domain)
+        logger.info(f"도메인 '{domain}' 크롤링 일시 중단")
+    
     def resume_domain(self, domain: str) -> None:
         """일시 중단된 도메인 재개
         
@@ -274,7 +299,7 @@ class RateLimiter:
             domain: 도메인 문자열
         """
         domain = self._extract_domain(domain)
-        self._suspended_domains[domain] = False
+        self._suspended_domains.discard(domain)
         self._retry_counts[domain] = 0
         logger.info(f"도메인 '{domain}' 크롤링 재개")
     
@@ -288,7 +313,7 @@ class RateLimiter:
             일시 중단 상태 여부
         """
         domain = self._extract_domain(domain)
-        return self._suspended_domains.get(domain, False)
+        return domain in self._suspended_domains
     
     def get_retry_count(self, domain: str) -> int:
         """도메인의 현재 재시도 횟수 반환
@@ -0,0 +1,62 @@
+"""
+robots.txt 확인 유틸리티
+
+- 크롤러 세션으로 robots.txt를 가져올 수 있도록 요청 함수 주입
+- RFC 9309 응답 코드 처리 (4xx는 전체 허용, 5xx는 전체 차단)
+"""
+
+import logging
+from typing import Callable, Optional
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.exceptions import RequestException
+
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_TIMEOUT = 10  # robots.txt 요청 타임아웃 (초)
+
+
+def fetch_robots_parser(
+    robots_url: str,
+    get: Callable[..., requests.Response]
+) -> Optional[RobotFileParser]:
+    """robots.txt를 가져와 파서 생성 (캐시 없음)
+    
+    RFC 9309에 따라 4xx 응답(401/403 포함)은 규칙 없음(전체 허용)으로,
+    5xx 응답은 전체 차단으로 간주한다.
+    요청 자체가 실패한 경우(연결 오류, 타임아웃)는 RFC와 달리 None을 반환하며,
+    호출자는 일시적인 네트워크 오류로 도메인 전체가 막히지 않도록 허용으로 간주한다.
+    
+    Args:
+        robots_url: robots.txt URL
+        get: GET 요청 함수 (url, timeout=...). 크롤러 세션의 요청 함수를 전달
+        
+    Returns:
+        RobotFileParser 또는 None (robots.txt 요청이 실패한 경우)
+    """
+    parser = RobotFileParser(robots_url)
+    
+    try:
+        response = get(robots_url, timeout=ROBOTS_TIMEOUT)
+    except RequestException as e:
+        logger.warning(f"robots.txt 요청 실패: {robots_url} - {e}")
+        return None
+    
+    if response.status_code in (401, 403):
+        logger.warning(
+            f"robots.txt 접근 거부: {robots_url} ({response.status_code}). 규칙 없음으로 간주합니다."
+        )
+        parser.allow_all = True
+    elif 400 <= response.status_code < 500:
+        parser.allow_all = True
+    elif response.status_code >= 500:
+        logger.warning(
+            f"robots.txt 서버 에러: {robots_url} ({response.status_code}). 전체 차단으로 간주합니다."
+        )
+        parser.disallow_all = True
+    else:
+        parser.parse(response.text.splitlines())
+    
+    return parser
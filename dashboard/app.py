@@ -10,10 +10,16 @@ Requirements: 1.2, 2.3, 5.1, 5.2
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
+import orjson
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.serving import is_running_from_reloader
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,38 +29,142 @@ from crawler.analysis.issue_detector import IssueDetector
 from crawler.models.data_models import PostContent, Comment
 from crawler.models.analysis_models import SentimentResult, SentimentLabel
 
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 프로바이더
+    
+    API 응답 직렬화를 orjson으로 처리하고 bytes를 그대로 응답 본문으로 사용한다.
+    키 정렬과 datetime 처리 방식은 Flask 기본 프로바이더와 동일하게 유지한다.
+    """
+    
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def _dumps_bytes(self, obj, indent=False, option=0):
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=self.option | option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, indent=bool(kwargs.get('indent'))).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumps_bytes(obj, indent=indent, option=orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonJSONProvider(app)
 
 # 데이터 디렉토리
 DATA_DIR = Path(__file__).parent.parent / 'data'
 
+# 응답 날짜 형식
+DATE_FORMAT = '%Y-%m-%d'
+
+# 심각도 분포 집계 순서
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+
+
+def get_data_key():
+    """데이터 디렉토리 상태 키 계산
+    
+    JSON 파일의 이름, 수정 시각, 크기로 구성되며 파일이 추가/변경/삭제되면 값이 바뀐다.
+    로드 결과 및 게임별 게시글 캐시의 무효화 기준으로 사용한다.
+    
+    Returns:
+        (데이터 디렉토리 경로, ((파일명, mtime_ns, 크기), ...)) 튜플
+    """
+    files = []
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        pass
+    return (str(DATA_DIR), tuple(files))
+
+
+def normalize_post(post):
+    """게시글 딕셔너리의 수치/댓글 필드 정규화
+    
+    로드 시점에 view_count, like_count(없거나 None이면 0)와 comments(없으면 빈 목록)를
+    한 번 채워 두어, 집계 루프에서 기본값 처리 없이 키로 바로 접근할 수 있게 한다.
+    
+    Args:
+        post: 게시글 딕셔너리
+        
+    Returns:
+        정규화된 게시글 딕셔너리 (같은 객체)
+    """
+    post['view_count'] = post.get('view_count') or 0
+    post['like_count'] = post.get('like_count') or 0
+    post['comments'] = post.get('comments') or []
+    return post
+
 
-def load_crawl_data():
-    """크롤링 결과 데이터 로드"""
+@lru_cache(maxsize=1)
+def _load_crawl_data_cached(data_key):
+    """크롤링 결과 데이터 로드 (data_key가 같으면 이전 결과 재사용)
+    
+    data_key에 기록된 JSON 파일만 읽는다.
+    """
+    data_dir, files = data_key
     all_posts = []
     
     # data 디렉토리의 모든 JSON 파일 읽기
-    if DATA_DIR.exists():
-        for json_file in DATA_DIR.glob('*.json'):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    # 리스트인 경우 (게시글 목록)
-                    if isinstance(data, list):
-                        for post in data:
-                            post['_source_file'] = json_file.name
-                            all_posts.append(post)
-                    # 딕셔너리인 경우 (단일 게시글)
-                    elif isinstance(data, dict) and 'url' in data:
-                        data['_source_file'] = json_file.name
-                        all_posts.append(data)
-            except Exception as e:
-                print(f"파일 로드 실패: {json_file} - {e}")
+    for file_name, _, _ in files:
+        json_file = os.path.join(data_dir, file_name)
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                
+                # 리스트인 경우 (게시글 목록)
+                if isinstance(data, list):
+                    for post in data:
+                        post['_source_file'] = file_name
+                        all_posts.append(normalize_post(post))
+                # 딕셔너리인 경우 (단일 게시글)
+                elif isinstance(data, dict) and 'url' in data:
+                    data['_source_file'] = file_name
+                    all_posts.append(normalize_post(data))
+        except Exception as e:
+            print(f"파일 로드 실패: {json_file} - {e}")
     
     return all_posts
 
 
+def load_crawl_data(data_key=None):
+    """크롤링 결과 데이터 로드
+    
+    데이터 디렉토리가 변경되지 않았다면 캐시된 게시글 목록을 반환한다.
+    반환된 목록과 게시글은 요청 간에 공유되므로 수정하지 않아야 한다.
+    
+    Args:
+        data_key: get_data_key() 결과 (생략 시 새로 계산)
+        
+    Returns:
+        게시글 목록
+    """
+    if data_key is None:
+        data_key = get_data_key()
+    return _load_crawl_data_cached(data_key)
+
+
 def extract_games_from_posts(posts):
     """게시글에서 게임 목록 추출
     
@@ -87,8 +197,8 @@ def extract_games_from_posts(posts):
             game['name'] = keyword
         
         game['post_count'] += 1
-        game['total_views'] += post.get('view_count', 0) or 0
-        game['total_comments'] += len(post.get('comments', []))
+        game['total_views'] += post['view_count']
+        game['total_comments'] += len(post['comments'])
         
         # 사이트 추가
         site = post.get('site', '')
@@ -154,29 +264,35 @@ def get_statistics(posts):
             'dates': {}
         }
     
-    total_comments = sum(len(p.get('comments', [])) for p in posts)
-    total_views = sum(p.get('view_count', 0) for p in posts)
-    total_likes = sum(p.get('like_count', 0) for p in posts)
-    
-    # 사이트별 통계
+    total_comments = 0
+    total_views = 0
+    total_likes = 0
     sites = {}
-    for post in posts:
-        site = post.get('site', 'unknown')
-        if site not in sites:
-            sites[site] = {'count': 0, 'views': 0, 'likes': 0}
-        sites[site]['count'] += 1
-        sites[site]['views'] += post.get('view_count', 0)
-        sites[site]['likes'] += post.get('like_count', 0)
-    
-    # 날짜별 통계
     dates = {}
+    
+    # 합계, 사이트별 통계, 날짜별 통계를 한 번의 순회로 계산
     for post in posts:
-        created_at = post.get('created_at', '')
+        get = post.get
+        view_count = post['view_count']
+        like_count = post['like_count']
+        total_comments += len(post['comments'])
+        total_views += view_count
+        total_likes += like_count
+        
+        # 사이트별 통계
+        site = get('site', 'unknown')
+        site_stats = sites.get(site)
+        if site_stats is None:
+            site_stats = sites[site] = {'count': 0, 'views': 0, 'likes': 0}
+        site_stats['count'] += 1
+        site_stats['views'] += view_count
+        site_stats['likes'] += like_count
+        
+        # 날짜별 통계
+        created_at = get('created_at', '')
         if created_at:
-            date_str = created_at[:10] if len(created_at) >= 10 else created_at
-            if date_str not in dates:
-                dates[date_str] = 0
-            dates[date_str] += 1
+            date_str = created_at[:10]
+            dates[date_str] = dates.get(date_str, 0) + 1
     
     return {
         'total_posts': len(posts),
@@ -200,12 +316,10 @@ def index():
     stats = get_statistics(posts)
     games = get_game_summary_list(posts)
     
-    # 최근 게시글 정렬
-    posts_sorted = sorted(
-        posts, 
-        key=lambda x: x.get('created_at', '') or '', 
-        reverse=True
-    )
+    # 최근 게시글 정렬 (정렬 키를 미리 추출하여 비교마다 dict 조회를 피함)
+    keys = [p.get('created_at') or '' for p in posts]
+    order = sorted(range(len(posts)), key=keys.__getitem__, reverse=True)
+    posts_sorted = [posts[i] for i in order]
     
     return render_template('index.html', posts=posts_sorted, stats=stats, games=games)
 
@@ -282,65 +396,75 @@ def filter_posts_by_game(posts, game_id):
     return result
 
 
-def filter_posts_by_date_range(posts, start_date=None, end_date=None):
-    """기간별 게시글 필터링
+@lru_cache(maxsize=64)
+def get_game_posts(data_key, game_id):
+    """게임별 게시글 목록 조회 (data_key, game_id 단위 캐시)
+    
+    Args:
+        data_key: get_data_key() 결과
+        game_id: 게임 ID (kebab-case)
+        
+    Returns:
+        필터링된 게시글 목록 (요청 간 공유되므로 수정하지 않아야 함)
+    """
+    return filter_posts_by_game(load_crawl_data(data_key), game_id)
+
+
+def filter_posts_combined(posts, start_date='', end_date='', sites=None):
+    """기간 및 사이트 필터를 한 번의 순회로 적용
     
     Requirements: 4.3, 5.5
-    - 특정 기간을 선택하면 해당 기간의 데이터만 필터링
+    - 특정 기간을 선택하면 해당 기간의 데이터만 필터링 (작성일이 없는 게시글 제외)
+    - 특정 사이트의 게시글만 필터링 (대소문자 무시)
     
     Args:
         posts: 게시글 목록
         start_date: 시작일 (YYYY-MM-DD 형식 문자열)
         end_date: 종료일 (YYYY-MM-DD 형식 문자열)
+        sites: 사이트 목록
         
     Returns:
         필터링된 게시글 목록
     """
-    if not start_date and not end_date:
+    filter_dates = bool(start_date or end_date)
+    if not filter_dates and not sites:
         return posts
     
+    sites_lower = frozenset(s.lower() for s in sites) if sites else None
     result = []
     for post in posts:
-        created_at = post.get('created_at', '')
-        if not created_at:
-            continue
-        
-        post_date = created_at[:10]  # YYYY-MM-DD 부분만 추출
-        
-        if start_date and post_date < start_date:
+        if filter_dates:
+            created_at = post.get('created_at', '')
+            if not created_at:
+                continue
+            post_date = created_at[:10]  # YYYY-MM-DD 부분만 추출
+            if start_date and post_date < start_date:
+                continue
+            if end_date and post_date > end_date:
+                continue
+        if sites_lower is not None and post.get('site', '').lower() not in sites_lower:
             continue
-        if end_date and post_date > end_date:
-            continue
-        
         result.append(post)
     
     return result
 
 
-def filter_posts_by_site(posts, sites):
-    """사이트별 게시글 필터링
-    
-    Requirements: 5.5
-    - 특정 사이트의 게시글만 필터링
+@lru_cache(maxsize=1024)
+def parse_ymd(date_str):
+    """YYYY-MM-DD 형식 날짜 문자열 파싱 (같은 문자열은 캐시된 결과 재사용)
     
     Args:
-        posts: 게시글 목록
-        sites: 사이트 목록 (리스트)
+        date_str: 날짜 문자열
         
     Returns:
-        필터링된 게시글 목록
+        datetime 객체 또는 None (빈 값/파싱 실패)
     """
-    if not sites:
-        return posts
-    
-    sites_lower = [s.lower() for s in sites]
-    result = []
-    for post in posts:
-        site = post.get('site', '').lower()
-        if site in sites_lower:
-            result.append(post)
-    
-    return result
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str, DATE_FORMAT)
+    except ValueError:
+        return None
 
 
 def get_game_info(posts, game_id):
@@ -386,6 +510,44 @@ def get_available_sites(posts):
     return sorted(list(sites))
 
 
+def index_posts_by_url(posts):
+    """게시글 목록을 URL 기준 딕셔너리로 변환
+    
+    Args:
+        posts: 게시글 목록
+        
+    Returns:
+        {url: 게시글} 딕셔너리 (URL이 중복되면 먼저 나온 게시글 유지)
+    """
+    posts_by_url = {}
+    for post in posts:
+        posts_by_url.setdefault(post.get('url'), post)
+    return posts_by_url
+
+
+def get_related_posts_info(urls, posts_by_url):
+    """이슈 관련 게시글 URL 목록에 대한 요약 정보 조회
+    
+    Args:
+        urls: 관련 게시글 URL 목록
+        posts_by_url: index_posts_by_url() 결과
+        
+    Returns:
+        관련 게시글 정보 목록 [{url, title, view_count, comment_count}]
+    """
+    related_posts_info = []
+    for url in urls:
+        post = posts_by_url.get(url)
+        if post is not None:
+            related_posts_info.append({
+                'url': url,
+                'title': post.get('title', '')[:50],
+                'view_count': post['view_count'],
+                'comment_count': len(post['comments'])
+            })
+    return related_posts_info
+
+
 @app.route('/game/<game_id>')
 def game_dashboard(game_id):
     """게임별 상세 대시보드 페이지
@@ -398,7 +560,8 @@ def game_dashboard(game_id):
     Args:
         game_id: 게임 ID (kebab-case)
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -406,7 +569,7 @@ def game_dashboard(game_id):
         return "게임을 찾을 수 없습니다.", 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -422,11 +585,7 @@ def game_dashboard(game_id):
     sentiment_max = request.args.get('sentiment_max', type=float)  # -1.0 ~ 1.0
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # 감성 분석 필터 적용 (Requirement 5.3)
     if sentiment_filter:
@@ -448,9 +607,9 @@ def game_dashboard(game_id):
     
     # 정렬
     if sort_by == 'view_count':
-        filtered_posts = sorted(filtered_posts, key=lambda x: x.get('view_count', 0) or 0, reverse=(sort_order == 'desc'))
+        filtered_posts = sorted(filtered_posts, key=lambda x: x['view_count'], reverse=(sort_order == 'desc'))
     elif sort_by == 'comment_count':
-        filtered_posts = sorted(filtered_posts, key=lambda x: len(x.get('comments', [])), reverse=(sort_order == 'desc'))
+        filtered_posts = sorted(filtered_posts, key=lambda x: len(x['comments']), reverse=(sort_order == 'desc'))
     elif sort_by == 'sentiment':
         filtered_posts = sorted(filtered_posts, 
                                key=lambda x: x.get('analysis', {}).get('sentiment', {}).get('score', 0), 
@@ -471,8 +630,8 @@ def game_dashboard(game_id):
     # 통계 계산
     stats = {
         'total_posts': len(filtered_posts),
-        'total_views': sum(p.get('view_count', 0) or 0 for p in filtered_posts),
-        'total_comments': sum(len(p.get('comments', [])) for p in filtered_posts)
+        'total_views': sum(p['view_count'] for p in filtered_posts),
+        'total_comments': sum(len(p['comments']) for p in filtered_posts)
     }
     
     # 감성 분석 통계 추가
@@ -532,7 +691,8 @@ def api_game_posts(game_id):
     Returns:
         JSON: {posts: [...], total: n, game: {...}}
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -540,7 +700,7 @@ def api_game_posts(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -558,11 +718,7 @@ def api_game_posts(game_id):
     sentiment_max = request.args.get('sentiment_max', type=float)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # 감성 분석 필터 적용 (Requirement 5.3)
     if sentiment_filter:
@@ -584,9 +740,9 @@ def api_game_posts(game_id):
     
     # 정렬
     if sort_by == 'view_count':
-        filtered_posts = sorted(filtered_posts, key=lambda x: x.get('view_count', 0) or 0, reverse=(sort_order == 'desc'))
+        filtered_posts = sorted(filtered_posts, key=lambda x: x['view_count'], reverse=(sort_order == 'desc'))
     elif sort_by == 'comment_count':
-        filtered_posts = sorted(filtered_posts, key=lambda x: len(x.get('comments', [])), reverse=(sort_order == 'desc'))
+        filtered_posts = sorted(filtered_posts, key=lambda x: len(x['comments']), reverse=(sort_order == 'desc'))
     elif sort_by == 'sentiment':
         filtered_posts = sorted(filtered_posts, 
                                key=lambda x: x.get('analysis', {}).get('sentiment', {}).get('score', 0), 
@@ -610,9 +766,9 @@ def api_game_posts(game_id):
             'title': post.get('title', ''),
             'author': post.get('author', ''),
             'created_at': post.get('created_at', ''),
-            'view_count': post.get('view_count', 0),
-            'like_count': post.get('like_count', 0),
-            'comment_count': len(post.get('comments', [])),
+            'view_count': post['view_count'],
+            'like_count': post['like_count'],
+            'comment_count': len(post['comments']),
             'site': post.get('site', ''),
             'keyword': post.get('keyword', '')
         }
@@ -652,6 +808,28 @@ def get_sentiment_analyzer():
     return _sentiment_analyzer
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_str(value: str):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def parse_iso_datetime(value):
+    """ISO 8601 날짜 문자열 파싱 (같은 문자열은 캐시된 결과 재사용)
+    
+    Args:
+        value: 날짜 문자열
+        
+    Returns:
+        datetime 객체 또는 None (빈 값/파싱 실패)
+    """
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_iso_datetime_str(value)
+
+
 def convert_post_dict_to_postcontent(post_dict: dict) -> PostContent:
     """딕셔너리 형태의 게시글을 PostContent 객체로 변환
     
@@ -661,40 +839,29 @@ def convert_post_dict_to_postcontent(post_dict: dict) -> PostContent:
     Returns:
         PostContent 객체
     """
-    # 날짜 파싱
-    created_at = None
-    if post_dict.get('created_at'):
-        try:
-            created_at = datetime.fromisoformat(post_dict['created_at'].replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            pass
+    get = post_dict.get
     
     # 댓글 변환
-    comments = []
-    for c in post_dict.get('comments', []):
-        comment_created_at = None
-        if c.get('created_at'):
-            try:
-                comment_created_at = datetime.fromisoformat(c['created_at'].replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                pass
-        comments.append(Comment(
+    comments = [
+        Comment(
             author=c.get('author', ''),
             content=c.get('content', ''),
-            created_at=comment_created_at,
+            created_at=parse_iso_datetime(c.get('created_at')),
             like_count=c.get('like_count', 0)
-        ))
+        )
+        for c in get('comments', [])
+    ]
     
     return PostContent(
-        url=post_dict.get('url', ''),
-        title=post_dict.get('title', ''),
-        body=post_dict.get('body', ''),
-        site=post_dict.get('site', ''),
-        keyword=post_dict.get('keyword', ''),
-        author=post_dict.get('author'),
-        created_at=created_at,
-        view_count=post_dict.get('view_count', 0) or 0,
-        like_count=post_dict.get('like_count', 0) or 0,
+        url=get('url', ''),
+        title=get('title', ''),
+        body=get('body', ''),
+        site=get('site', ''),
+        keyword=get('keyword', ''),
+        author=get('author'),
+        created_at=parse_iso_datetime(get('created_at')),
+        view_count=get('view_count', 0) or 0,
+        like_count=get('like_count', 0) or 0,
         comments=comments
     )
 
@@ -725,7 +892,8 @@ def api_game_sentiment(game_id):
             negative_posts: [{url, title, score, label, ...}, ...]
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -733,7 +901,7 @@ def api_game_sentiment(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -743,11 +911,7 @@ def api_game_sentiment(game_id):
     limit = request.args.get('limit', 20, type=int)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # 감성 분석 수행
     analyzer = get_sentiment_analyzer()
@@ -785,8 +949,8 @@ def api_game_sentiment(game_id):
                 'title': post_dict.get('title', ''),
                 'author': post_dict.get('author', ''),
                 'created_at': post_dict.get('created_at', ''),
-                'view_count': post_dict.get('view_count', 0),
-                'comment_count': len(post_dict.get('comments', [])),
+                'view_count': post_dict['view_count'],
+                'comment_count': len(post_dict['comments']),
                 'site': post_dict.get('site', ''),
                 'sentiment_score': round(result.score, 3),
                 'sentiment_label': result.label.value,
@@ -829,6 +993,124 @@ def get_issue_detector():
     return _issue_detector
 
 
+# 이슈 탐지용 프로세스 풀 (서버 시작 시 생성, 시작 전 호출 시 첫 사용 시 생성)
+ISSUE_POOL_WORKERS = os.cpu_count() or 1  # 이슈 탐지 워커 프로세스 수
+_issue_process_pool = None
+
+
+def _init_issue_worker():
+    """이슈 탐지 워커 프로세스 초기화 (탐지기/감성 사전을 첫 요청 전에 로드)"""
+    get_issue_detector()
+
+
+def get_issue_process_pool():
+    """이슈 탐지용 프로세스 풀 반환 (싱글톤 패턴)"""
+    global _issue_process_pool
+    if _issue_process_pool is None:
+        _issue_process_pool = ProcessPoolExecutor(
+            max_workers=ISSUE_POOL_WORKERS,
+            initializer=_init_issue_worker
+        )
+    return _issue_process_pool
+
+
+def start_issue_process_pool():
+    """이슈 탐지 프로세스 풀 생성 및 워커 시작
+    
+    워커 프로세스가 요청 스레드가 아닌 서버 시작 시점에 만들어지도록
+    워커 수만큼 초기화 작업을 제출하고 완료를 기다린다.
+    """
+    pool = get_issue_process_pool()
+    futures = [pool.submit(_init_issue_worker) for _ in range(ISSUE_POOL_WORKERS)]
+    for future in futures:
+        future.result()
+
+
+def pack_posts_for_issues(post_contents):
+    """이슈 탐지에 필요한 게시글 필드만 컬럼별 튜플로 묶기
+    
+    PostContent/Comment 객체 대신 컬럼별 튜플을 워커로 보내 직렬화 크기를 줄인다.
+    댓글은 이슈 탐지에 사용하는 내용만 보낸다.
+    
+    Args:
+        post_contents: PostContent 목록
+        
+    Returns:
+        (url, title, body, site, keyword, author, created_at, view_count, like_count, 댓글 내용) 컬럼 튜플
+    """
+    return (
+        tuple(p.url for p in post_contents),
+        tuple(p.title for p in post_contents),
+        tuple(p.body for p in post_contents),
+        tuple(p.site for p in post_contents),
+        tuple(p.keyword for p in post_contents),
+        tuple(p.author for p in post_contents),
+        tuple(p.created_at for p in post_contents),
+        tuple(p.view_count for p in post_contents),
+        tuple(p.like_count for p in post_contents),
+        tuple(tuple(c.content for c in p.comments) for p in post_contents),
+    )
+
+
+def unpack_posts_for_issues(columns):
+    """pack_posts_for_issues 결과를 PostContent 목록으로 복원
+    
+    Args:
+        columns: pack_posts_for_issues가 반환한 컬럼 튜플
+        
+    Returns:
+        PostContent 목록
+    """
+    return [
+        PostContent(
+            url=url,
+            title=title,
+            body=body,
+            site=site,
+            keyword=keyword,
+            author=author,
+            created_at=created_at,
+            view_count=view_count,
+            like_count=like_count,
+            comments=[Comment(author='', content=content) for content in comment_contents]
+        )
+        for (url, title, body, site, keyword, author, created_at,
+             view_count, like_count, comment_contents) in zip(*columns)
+    ]
+
+
+def _detect_issues_worker(columns):
+    """워커 프로세스에서 이슈 탐지 (탐지기는 프로세스별 싱글톤으로 재사용)"""
+    return get_issue_detector().detect_issues(unpack_posts_for_issues(columns))
+
+
+def detect_issues(post_contents):
+    """이슈 탐지를 프로세스 풀에서 수행
+    
+    CPU 연산인 이슈 탐지를 요청 스레드 밖에서 실행하여 동시 요청이
+    여러 코어에서 병렬로 처리되도록 한다. 풀을 사용할 수 없으면
+    현재 프로세스에서 탐지한다.
+    
+    Args:
+        post_contents: PostContent 목록
+        
+    Returns:
+        DetectedIssue 목록
+    """
+    global _issue_process_pool
+    if not post_contents:
+        return get_issue_detector().detect_issues(post_contents)
+    try:
+        pool = get_issue_process_pool()
+        return pool.submit(_detect_issues_worker, pack_posts_for_issues(post_contents)).result()
+    except (BrokenProcessPool, OSError) as e:
+        print(f"이슈 탐지 프로세스 풀 사용 실패, 현재 프로세스에서 탐지: {e}")
+        if _issue_process_pool is not None:
+            _issue_process_pool.shutdown(wait=False, cancel_futures=True)
+            _issue_process_pool = None
+        return get_issue_detector().detect_issues(post_contents)
+
+
 @app.route('/api/game/<game_id>/issues')
 def api_game_issues(game_id):
     """게임별 이슈 목록 API
@@ -856,7 +1138,8 @@ def api_game_issues(game_id):
             bug_issue_count: int
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -864,7 +1147,7 @@ def api_game_issues(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -874,18 +1157,14 @@ def api_game_issues(game_id):
     include_bugs_only = request.args.get('include_bugs_only', 'false').lower() == 'true'
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 이슈 탐지
     detector = get_issue_detector()
-    issues = detector.detect_issues(post_contents)
+    issues = detect_issues(post_contents)
     
     # Hot Issue 탐지 (상위 10%)
     hot_issues = detector.detect_hot_issues(issues, threshold_percentile=0.9)
@@ -903,9 +1182,8 @@ def api_game_issues(game_id):
     issues = issues[:limit]
     
     # 응답 데이터 구성
-    response_issues = []
-    for issue in issues:
-        response_issues.append({
+    response_issues = [
+        {
             'issue_id': issue.issue_id,
             'title': issue.title,
             'priority_score': round(issue.priority_score, 4),
@@ -919,7 +1197,9 @@ def api_game_issues(game_id):
             'keywords': issue.cluster.keywords[:5],  # 상위 5개 키워드만
             'related_post_count': len(issue.related_posts),
             'first_seen': issue.first_seen.isoformat() if issue.first_seen else None
-        })
+        }
+        for issue in issues
+    ]
     
     return jsonify({
         'game': game_info,
@@ -961,7 +1241,8 @@ def api_game_hot_issues(game_id):
             alert_message: str (Hot Issue가 있을 경우 알림 메시지)
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -969,7 +1250,7 @@ def api_game_hot_issues(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -978,39 +1259,22 @@ def api_game_hot_issues(game_id):
     threshold_percentile = request.args.get('threshold_percentile', 0.9, type=float)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 이슈 탐지
     detector = get_issue_detector()
-    issues = detector.detect_issues(post_contents)
+    issues = detect_issues(post_contents)
     
     # Hot Issue 탐지
     hot_issues = detector.detect_hot_issues(issues, threshold_percentile=threshold_percentile)
     
-    # 응답 데이터 구성
-    response_hot_issues = []
-    for issue in hot_issues:
-        # 관련 게시글 URL에서 제목 찾기
-        related_posts_info = []
-        for url in issue.related_posts[:5]:  # 상위 5개만
-            for post in filtered_posts:
-                if post.get('url') == url:
-                    related_posts_info.append({
-                        'url': url,
-                        'title': post.get('title', '')[:50],
-                        'view_count': post.get('view_count', 0),
-                        'comment_count': len(post.get('comments', []))
-                    })
-                    break
-        
-        response_hot_issues.append({
+    # 응답 데이터 구성 (관련 게시글은 상위 5개만)
+    posts_by_url = index_posts_by_url(filtered_posts)
+    response_hot_issues = [
+        {
             'issue_id': issue.issue_id,
             'title': issue.title,
             'priority_score': round(issue.priority_score, 4),
@@ -1021,9 +1285,11 @@ def api_game_hot_issues(game_id):
             'total_views': issue.cluster.total_views,
             'total_comments': issue.cluster.total_comments,
             'keywords': issue.cluster.keywords[:5],
-            'related_posts': related_posts_info,
+            'related_posts': get_related_posts_info(issue.related_posts[:5], posts_by_url),
             'first_seen': issue.first_seen.isoformat() if issue.first_seen else None
-        })
+        }
+        for issue in hot_issues
+    ]
     
     # 알림 메시지 생성
     alert_message = None
@@ -1074,7 +1340,8 @@ def api_game_hot_posts(game_id):
             alert_message: str
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1082,7 +1349,7 @@ def api_game_hot_posts(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -1094,11 +1361,7 @@ def api_game_hot_posts(game_id):
     sentiment_weight = request.args.get('sentiment_weight', 0.3, type=float)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
@@ -1128,9 +1391,8 @@ def api_game_hot_posts(game_id):
             alert_message = f"⚠️ 주목: '{title_preview}' - 조회수 {top_post.view_count:,}"
     
     # 응답 데이터 구성
-    response_hot_posts = []
-    for hp in hot_posts:
-        response_hot_posts.append({
+    response_hot_posts = [
+        {
             'post_url': hp.post_url,
             'title': hp.title,
             'author': hp.author,
@@ -1144,7 +1406,9 @@ def api_game_hot_posts(game_id):
             'is_bug': hp.is_bug,
             'severity': hp.severity.value,
             'keywords': hp.keywords
-        })
+        }
+        for hp in hot_posts
+    ]
     
     return jsonify({
         'game': game_info,
@@ -1192,7 +1456,8 @@ def api_game_bugs(game_id):
             alert_message: str
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1200,7 +1465,7 @@ def api_game_bugs(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -1210,18 +1475,14 @@ def api_game_bugs(game_id):
     severity_filter = request.args.get('severity', '')
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 이슈 탐지
     detector = get_issue_detector()
-    all_issues = detector.detect_issues(post_contents)
+    all_issues = detect_issues(post_contents)
     
     # 버그 이슈만 필터링
     bug_issues = detector.get_bug_issues(all_issues)
@@ -1231,37 +1492,21 @@ def api_game_bugs(game_id):
         bug_issues = [issue for issue in bug_issues if issue.severity.value == severity_filter.lower()]
     
     # 심각도 분포 계산
+    severity_counts = Counter(issue.severity.value for issue in bug_issues)
     severity_distribution = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0
+        severity: severity_counts.get(severity, 0)
+        for severity in SEVERITY_LEVELS
     }
-    for issue in bug_issues:
-        severity_distribution[issue.severity.value] += 1
     
     total_bug_issues = len(bug_issues)
     
     # 제한 적용
     bug_issues = bug_issues[:limit]
     
-    # 응답 데이터 구성
-    response_bug_issues = []
-    for issue in bug_issues:
-        # 관련 게시글 정보 수집
-        related_posts_info = []
-        for url in issue.related_posts[:5]:  # 상위 5개만
-            for post in filtered_posts:
-                if post.get('url') == url:
-                    related_posts_info.append({
-                        'url': url,
-                        'title': post.get('title', '')[:50],
-                        'view_count': post.get('view_count', 0),
-                        'comment_count': len(post.get('comments', []))
-                    })
-                    break
-        
-        response_bug_issues.append({
+    # 응답 데이터 구성 (관련 게시글은 상위 5개만)
+    posts_by_url = index_posts_by_url(filtered_posts)
+    response_bug_issues = [
+        {
             'issue_id': issue.issue_id,
             'title': issue.title,
             'severity': issue.severity.value,
@@ -1271,9 +1516,11 @@ def api_game_bugs(game_id):
             'total_views': issue.cluster.total_views,
             'total_comments': issue.cluster.total_comments,
             'keywords': issue.cluster.keywords[:5],
-            'related_posts': related_posts_info,
+            'related_posts': get_related_posts_info(issue.related_posts[:5], posts_by_url),
             'first_seen': issue.first_seen.isoformat() if issue.first_seen else None
-        })
+        }
+        for issue in bug_issues
+    ]
     
     # 알림 메시지 생성
     alert_message = None
@@ -1310,75 +1557,92 @@ def game_bugs_page(game_id):
     Args:
         game_id: 게임 ID (kebab-case)
     """
-    posts = load_crawl_data()
+    # 쿼리 파라미터에서 필터 조건 추출
+    start_date = request.args.get('start_date', '')
+    end_date = request.args.get('end_date', '')
+    site_filter = request.args.getlist('site')
+    severity_filter = request.args.get('severity', '')
+    
+    html = render_bug_report_page(
+        get_data_key(), game_id, start_date, end_date, tuple(site_filter), severity_filter
+    )
+    if html is None:
+        return "게임을 찾을 수 없습니다.", 404
+    return html
+
+
+@lru_cache(maxsize=32)
+def render_bug_report_page(data_key, game_id, start_date, end_date, site_filter, severity_filter):
+    """버그 리포트 페이지 렌더링 (데이터 키와 필터 조합 단위 캐시)
+    
+    data_key가 바뀌면(데이터 파일 변경) 새로 렌더링된다.
+    
+    Args:
+        data_key: get_data_key() 결과
+        game_id: 게임 ID (kebab-case)
+        start_date: 시작일 (YYYY-MM-DD)
+        end_date: 종료일 (YYYY-MM-DD)
+        site_filter: 사이트 필터 튜플
+        severity_filter: 심각도 필터
+        
+    Returns:
+        렌더링된 HTML 문자열 또는 None (게임을 찾을 수 없는 경우)
+    """
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
     if not game_info:
-        return "게임을 찾을 수 없습니다.", 404
+        return None
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
-    
-    # 쿼리 파라미터에서 필터 조건 추출
-    start_date = request.args.get('start_date', '')
-    end_date = request.args.get('end_date', '')
-    site_filter = request.args.getlist('site')
-    severity_filter = request.args.get('severity', '')
+    game_posts = get_game_posts(data_key, game_id)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 이슈 탐지
     detector = get_issue_detector()
-    all_issues = detector.detect_issues(post_contents)
+    all_issues = detect_issues(post_contents)
     
     # 버그 이슈만 필터링
     bug_issues = detector.get_bug_issues(all_issues)
     
+    # 심각도 분포 계산 (심각도 필터 적용 전 전체 버그 이슈 기준)
+    severity_counts = Counter(issue.severity.value for issue in bug_issues)
+    severity_distribution = {
+        severity: severity_counts.get(severity, 0)
+        for severity in SEVERITY_LEVELS
+    }
+    
     # 심각도 필터 적용
     if severity_filter:
         bug_issues = [issue for issue in bug_issues if issue.severity.value == severity_filter.lower()]
     
-    # 심각도 분포 계산
-    severity_distribution = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0
-    }
-    for issue in all_issues:
-        if issue.is_bug:
-            severity_distribution[issue.severity.value] += 1
-    
     # 사용 가능한 사이트 목록
     available_sites = get_available_sites(game_posts)
     
-    # 버그 관련 게시글 수집
-    bug_posts = []
-    for issue in bug_issues:
-        for url in issue.related_posts[:3]:  # 이슈당 상위 3개 게시글
-            for post in filtered_posts:
-                if post.get('url') == url:
-                    bug_posts.append({
-                        'url': url,
-                        'title': post.get('title', ''),
-                        'author': post.get('author', ''),
-                        'created_at': post.get('created_at', ''),
-                        'view_count': post.get('view_count', 0),
-                        'comment_count': len(post.get('comments', [])),
-                        'site': post.get('site', ''),
-                        'issue_title': issue.title,
-                        'severity': issue.severity.value
-                    })
-                    break
+    # 버그 관련 게시글 수집 (이슈당 상위 3개 게시글)
+    posts_by_url = index_posts_by_url(filtered_posts)
+    bug_posts = [
+        {
+            'url': url,
+            'title': post.get('title', ''),
+            'author': post.get('author', ''),
+            'created_at': post.get('created_at', ''),
+            'view_count': post['view_count'],
+            'comment_count': len(post['comments']),
+            'site': post.get('site', ''),
+            'issue_title': issue.title,
+            'severity': issue.severity.value
+        }
+        for issue in bug_issues
+        for url in issue.related_posts[:3]
+        if (post := posts_by_url.get(url)) is not None
+    ]
     
     return render_template(
         'bug_report.html',
@@ -1390,7 +1654,7 @@ def game_bugs_page(game_id):
         filters={
             'start_date': start_date,
             'end_date': end_date,
-            'sites': site_filter,
+            'sites': list(site_filter),
             'severity': severity_filter
         }
     )
@@ -1408,6 +1672,25 @@ def get_trend_analyzer():
     return _trend_analyzer
 
 
+def serialize_trend_points(points):
+    """트렌드 포인트 목록을 응답용 딕셔너리 목록으로 변환
+    
+    Args:
+        points: TrendPoint 목록
+        
+    Returns:
+        [{date, value, count}, ...]
+    """
+    return [
+        {
+            'date': point.date.strftime(DATE_FORMAT),
+            'value': round(point.value, 3),
+            'count': point.count
+        }
+        for point in points
+    ]
+
+
 @app.route('/api/game/<game_id>/sentiment/trend')
 def api_game_sentiment_trend(game_id):
     """게임별 감성 트렌드 API
@@ -1444,7 +1727,8 @@ def api_game_sentiment_trend(game_id):
             filters: {...}
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1452,7 +1736,7 @@ def api_game_sentiment_trend(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date_str = request.args.get('start_date', '')
@@ -1461,28 +1745,14 @@ def api_game_sentiment_trend(game_id):
     period = request.args.get('period', 'daily')
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date_str or end_date_str:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date_str, end_date_str)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date_str, end_date_str, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 날짜 파싱 (TrendAnalyzer용)
-    start_date = None
-    end_date = None
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
-    if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
+    start_date = parse_ymd(start_date_str)
+    end_date = parse_ymd(end_date_str)
     
     # 트렌드 분석
     analyzer = get_trend_analyzer()
@@ -1500,21 +1770,9 @@ def api_game_sentiment_trend(game_id):
     summary = analyzer.get_trend_summary(trend_data)
     
     # 응답 데이터 구성
-    response_data_points = []
-    for point in trend_data.data_points:
-        response_data_points.append({
-            'date': point.date.strftime('%Y-%m-%d'),
-            'value': round(point.value, 3),
-            'count': point.count
-        })
+    response_data_points = serialize_trend_points(trend_data.data_points)
     
-    response_spikes = []
-    for spike in spikes:
-        response_spikes.append({
-            'date': spike.date.strftime('%Y-%m-%d'),
-            'value': round(spike.value, 3),
-            'count': spike.count
-        })
+    response_spikes = serialize_trend_points(spikes)
     
     return jsonify({
         'game': game_info,
@@ -1573,7 +1831,8 @@ def api_game_issue_trend(game_id, issue_id):
             filters: {...}
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1581,7 +1840,7 @@ def api_game_issue_trend(game_id, issue_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date_str = request.args.get('start_date', '')
@@ -1590,34 +1849,30 @@ def api_game_issue_trend(game_id, issue_id):
     period = request.args.get('period', 'daily')
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date_str or end_date_str:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date_str, end_date_str)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date_str, end_date_str, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 이슈 탐지하여 해당 이슈 찾기
-    detector = get_issue_detector()
-    issues = detector.detect_issues(post_contents)
+    issues = detect_issues(post_contents)
     
-    # 이슈 ID 또는 제목으로 이슈 찾기
-    target_issue = None
+    # 이슈 ID 또는 제목으로 이슈 찾기 (조회용 인덱스 구성, 중복 시 먼저 나온 이슈 우선)
+    issues_by_id = {}
+    issues_by_title = {}
+    issues_by_representative = {}
     for issue in issues:
-        # ID로 찾기
-        if issue.issue_id == issue_id:
-            target_issue = issue
-            break
-        # 제목(대표 키워드)으로 찾기 (URL 인코딩된 경우 대비)
-        if issue.title == issue_id or issue.title.lower() == issue_id.lower():
-            target_issue = issue
-            break
-        # 클러스터 대표 키워드로 찾기
-        if issue.cluster and issue.cluster.representative == issue_id:
-            target_issue = issue
-            break
+        issues_by_id.setdefault(issue.issue_id, issue)
+        issues_by_title.setdefault(issue.title.lower(), issue)
+        if issue.cluster:
+            issues_by_representative.setdefault(issue.cluster.representative, issue)
+
+    # ID → 제목(대표 키워드, URL 인코딩된 경우 대비) → 클러스터 대표 키워드 순으로 찾기
+    target_issue = (
+        issues_by_id.get(issue_id)
+        or issues_by_title.get(issue_id.lower())
+        or issues_by_representative.get(issue_id)
+    )
     
     if not target_issue:
         # 이슈를 찾지 못한 경우, 키워드 트렌드로 대체
@@ -1625,18 +1880,8 @@ def api_game_issue_trend(game_id, issue_id):
         analyzer = get_trend_analyzer()
         
         # 날짜 파싱
-        start_date = None
-        end_date = None
-        if start_date_str:
-            try:
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            except ValueError:
-                pass
-        if end_date_str:
-            try:
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-            except ValueError:
-                pass
+        start_date = parse_ymd(start_date_str)
+        end_date = parse_ymd(end_date_str)
         
         trend_data = analyzer.analyze_keyword_trend(
             post_contents,
@@ -1648,13 +1893,7 @@ def api_game_issue_trend(game_id, issue_id):
         
         summary = analyzer.get_trend_summary(trend_data)
         
-        response_data_points = []
-        for point in trend_data.data_points:
-            response_data_points.append({
-                'date': point.date.strftime('%Y-%m-%d'),
-                'value': round(point.value, 3),
-                'count': point.count
-            })
+        response_data_points = serialize_trend_points(trend_data.data_points)
         
         return jsonify({
             'game': game_info,
@@ -1691,18 +1930,8 @@ def api_game_issue_trend(game_id, issue_id):
         })
     
     # 날짜 파싱 (TrendAnalyzer용)
-    start_date = None
-    end_date = None
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
-    if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
+    start_date = parse_ymd(start_date_str)
+    end_date = parse_ymd(end_date_str)
     
     # 트렌드 분석
     analyzer = get_trend_analyzer()
@@ -1718,13 +1947,7 @@ def api_game_issue_trend(game_id, issue_id):
     summary = analyzer.get_trend_summary(trend_data)
     
     # 응답 데이터 구성
-    response_data_points = []
-    for point in trend_data.data_points:
-        response_data_points.append({
-            'date': point.date.strftime('%Y-%m-%d'),
-            'value': round(point.value, 3),
-            'count': point.count
-        })
+    response_data_points = serialize_trend_points(trend_data.data_points)
     
     # 이슈 정보
     issue_info = {
@@ -1789,7 +2012,8 @@ def api_game_keyword_trend(game_id, keyword):
             filters: {...}
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1797,7 +2021,7 @@ def api_game_keyword_trend(game_id, keyword):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date_str = request.args.get('start_date', '')
@@ -1806,28 +2030,14 @@ def api_game_keyword_trend(game_id, keyword):
     period = request.args.get('period', 'daily')
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date_str or end_date_str:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date_str, end_date_str)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date_str, end_date_str, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
     
     # 날짜 파싱 (TrendAnalyzer용)
-    start_date = None
-    end_date = None
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
-    if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        except ValueError:
-            pass
+    start_date = parse_ymd(start_date_str)
+    end_date = parse_ymd(end_date_str)
     
     # 트렌드 분석
     analyzer = get_trend_analyzer()
@@ -1843,13 +2053,7 @@ def api_game_keyword_trend(game_id, keyword):
     summary = analyzer.get_trend_summary(trend_data)
     
     # 응답 데이터 구성
-    response_data_points = []
-    for point in trend_data.data_points:
-        response_data_points.append({
-            'date': point.date.strftime('%Y-%m-%d'),
-            'value': round(point.value, 3),
-            'count': point.count
-        })
+    response_data_points = serialize_trend_points(trend_data.data_points)
     
     return jsonify({
         'game': game_info,
@@ -1929,7 +2133,8 @@ def api_game_alerts(game_id):
             filters: {...}
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -1937,7 +2142,7 @@ def api_game_alerts(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -1948,11 +2153,7 @@ def api_game_alerts(game_id):
     include_urgent = request.args.get('include_urgent', 'true').lower() == 'true'
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
@@ -2015,7 +2216,8 @@ def api_game_urgent_alerts(game_id):
             alert_banner: str (긴급 알림 배너 메시지)
         }
     """
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -2023,7 +2225,7 @@ def api_game_urgent_alerts(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -2031,11 +2233,7 @@ def api_game_urgent_alerts(game_id):
     site_filter = request.args.getlist('site')
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
@@ -2098,7 +2296,8 @@ def api_game_sentiment_spike_alerts(game_id):
     """
     from crawler.analysis.alert_manager import AlertType
     
-    posts = load_crawl_data()
+    data_key = get_data_key()
+    posts = load_crawl_data(data_key)
     
     # 게임 정보 조회
     game_info = get_game_info(posts, game_id)
@@ -2106,7 +2305,7 @@ def api_game_sentiment_spike_alerts(game_id):
         return jsonify({'error': 'Game not found'}), 404
     
     # 게임별 게시글 필터링
-    game_posts = filter_posts_by_game(posts, game_id)
+    game_posts = get_game_posts(data_key, game_id)
     
     # 쿼리 파라미터에서 필터 조건 추출
     start_date = request.args.get('start_date', '')
@@ -2115,11 +2314,7 @@ def api_game_sentiment_spike_alerts(game_id):
     threshold = request.args.get('threshold', -0.3, type=float)
     
     # 필터 적용
-    filtered_posts = game_posts
-    if start_date or end_date:
-        filtered_posts = filter_posts_by_date_range(filtered_posts, start_date, end_date)
-    if site_filter:
-        filtered_posts = filter_posts_by_site(filtered_posts, site_filter)
+    filtered_posts = filter_posts_combined(game_posts, start_date, end_date, site_filter)
     
     # PostContent 객체로 변환
     post_contents = [convert_post_dict_to_postcontent(p) for p in filtered_posts]
@@ -2159,6 +2354,18 @@ def api_game_sentiment_spike_alerts(game_id):
     })
 
 
+def warm_up_analyzers():
+    """분석기 싱글톤 사전 초기화
+    
+    감성 사전 로드 등 분석기 초기화 비용을 서버 시작 시점에 미리 지불하여
+    첫 요청의 지연을 줄인다.
+    """
+    get_sentiment_analyzer()
+    get_issue_detector()
+    get_trend_analyzer()
+    get_alert_manager()
+
+
 if __name__ == '__main__':
     print("="*50)
     print("크롤링 결과 대시보드")
@@ -2166,4 +2373,9 @@ if __name__ == '__main__':
     print(f"데이터 디렉토리: {DATA_DIR}")
     print("브라우저에서 http://localhost:5000 접속")
     print("="*50)
-    app.run(debug=True, port=5000)
+    warm_up_analyzers()
+    # 요청을 처리하는 프로세스에서만 풀 생성 (디버그 리로더의 감시 프로세스 제외)
+    debug = True
+    if not debug or is_running_from_reloader():
+        start_issue_process_pool()
+    app.run(debug=debug, port=5000)
@@ -45,7 +45,8 @@ def demo_crawl_urls():
     config = CrawlerConfig(
         output_dir="data",
         default_delay=3.0,
-        jitter_range=(0.5, 1.5)
+        jitter_range=(0.5, 1.5),
+        respect_robots_txt=True
     )
     
     with CrawlerOrchestrator(config) as crawler:
@@ -99,7 +100,8 @@ def demo_search_and_crawl():
         output_dir="data",
         default_delay=3.0,
         relevance_threshold=0.3,  # 관련성 임계값
-        jitter_range=(0.5, 1.5)
+        jitter_range=(0.5, 1.5),
+        respect_robots_txt=True
     )
     
     with CrawlerOrchestrator(config) as crawler:
@@ -148,7 +150,8 @@ def demo_search_only():
     sites = ["inven.co.kr"]
     
     config = CrawlerConfig(
-        relevance_threshold=0.3
+        relevance_threshold=0.3,
+        respect_robots_txt=True
     )
     
     with CrawlerOrchestrator(config) as crawler:
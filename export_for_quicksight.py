@@ -2,153 +2,405 @@
 QuickSight용 데이터 내보내기 스크립트
 
 크롤링 결과를 QuickSight에서 사용할 수 있는 형식으로 변환한다.
-- CSV 파일로 내보내기 (S3 업로드용)
+- Parquet 파일로 내보내기 (S3 업로드용, pyarrow가 없으면 CSV)
 - 게시글과 댓글을 별도 테이블로 분리
 """
 
-import json
 import csv
+import io
 import os
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 
 DATA_DIR = Path('data')
 OUTPUT_DIR = Path('quicksight_data')
+EXPORT_FORMAT = os.getenv('EXPORT_FORMAT', 'parquet')  # 'parquet' 또는 'csv'
+LOAD_WORKERS = 8  # JSON 파일 동시 로드 스레드 수
+UPLOAD_WORKERS = 8  # S3 파일 동시 업로드 스레드 수
+S3_BUCKET = os.getenv('QUICKSIGHT_S3_BUCKET')  # 지정 시 메모리에서 바로 S3 업로드
+S3_PREFIX = os.getenv('QUICKSIGHT_S3_PREFIX', 'crawl_data')
+
+# 이 프로세스에서 마지막으로 내보낸 파일 경로 (export_all/export_all_parquet가 갱신)
+_last_export = ()
+
+
+def _load_one(json_file):
+    """크롤링 결과 파일 하나를 게시글 리스트로 로드"""
+    try:
+        data = orjson.loads(json_file.read_bytes())
+        
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and 'url' in data:
+            return [data]
+    except Exception as e:
+        print(f"파일 로드 실패: {json_file} - {e}")
+    
+    return []
 
 
 def load_all_posts():
     """모든 크롤링 결과 로드"""
-    all_posts = []
+    files = list(DATA_DIR.glob('*.json'))
     
-    for json_file in DATA_DIR.glob('*.json'):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                if isinstance(data, list):
-                    all_posts.extend(data)
-                elif isinstance(data, dict) and 'url' in data:
-                    all_posts.append(data)
-        except Exception as e:
-            print(f"파일 로드 실패: {json_file} - {e}")
+    # 파일별 로드는 스레드 풀에서 병렬 처리 (결과 순서는 파일 순서 유지)
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        results = list(executor.map(_load_one, files))
     
-    return all_posts
+    return list(chain.from_iterable(results))
 
 
-def export_posts_csv(posts, filename='posts.csv'):
-    """게시글 데이터를 CSV로 내보내기"""
-    OUTPUT_DIR.mkdir(exist_ok=True)
-    filepath = OUTPUT_DIR / filename
+POST_COLUMNS = (
+    'post_id', 'url', 'title', 'site', 'author',
+    'created_at', 'view_count', 'like_count',
+    'body_length', 'comment_count', 'keyword'
+)
+COMMENT_COLUMNS = (
+    'comment_id', 'post_id', 'post_url', 'author',
+    'content', 'created_at', 'like_count'
+)
+SUMMARY_COLUMNS = ('site', 'post_count', 'total_views', 'total_likes', 'total_comments')
+COMMENT_MAX_LENGTH = 500  # 내보내는 댓글 내용 최대 길이
+
+
+def _post_row(post_id, post):
+    """게시글 하나를 POST_COLUMNS 순서의 행으로 변환"""
+    get = post.get
+    created_at = get('created_at')
+    return (
+        post_id,
+        get('url', ''),
+        get('title', ''),
+        get('site', ''),
+        get('author', ''),
+        created_at[:10] if created_at else '',
+        get('view_count', 0),
+        get('like_count', 0),
+        len(get('body', '')),
+        len(get('comments', [])),
+        get('keyword', '')
+    )
+
+
+def _append_comment_rows(comment_rows, post_id, post):
+    """게시글의 댓글을 COMMENT_COLUMNS 순서의 행으로 comment_rows에 추가 (댓글 ID는 1부터 연속)"""
+    url = post.get('url', '')
+    for comment in post.get('comments', []):
+        comment_get = comment.get
+        comment_created_at = comment_get('created_at')
+        comment_rows.append((
+            len(comment_rows) + 1,
+            post_id,
+            url,
+            comment_get('author', ''),
+            comment_get('content', '')[:COMMENT_MAX_LENGTH],  # 길이 제한
+            comment_created_at[:10] if comment_created_at else '',
+            comment_get('like_count', 0)
+        ))
+
+
+def _add_site_stats(site_stats, post):
+    """사이트별 통계에 게시글 하나 누적"""
+    get = post.get
+    stats = site_stats[get('site', 'unknown')]
+    stats[0] += 1
+    stats[1] += get('view_count', 0)
+    stats[2] += get('like_count', 0)
+    stats[3] += len(get('comments', []))
+
+
+def _new_site_stats():
+    """사이트별 통계 딕셔너리 생성 (사이트 -> [게시글 수, 조회수 합, 추천수 합, 댓글 수 합])"""
+    return defaultdict(lambda: [0, 0, 0, 0])
+
+
+def build_post_rows(posts):
+    """게시글 테이블 행 생성"""
+    return [_post_row(post_id, post) for post_id, post in enumerate(posts, 1)]
+
+
+def build_comment_rows(posts):
+    """댓글 테이블 행 생성"""
+    comment_rows = []
+    for post_id, post in enumerate(posts, 1):
+        _append_comment_rows(comment_rows, post_id, post)
+    return comment_rows
+
+
+def build_summary_rows(posts):
+    """사이트별 요약 테이블 행 생성"""
+    site_stats = _new_site_stats()
+    for post in posts:
+        _add_site_stats(site_stats, post)
+    return [(site, *stats) for site, stats in site_stats.items()]
+
+
+def build_tables(posts):
+    """게시글/댓글/요약 테이블 행을 한 번의 순회로 생성
     
-    fieldnames = [
-        'post_id', 'url', 'title', 'site', 'author', 
-        'created_at', 'view_count', 'like_count', 
-        'body_length', 'comment_count', 'keyword'
-    ]
+    세 테이블을 모두 내보내는 write_csv_tables/write_parquet_tables가 사용한다.
+    테이블 하나만 필요하면 build_post_rows 등 테이블별 함수를 사용한다.
     
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    Args:
+        posts: 게시글 목록
         
-        for i, post in enumerate(posts, 1):
-            row = {
-                'post_id': i,
-                'url': post.get('url', ''),
-                'title': post.get('title', ''),
-                'site': post.get('site', ''),
-                'author': post.get('author', ''),
-                'created_at': post.get('created_at', '')[:10] if post.get('created_at') else '',
-                'view_count': post.get('view_count', 0),
-                'like_count': post.get('like_count', 0),
-                'body_length': len(post.get('body', '')),
-                'comment_count': len(post.get('comments', [])),
-                'keyword': post.get('keyword', '')
-            }
-            writer.writerow(row)
-    
-    print(f"게시글 CSV 저장: {filepath} ({len(posts)}개)")
-    return filepath
+    Returns:
+        (게시글 행, 댓글 행, 요약 행) 튜플. 각 행은 *_COLUMNS 순서의 튜플
+    """
+    post_rows = []
+    comment_rows = []
+    site_stats = _new_site_stats()
+    
+    for post_id, post in enumerate(posts, 1):
+        post_rows.append(_post_row(post_id, post))
+        _append_comment_rows(comment_rows, post_id, post)
+        _add_site_stats(site_stats, post)
+    
+    summary_rows = [(site, *stats) for site, stats in site_stats.items()]
+    return post_rows, comment_rows, summary_rows
 
 
-def export_comments_csv(posts, filename='comments.csv'):
-    """댓글 데이터를 CSV로 내보내기"""
+def _write_csv(file, columns, rows):
+    """헤더와 행을 CSV로 쓰기 (file: 텍스트 모드 파일 객체, newline='')"""
+    writer = csv.writer(file)
+    writer.writerow(columns)
+    writer.writerows(rows)
+
+
+def _export_csv(filename, columns, rows):
+    """테이블 하나를 OUTPUT_DIR의 CSV 파일로 내보내기"""
     OUTPUT_DIR.mkdir(exist_ok=True)
     filepath = OUTPUT_DIR / filename
+    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+        _write_csv(f, columns, rows)
+    return filepath
+
+
+def export_posts_csv(posts, filename='posts.csv'):
+    """게시글 데이터를 CSV로 내보내기"""
+    post_rows = build_post_rows(posts)
+    filepath = _export_csv(filename, POST_COLUMNS, post_rows)
     
-    fieldnames = [
-        'comment_id', 'post_id', 'post_url', 'author',
-        'content', 'created_at', 'like_count'
-    ]
+    print(f"게시글 CSV 저장: {filepath} ({len(post_rows)}개)")
+    return filepath
+
+
+def export_comments_csv(posts, filename='comments.csv'):
+    """댓글 데이터를 CSV로 내보내기"""
+    comment_rows = build_comment_rows(posts)
+    filepath = _export_csv(filename, COMMENT_COLUMNS, comment_rows)
     
-    comment_id = 0
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for post_id, post in enumerate(posts, 1):
-            for comment in post.get('comments', []):
-                comment_id += 1
-                row = {
-                    'comment_id': comment_id,
-                    'post_id': post_id,
-                    'post_url': post.get('url', ''),
-                    'author': comment.get('author', ''),
-                    'content': comment.get('content', '')[:500],  # 길이 제한
-                    'created_at': comment.get('created_at', '')[:10] if comment.get('created_at') else '',
-                    'like_count': comment.get('like_count', 0)
-                }
-                writer.writerow(row)
-    
-    print(f"댓글 CSV 저장: {filepath} ({comment_id}개)")
+    print(f"댓글 CSV 저장: {filepath} ({len(comment_rows)}개)")
     return filepath
 
 
 def export_summary_csv(posts, filename='summary.csv'):
     """요약 통계 CSV 내보내기"""
+    summary_rows = build_summary_rows(posts)
+    filepath = _export_csv(filename, SUMMARY_COLUMNS, summary_rows)
+    
+    print(f"요약 CSV 저장: {filepath}")
+    return filepath
+
+
+def write_csv_tables(posts, posts_file, comments_file, summary_file):
+    """게시글/댓글/요약 CSV를 파일 객체에 쓰기
+    
+    Args:
+        posts: 게시글 목록
+        posts_file, comments_file, summary_file: 텍스트 모드 파일 객체 (newline='')
+        
+    Returns:
+        내보낸 댓글 수
+    """
+    post_rows, comment_rows, summary_rows = build_tables(posts)
+    
+    _write_csv(posts_file, POST_COLUMNS, post_rows)
+    _write_csv(comments_file, COMMENT_COLUMNS, comment_rows)
+    _write_csv(summary_file, SUMMARY_COLUMNS, summary_rows)
+    
+    return len(comment_rows)
+
+
+def export_all(posts, posts_filename='posts.csv', comments_filename='comments.csv',
+               summary_filename='summary.csv'):
+    """게시글/댓글/요약 CSV를 한 번의 순회로 내보내기
+    
+    세 파일을 동시에 열어 두고 write_csv_tables로 한 번에 기록한다.
+    """
+    global _last_export
     OUTPUT_DIR.mkdir(exist_ok=True)
-    filepath = OUTPUT_DIR / filename
+    posts_path = OUTPUT_DIR / posts_filename
+    comments_path = OUTPUT_DIR / comments_filename
+    summary_path = OUTPUT_DIR / summary_filename
     
-    # 사이트별 통계
-    site_stats = {}
-    for post in posts:
-        site = post.get('site', 'unknown')
-        if site not in site_stats:
-            site_stats[site] = {
-                'post_count': 0,
-                'total_views': 0,
-                'total_likes': 0,
-                'total_comments': 0
-            }
-        site_stats[site]['post_count'] += 1
-        site_stats[site]['total_views'] += post.get('view_count', 0)
-        site_stats[site]['total_likes'] += post.get('like_count', 0)
-        site_stats[site]['total_comments'] += len(post.get('comments', []))
-    
-    fieldnames = ['site', 'post_count', 'total_views', 'total_likes', 'total_comments']
+    with ExitStack() as stack:
+        files = [
+            stack.enter_context(open(path, 'w', newline='', encoding='utf-8-sig'))
+            for path in (posts_path, comments_path, summary_path)
+        ]
+        comment_count = write_csv_tables(posts, *files)
     
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    _last_export = (posts_path, comments_path, summary_path)
+    
+    print(f"게시글 CSV 저장: {posts_path} ({len(posts)}개)")
+    print(f"댓글 CSV 저장: {comments_path} ({comment_count}개)")
+    print(f"요약 CSV 저장: {summary_path}")
+    return posts_path, comments_path, summary_path
+
+
+def write_parquet_tables(posts, posts_file, comments_file, summary_file):
+    """게시글/댓글/요약 테이블을 Parquet로 쓰기 (pyarrow 필요)
+    
+    build_tables의 행을 컬럼으로 바꿔 pyarrow 테이블로 변환한 뒤 snappy 압축 Parquet로 저장한다.
+    
+    Args:
+        posts: 게시글 목록
+        posts_file, comments_file, summary_file: 파일 경로 또는 바이너리 파일 객체
+        
+    Returns:
+        내보낸 댓글 수
         
-        for site, stats in site_stats.items():
-            row = {'site': site, **stats}
-            writer.writerow(row)
+    Raises:
+        ImportError: pyarrow가 설치되지 않은 경우
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
     
-    print(f"요약 CSV 저장: {filepath}")
-    return filepath
+    post_rows, comment_rows, summary_rows = build_tables(posts)
+    
+    for columns, rows, target in ((POST_COLUMNS, post_rows, posts_file),
+                                  (COMMENT_COLUMNS, comment_rows, comments_file),
+                                  (SUMMARY_COLUMNS, summary_rows, summary_file)):
+        # 행 튜플 목록 -> 컬럼별 리스트 (행이 없으면 빈 컬럼)
+        values = list(zip(*rows)) or [()] * len(columns)
+        table = pa.table({name: list(column) for name, column in zip(columns, values)})
+        pq.write_table(table, target, compression='snappy')
+    
+    return len(comment_rows)
+
+
+def export_all_parquet(posts, posts_filename='posts.parquet', comments_filename='comments.parquet',
+                       summary_filename='summary.parquet'):
+    """게시글/댓글/요약 테이블을 Parquet 파일로 내보내기 (pyarrow 필요)
+    
+    Returns:
+        생성된 파일 경로 튜플 (pyarrow가 없으면 None)
+    """
+    global _last_export
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    posts_path = OUTPUT_DIR / posts_filename
+    comments_path = OUTPUT_DIR / comments_filename
+    summary_path = OUTPUT_DIR / summary_filename
+    
+    try:
+        comment_count = write_parquet_tables(posts, posts_path, comments_path, summary_path)
+    except ImportError:
+        print("pyarrow가 설치되지 않았습니다. pip install pyarrow")
+        return None
+    _last_export = (posts_path, comments_path, summary_path)
+    
+    print(f"게시글 Parquet 저장: {posts_path} ({len(posts)}개)")
+    print(f"댓글 Parquet 저장: {comments_path} ({comment_count}개)")
+    print(f"요약 Parquet 저장: {summary_path}")
+    return posts_path, comments_path, summary_path
+
+
+def export_to_buffers(posts):
+    """게시글/댓글/요약 테이블을 메모리 버퍼로 내보내기
+    
+    EXPORT_FORMAT이 parquet이고 pyarrow가 있으면 Parquet, 아니면 CSV로 만든다.
+    
+    Returns:
+        {파일 이름: BytesIO} 딕셔너리
+    """
+    names = ('posts', 'comments', 'summary')
+    
+    if EXPORT_FORMAT == 'parquet':
+        buffers = {f"{name}.parquet": io.BytesIO() for name in names}
+        try:
+            write_parquet_tables(posts, *buffers.values())
+            return buffers
+        except ImportError:
+            print("pyarrow가 설치되지 않았습니다. CSV로 내보냅니다.")
+    
+    buffers = {f"{name}.csv": io.BytesIO() for name in names}
+    text_files = [io.TextIOWrapper(buffer, encoding='utf-8-sig', newline='') for buffer in buffers.values()]
+    write_csv_tables(posts, *text_files)
+    for text_file in text_files:
+        text_file.detach()  # flush 후 분리 (BytesIO는 닫지 않음)
+    return buffers
+
+
+def exported_files():
+    """마지막 내보내기 결과 파일 목록
+    
+    이 프로세스에서 export_all 또는 export_all_parquet가 마지막으로 생성한 파일만 반환한다.
+    이전에 다른 형식으로 내보낸 파일이나 이 스크립트가 만들지 않은 파일은 포함하지 않는다.
+    """
+    return list(_last_export)
 
 
 def upload_to_s3(bucket_name, prefix='crawl_data'):
-    """S3에 업로드 (boto3 필요)"""
+    """마지막 내보내기 결과 파일을 S3에 업로드 (boto3 필요)"""
+    files = exported_files()
+    if not files:
+        print("업로드할 파일이 없습니다. 먼저 export_all 또는 export_all_parquet를 실행하세요.")
+        return False
+    
+    try:
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        
+        s3 = boto3.client('s3')
+        # 큰 파일은 멀티파트로 나눠 동시에 업로드
+        config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True
+        )
+        
+        def upload(export_file):
+            key = f"{prefix}/{export_file.name}"
+            s3.upload_file(str(export_file), bucket_name, key, Config=config)
+            return key
+        
+        # 파일 단위 업로드도 스레드 풀에서 병렬 처리
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            for key in executor.map(upload, files):
+                print(f"S3 업로드 완료: s3://{bucket_name}/{key}")
+        
+        return True
+    except ImportError:
+        print("boto3가 설치되지 않았습니다. pip install boto3")
+        return False
+    except Exception as e:
+        print(f"S3 업로드 실패: {e}")
+        return False
+
+
+def export_to_s3(posts, bucket_name, prefix='crawl_data'):
+    """디스크를 거치지 않고 메모리에서 바로 S3에 업로드 (boto3 필요)"""
     try:
         import boto3
         
         s3 = boto3.client('s3')
+        buffers = export_to_buffers(posts)
         
-        for csv_file in OUTPUT_DIR.glob('*.csv'):
-            key = f"{prefix}/{csv_file.name}"
-            s3.upload_file(str(csv_file), bucket_name, key)
-            print(f"S3 업로드 완료: s3://{bucket_name}/{key}")
+        def upload(item):
+            name, buffer = item
+            key = f"{prefix}/{name}"
+            s3.put_object(Bucket=bucket_name, Key=key, Body=buffer.getvalue())
+            return key
+        
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            for key in executor.map(upload, buffers.items()):
+                print(f"S3 업로드 완료: s3://{bucket_name}/{key}")
         
         return True
     except ImportError:
@@ -172,24 +424,36 @@ def main():
         print("내보낼 데이터가 없습니다.")
         return
     
-    # CSV 내보내기
-    print("\nCSV 파일 생성 중...")
-    export_posts_csv(posts)
-    export_comments_csv(posts)
-    export_summary_csv(posts)
+    # S3 버킷이 지정되면 로컬 파일 없이 바로 업로드
+    if S3_BUCKET:
+        print(f"\nS3 직접 업로드 중: s3://{S3_BUCKET}/{S3_PREFIX}")
+        export_to_s3(posts, S3_BUCKET, S3_PREFIX)
+        return
+    
+    # Parquet 내보내기 (pyarrow가 없거나 EXPORT_FORMAT=csv이면 CSV로 내보내기)
+    exported = None
+    if EXPORT_FORMAT == 'parquet':
+        print("\nParquet 파일 생성 중...")
+        exported = export_all_parquet(posts)
+    if exported is None:
+        if EXPORT_FORMAT == 'parquet':
+            print("Parquet 대신 CSV로 내보냅니다.")
+        print("\nCSV 파일 생성 중...")
+        export_all(posts)
     
     print("\n" + "="*60)
     print("QuickSight 연동 방법")
     print("="*60)
     print("""
 1. S3에 업로드:
-   - quicksight_data/ 폴더의 CSV 파일들을 S3 버킷에 업로드
+   - quicksight_data/ 폴더의 Parquet(또는 CSV) 파일들을 S3 버킷에 업로드
    - 또는 이 스크립트에서 upload_to_s3('your-bucket-name') 호출
+   - QUICKSIGHT_S3_BUCKET 환경 변수를 지정하면 로컬 파일 없이 바로 업로드
 
 2. QuickSight에서 데이터셋 생성:
    - QuickSight 콘솔 → 데이터셋 → 새 데이터셋
    - S3 선택 → 매니페스트 파일 또는 직접 S3 경로 지정
-   - posts.csv, comments.csv 각각 데이터셋으로 추가
+   - posts, comments 파일을 각각 데이터셋으로 추가
 
 3. 분석 생성:
    - 새 분석 → 데이터셋 선택
@@ -205,7 +469,7 @@ def main():
 """)
     
     print(f"\n생성된 파일:")
-    for f in OUTPUT_DIR.glob('*.csv'):
+    for f in exported_files():
         print(f"  - {f}")
 
 
@@ -4,8 +4,15 @@
 특정 URL을 직접 크롤링하여 파서가 제대로 동작하는지 확인한다.
 """
 
-import json
 import logging
+from pathlib import Path
+from urllib.parse import urlparse
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from crawler import CrawlerOrchestrator, CrawlerConfig
 from crawler.content_crawler import ContentCrawler
 from crawler.parsers.base import ParserRegistry
@@ -18,16 +25,48 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# 파서 직접 테스트용 HTTP 세션 (연결 재사용 및 재시도)
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# 전용 파서가 있는 도메인 (서브도메인 포함)
+SUPPORTED_DOMAINS = frozenset(
+    InvenParser.SUPPORTED_DOMAINS + RuliwebParser.SUPPORTED_DOMAINS + DCInsideParser.SUPPORTED_DOMAINS
+)
+
+
+def is_supported_url(url: str) -> bool:
+    """전용 파서가 있는 사이트의 URL인지 확인"""
+    domain = urlparse(url).netloc.lower()
+    return domain in SUPPORTED_DOMAINS or any(domain.endswith('.' + d) for d in SUPPORTED_DOMAINS)
+
+
 def test_single_url(url: str, keyword: str = "테스트"):
     """단일 URL 크롤링 테스트"""
     print(f"\n{'='*60}")
     print(f"URL 크롤링 테스트: {url}")
     print('='*60)
     
+    # 전용 파서가 없는 URL은 크롤러를 만들기 전에 건너뜀
+    if not is_supported_url(url):
+        print(f"\n✗ 지원하지 않는 사이트입니다: {urlparse(url).netloc or url}")
+        print(f"  지원 도메인: {', '.join(sorted(SUPPORTED_DOMAINS))}")
+        return
+    
     config = CrawlerConfig(
         output_dir="data",
         default_delay=1.0,
-        jitter_range=(0.1, 0.5)
+        jitter_range=(0.1, 0.5),
+        respect_robots_txt=True
     )
     
     crawler = ContentCrawler(config)
@@ -63,8 +102,9 @@ def test_single_url(url: str, keyword: str = "테스트"):
             
             # JSON으로 저장
             output_file = "data/test_crawl_result.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(post.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+            Path(output_file).write_bytes(
+                orjson.dumps(post.to_dict(), option=orjson.OPT_INDENT_2, default=str)
+            )
             print(f"\n결과가 {output_file}에 저장되었습니다.")
             
         else:
@@ -78,11 +118,15 @@ def test_single_url(url: str, keyword: str = "테스트"):
         crawler.close()
 
 
+def fetch_html(url: str, timeout: float = 30) -> str:
+    """공유 세션으로 HTML 다운로드 (UTF-8로 디코딩)"""
+    response = _SESSION.get(url, timeout=timeout)
+    response.encoding = 'utf-8'
+    return response.text
+
+
 def test_parser_directly(url: str, html_content: str = None):
     """파서 직접 테스트 (HTML 내용이 있는 경우)"""
-    from urllib.parse import urlparse
-    import requests
-    
     print(f"\n{'='*60}")
     print(f"파서 직접 테스트: {url}")
     print('='*60)
@@ -101,12 +145,7 @@ def test_parser_directly(url: str, html_content: str = None):
     # HTML 가져오기
     if html_content is None:
         print("HTML 다운로드 중...")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.encoding = 'utf-8'
-        html_content = response.text
+        html_content = fetch_html(url)
         print(f"HTML 크기: {len(html_content)} bytes")
     
     # 파싱
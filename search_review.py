@@ -1,10 +1,20 @@
+import asyncio
 import os
 import json
 import re
+import shelve
 import boto3
+import orjson
 import time
+from itertools import islice
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from botocore.config import Config
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
 from dotenv import load_dotenv
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException, TimeoutException
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 load_dotenv()
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
@@ -14,11 +24,21 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
     raise ValueError("환경 변수(AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)가 설정되지 않았습니다.")
 
+# keep-alive 커넥션 재사용 + 적응형 재시도 (스로틀링은 _call_bedrock의 tenacity 재시도가 추가로 처리)
+BEDROCK_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 4},
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
 bedrock = boto3.client(
     service_name='bedrock-runtime',
     region_name=AWS_REGION,
     aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    config=BEDROCK_CLIENT_CONFIG
 )
 
 def extract_json_from_text(text):
@@ -27,7 +47,45 @@ def extract_json_from_text(text):
         return match.group(0)
     return None
 
+BEDROCK_RETRY_CODES = frozenset({
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+})
+
+KEYWORD_CACHE_PATH = "data/bedrock_kw.cache"  # 게임별 키워드 캐시 (shelve)
+KEYWORD_CACHE_TTL = 7 * 24 * 3600  # 캐시 유효 기간 (초)
+
+
 def generate_keywords(game_name="몬스터헌터"):
+    # 같은 게임에 대해서는 캐시된 Bedrock 응답 재사용
+    os.makedirs(os.path.dirname(KEYWORD_CACHE_PATH), exist_ok=True)
+    with shelve.open(KEYWORD_CACHE_PATH) as db:
+        cached = db.get(game_name)
+        if cached and time.time() - cached[0] < KEYWORD_CACHE_TTL:
+            return cached[1]
+        keywords = _call_bedrock(game_name)
+        db[game_name] = (time.time(), keywords)
+        return keywords
+
+
+def _is_bedrock_throttled(exc):
+    # Bedrock 스로틀링/일시적 서버 오류만 재시도
+    if isinstance(exc, (ReadTimeoutError, EndpointConnectionError)):
+        return True
+    if isinstance(exc, ClientError):
+        return exc.response.get("Error", {}).get("Code") in BEDROCK_RETRY_CODES
+    return False
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception(_is_bedrock_throttled),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+def _call_bedrock(game_name):
     prompt = f"""
     다음 게임 '{game_name}'에 대한 리뷰를 검색하려고 하는데 한국 웹사이트에서 어떤 검색 키워드로 검색하면 잘 나올 지 5개 생성해줘. 반드시 5개를 생성해
     참고로 해당 게임의 은어로 쓰이는 단어도 고려해줘. 리뷰라는 단어 뿐 아니라 후기, 비평 등의 단어도 섞어서 생성해줘 
@@ -38,71 +96,138 @@ def generate_keywords(game_name="몬스터헌터"):
     """
     response = bedrock.invoke_model(
         modelId='amazon.nova-pro-v1:0',
-        body=json.dumps({
+        body=orjson.dumps({
             "messages": [{"role": "user", "content": [{"text": prompt}]}]
         }),
         contentType='application/json',
         accept='application/json'
     )
-    result = json.loads(response['body'].read().decode('utf-8'))
+    result = orjson.loads(response['body'].read())
     raw_text = result["output"]["message"]["content"][0]["text"]
     json_text = extract_json_from_text(raw_text)
     if json_text:
-        return json.loads(json_text).get("keywords", [])
+        return orjson.loads(json_text).get("keywords", [])
     raise ValueError("Bedrock 응답에서 JSON 데이터를 찾을 수 없음.")
 
+SEARCH_CONCURRENCY = 5  # 동시에 검색할 최대 사이트 수
+SEARCH_HOST = "duckduckgo.com"  # 모든 사이트 검색이 요청하는 호스트
+HOST_MIN_INTERVAL = 1.5  # 검색 호스트에 대한 최소 요청 간격 (초)
+
+
+def _build_keyword_matcher(keywords):
+    # 키워드 소문자 변환과 조합 문자열은 검색당 한 번만 만든다
+    lowered = [(kw, kw.lower()) for kw in keywords]
+    all_keywords = " AND ".join(keywords)  # 전체 키워드 조합
+    default_keyword = keywords[0] if keywords else ""
+
+    def match_keyword(title, content):
+        title_lower = title.lower()
+        content_lower = content.lower()
+        text = title_lower + content_lower
+        # 모든 키워드가 포함된 결과만 필터링
+        if all(kw_lower in text for _, kw_lower in lowered):
+            return all_keywords
+        # 하나라도 매핑되면 해당 키워드 사용
+        return next((kw for kw, kw_lower in lowered if kw_lower in title_lower or kw_lower in content_lower), default_keyword)
+
+    return match_keyword
+
+
+def _canonical_url(url):
+    # 중복 판정용 URL (fragment와 utm_* 추적 파라미터 제거)
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.startswith("utm_")])
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception_type((RatelimitException, TimeoutException)),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+def _search_ddgs(query, max_results):
+    # DDGS 인스턴스는 스레드 간 공유하지 않는다
+    # 제너레이터를 반환하는 버전에서는 필요한 개수만큼만 받고 중단
+    with DDGS() as ddgs:
+        return list(islice(ddgs.text(query, max_results=max_results), max_results))
+
+
+async def _search_site(site, keywords, match_keyword, num_results_per_query, semaphore, next_request_at):
+    # AND 연산자로 키워드 결합 (따옴표 제거)
+    keyword_query = " AND ".join(keywords)
+    query = f"{keyword_query} site:{site}"
+    site_reviews = []
+
+    async with semaphore:
+        # 사이트는 달라도 요청은 모두 DuckDuckGo로 가므로 호스트 기준으로 간격 유지
+        now = time.monotonic()
+        start_at = max(now, next_request_at[SEARCH_HOST])
+        next_request_at[SEARCH_HOST] = start_at + HOST_MIN_INTERVAL
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+        print(f"{site}에서 검색 중 (DuckDuckGo): {query}")
+        try:
+            results = await asyncio.to_thread(_search_ddgs, query, num_results_per_query)
+            if not results:
+                print(f"경고: '{query}'에 대한 결과 없음")
+            else:
+                print(f"DuckDuckGo '{query}' 응답 일부:", json.dumps(results[:2], ensure_ascii=False, indent=2))
+
+                for result in results:
+                    url = result["href"]
+                    title = result["title"]
+                    content = result["body"]
+                    site_reviews.append({
+                        "url": url,
+                        "date": "날짜 없음",
+                        "title": title,
+                        "content": content,
+                        "comment": None,
+                        "source": "duckduckgo",
+                        "keyword": match_keyword(title, content),
+                        "site": site
+                    })
+        except Exception as e:
+            print(f"검색 에러: {e} - 쿼리: {query}")
+
+    return site_reviews
+
+
+async def _search_sites(sites, keywords, num_results_per_query):
+    semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+    next_request_at = {SEARCH_HOST: 0.0}
+    match_keyword = _build_keyword_matcher(keywords)
+    site_results = await asyncio.gather(*(
+        _search_site(site, keywords, match_keyword, num_results_per_query, semaphore, next_request_at)
+        for site in sites
+    ))
+    # 여러 사이트 검색에서 중복으로 나온 URL은 처음 나온 결과만 유지
+    reviews = []
+    seen_urls = set()
+    for site_reviews in site_results:
+        for review in site_reviews:
+            url_key = _canonical_url(review["url"])
+            if url_key in seen_urls:
+                continue
+            seen_urls.add(url_key)
+            reviews.append(review)
+    return reviews
+
+
 def crawl_game_reviews(keywords, num_results_per_query=5, additional_sites=None):
     try:
         print("검색 시작...")
-        reviews = []
         default_sites = ["naver.com", "inven.co.kr", "dcinside.com"]
         sites = default_sites + (additional_sites if additional_sites else [])
         sites = list(dict.fromkeys(sites))[:5]  # 최대 5개 유지
 
-        with DDGS() as ddgs:
-            for site in sites:
-                # AND 연산자로 키워드 결합 (따옴표 제거)
-                keyword_query = " AND ".join(keywords)
-                query = f"{keyword_query} site:{site}"
-                print(f"{site}에서 검색 중 (DuckDuckGo): {query}")
-
-                try:
-                    results = list(ddgs.text(query, max_results=num_results_per_query))
-                    if not results:
-                        print(f"경고: '{query}'에 대한 결과 없음")
-                        continue
-
-                    print(f"DuckDuckGo '{query}' 응답 일부:", json.dumps(results[:2], ensure_ascii=False, indent=2))
-
-                    for result in results:
-                        url = result["href"]
-                        title = result["title"]
-                        content = result["body"]
-                        # 모든 키워드가 포함된 결과만 필터링
-                        if all(kw.lower() in (title.lower() + content.lower()) for kw in keywords):
-                            matched_keyword = " AND ".join(keywords)  # 전체 키워드 조합
-                        else:
-                            # 하나라도 매핑되면 해당 키워드 사용
-                            matched_keyword = next((kw for kw in keywords if kw.lower() in title.lower() or kw.lower() in content.lower()), keywords[0])
-
-                        reviews.append({
-                            "url": url,
-                            "date": "날짜 없음",
-                            "title": title,
-                            "content": content,
-                            "comment": None,
-                            "source": "duckduckgo",
-                            "keyword": matched_keyword,
-                            "site": site
-                        })
-                except Exception as e:
-                    print(f"검색 에러: {e} - 쿼리: {query}")
-                
-                time.sleep(5)  # 사이트별 5초 대기
+        # 사이트별 검색을 동시에 수행 (결과는 사이트 순서 유지)
+        reviews = asyncio.run(_search_sites(sites, keywords, num_results_per_query))
 
         output_file = "data/game_reviews_keywords_with_sites.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(reviews, f, ensure_ascii=False, indent=2)
+        Path(output_file).write_bytes(orjson.dumps(reviews, option=orjson.OPT_INDENT_2))
 
         print(f"검색 완료! 결과가 {output_file}에 저장되었습니다.")
         print(f"총 {len(reviews)}개의 리뷰 수집됨.")
@@ -8,13 +8,22 @@ Requirements: 1.1
 - 기존 인터페이스 유지하면서 새 기능 적용
 """
 
+import io
 import os
 import json
-import re
+import time
+import shelve
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from functools import cached_property
+from operator import attrgetter
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 
 import boto3
+import orjson
+from botocore.config import Config
 from dotenv import load_dotenv
 
 from crawler import (
@@ -37,6 +46,130 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+# 결과/캐시 저장 디렉토리 (모듈 로드 시 한 번만 생성)
+_DATA_DIR = Path("data")
+_DATA_DIR.mkdir(exist_ok=True)
+
+KEYWORD_CACHE_PATH = "data/bedrock_keywords.cache"  # 키워드 디스크 캐시 (shelve)
+KEYWORD_CACHE_TTL = 7 * 24 * 3600  # 캐시 유효 기간 (초)
+
+CRAWL_CACHE_PATH = "data/crawl_results.cache"  # 크롤링 결과 디스크 캐시 (shelve)
+CRAWL_CACHE_TTL = 3600  # 크롤링 결과 캐시 유효 기간 (초)
+
+KEYWORD_MODEL_ID = "amazon.nova-pro-v1:0"  # 키워드 생성 모델
+
+# 키워드 생성 고정 지시문 (게임 이름/키워드 수는 user 메시지로 전달)
+KEYWORD_SYSTEM_PROMPT = """
+다음 게임에 대한 리뷰를 검색하려고 하는데 한국 웹사이트에서 어떤 검색 키워드로 검색하면 잘 나올 지 주어진 키워드 수만큼 생성해줘. 반드시 주어진 키워드 수만큼 생성해
+참고로 해당 게임의 은어로 쓰이는 단어도 고려해줘. 리뷰라는 단어 뿐 아니라 후기, 비평 등의 단어도 섞어서 생성해줘
+결과를 반드시 JSON 형식으로 반환해줘:
+{
+  "keywords": ["키워드1", "키워드2", ...]
+}
+"""
+
+# Bedrock 클라이언트 설정 (적응형 재시도 + keep-alive 커넥션 풀)
+BEDROCK_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 4},
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+# 동일 설정의 Bedrock 클라이언트 공유 ((리전, Access Key ID, Secret) -> 클라이언트)
+_CLIENTS: Dict[Tuple[str, str, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# 프로세스 내 키워드 캐시 (캐시 키 -> 키워드 목록)
+_KEYWORD_MEMO: Dict[str, List[str]] = {}
+
+
+def _keyword_cache_key(game_name: str, num_keywords: int) -> str:
+    """키워드 캐시 키 생성
+    
+    Args:
+        game_name: 게임 이름
+        num_keywords: 생성할 키워드 수
+        
+    Returns:
+        (정규화된 게임 이름, 키워드 수)의 blake2b 해시
+    """
+    raw = f"{game_name.lower().strip()}|{num_keywords}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _crawl_cache_key(
+    keywords: List[str],
+    sites: List[str],
+    num_results_per_site: int,
+    config: CrawlerConfig
+) -> str:
+    """크롤링 결과 캐시 키 생성
+    
+    게시글의 keyword는 첫 번째 키워드를, 게시글 순서는 사이트 순서를 따르므로
+    키워드/사이트 목록은 순서를 유지한 채 키에 포함한다.
+    수집 결과에 영향을 주는 크롤러 설정도 키에 포함한다. (API 키 값 대신 사용 여부만 포함)
+    
+    Args:
+        keywords: 검색 키워드 목록
+        sites: 대상 사이트 목록
+        num_results_per_site: 사이트당 최대 결과 수
+        config: 크롤러 설정
+        
+    Returns:
+        (키워드 목록, 사이트 목록, 결과 수, 크롤러 설정)의 blake2b 해시
+    """
+    raw = orjson.dumps([
+        list(keywords),
+        list(sites),
+        num_results_per_site,
+        config.relevance_threshold,
+        config.max_comment_pages,
+        config.respect_robots_txt,
+        bool(config.google_api_key and config.google_cse_id),
+    ])
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _scan_json(text: str) -> Optional[str]:
+    """텍스트에서 첫 번째 JSON 객체 추출
+    
+    정규식 대신 한 번의 순회로 중괄호 깊이와 문자열 구간을 추적한다.
+    
+    Args:
+        text: 원본 텍스트
+        
+    Returns:
+        첫 번째로 닫히는 JSON 객체 문자열 또는 None
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_str = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
 class BedrockKeywordGenerator:
     """Bedrock을 사용한 키워드 생성기
     
@@ -66,13 +199,23 @@ class BedrockKeywordGenerator:
                 "환경 변수(AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)를 설정하거나 "
                 "생성자에 직접 전달하세요."
             )
-        
-        self.client = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=self.aws_region,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key
-        )
+    
+    @cached_property
+    def client(self) -> Any:
+        """Bedrock Runtime 클라이언트 (첫 사용 시 생성, 동일 설정 인스턴스 간 공유)"""
+        key = (self.aws_region, self.aws_access_key_id, self.aws_secret_access_key)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = boto3.session.Session().client(
+                    service_name='bedrock-runtime',
+                    region_name=self.aws_region,
+                    aws_access_key_id=self.aws_access_key_id,
+                    aws_secret_access_key=self.aws_secret_access_key,
+                    config=BEDROCK_CLIENT_CONFIG
+                )
+                _CLIENTS[key] = client
+        return client
     
     def _extract_json_from_text(self, text: str) -> Optional[str]:
         """텍스트에서 JSON 추출
@@ -83,10 +226,7 @@ class BedrockKeywordGenerator:
         Returns:
             추출된 JSON 문자열 또는 None
         """
-        match = re.search(r"\{.*\}", text, re.DOTALL)
-        if match:
-            return match.group(0)
-        return None
+        return _scan_json(text)
     
     def generate_keywords(
         self, 
@@ -105,30 +245,77 @@ class BedrockKeywordGenerator:
         Raises:
             ValueError: Bedrock 응답에서 JSON을 찾을 수 없는 경우
         """
-        prompt = f"""
-        다음 게임 '{game_name}'에 대한 리뷰를 검색하려고 하는데 한국 웹사이트에서 어떤 검색 키워드로 검색하면 잘 나올 지 {num_keywords}개 생성해줘. 반드시 {num_keywords}개를 생성해
-        참고로 해당 게임의 은어로 쓰이는 단어도 고려해줘. 리뷰라는 단어 뿐 아니라 후기, 비평 등의 단어도 섞어서 생성해줘 
-        결과를 반드시 JSON 형식으로 반환해줘:
-        {{
-          "keywords": ["키워드1", "키워드2", ...]
-        }}
-        """
+        # 같은 (게임, 키워드 수) 조합은 프로세스 내 캐시 → 디스크 캐시 순으로 재사용
+        key = _keyword_cache_key(game_name, num_keywords)
+        if key in _KEYWORD_MEMO:
+            return list(_KEYWORD_MEMO[key])
+        
+        with shelve.open(KEYWORD_CACHE_PATH) as db:
+            cached = db.get(key)
+            if cached and time.time() - cached["ts"] < KEYWORD_CACHE_TTL:
+                keywords = cached["keywords"]
+            else:
+                keywords = self._request_keywords(game_name, num_keywords)
+                db[key] = {"keywords": keywords, "ts": time.time()}
         
-        response = self.client.invoke_model(
-            modelId='amazon.nova-pro-v1:0',
-            body=json.dumps({
-                "messages": [{"role": "user", "content": [{"text": prompt}]}]
-            }),
-            contentType='application/json',
-            accept='application/json'
+        _KEYWORD_MEMO[key] = keywords
+        return list(keywords)
+    
+    def _request_keywords(self, game_name: str, num_keywords: int) -> List[str]:
+        """Bedrock에 키워드 생성 요청
+        
+        Args:
+            game_name: 게임 이름
+            num_keywords: 생성할 키워드 수
+            
+        Returns:
+            생성된 키워드 목록
+            
+        Raises:
+            ValueError: Bedrock 응답에서 JSON을 찾을 수 없는 경우
+        """
+        # 고정 지시문은 system 블록 + cachePoint로 보내 Bedrock 프롬프트 캐시를 재사용하고
+        # 게임 이름/키워드 수만 user 메시지로 전달
+        response = self.client.converse_stream(
+            modelId=KEYWORD_MODEL_ID,
+            system=[
+                {"text": KEYWORD_SYSTEM_PROMPT},
+                {"cachePoint": {"type": "default"}},
+            ],
+            messages=[{
+                "role": "user",
+                "content": [{"text": f"게임: {game_name}, 키워드 수: {num_keywords}"}],
+            }],
         )
         
-        result = json.loads(response['body'].read().decode('utf-8'))
-        raw_text = result["output"]["message"]["content"][0]["text"]
+        # 스트리밍으로 받으면서 JSON 객체가 완성되는 즉시 반환 (나머지 생성은 기다리지 않음)
+        stream = response["stream"]
+        buffer = io.StringIO()
+        decoder = json.JSONDecoder()
+        try:
+            for event in stream:
+                if "contentBlockDelta" in event:
+                    text = event["contentBlockDelta"]["delta"].get("text", "")
+                    buffer.write(text)
+                    if "}" not in text:
+                        continue
+                    raw_text = buffer.getvalue()
+                    start = raw_text.find("{")
+                    if start == -1:
+                        continue
+                    try:
+                        data, _ = decoder.raw_decode(raw_text, start)
+                    except ValueError:
+                        continue
+                    return data.get("keywords", [])
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
         
-        json_text = self._extract_json_from_text(raw_text)
+        json_text = self._extract_json_from_text(buffer.getvalue())
         if json_text:
-            return json.loads(json_text).get("keywords", [])
+            return orjson.loads(json_text).get("keywords", [])
         
         raise ValueError("Bedrock 응답에서 JSON 데이터를 찾을 수 없음.")
 
@@ -163,6 +350,10 @@ class EnhancedGameReviewCrawler:
         self.config = config or CrawlerConfig()
         self.orchestrator = CrawlerOrchestrator(self.config)
         self._keyword_generator = keyword_generator
+        
+        # 크롤링 결과 캐시 적중/미스 횟수
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     @property
     def keyword_generator(self) -> BedrockKeywordGenerator:
@@ -193,7 +384,9 @@ class EnhancedGameReviewCrawler:
         sites: Optional[List[str]] = None,
         num_results_per_site: int = 10,
         output_format: str = "json",
-        save_results: bool = True
+        save_results: bool = True,
+        parallel: bool = True,
+        use_cache: bool = False
     ) -> CrawlResult:
         """게임 리뷰 크롤링
         
@@ -202,12 +395,17 @@ class EnhancedGameReviewCrawler:
         - 댓글 데이터 함께 수집
         - 관련성 필터링 적용
         
+        use_cache가 True이면 같은 (키워드, 사이트, 결과 수, 크롤러 설정) 조합은
+        CRAWL_CACHE_TTL 동안 캐시된 결과를 반환한다. (save_results면 캐시된 결과도 저장)
+        
         Args:
             keywords: 검색 키워드 목록
             sites: 대상 사이트 목록 (없으면 기본 사이트 사용)
             num_results_per_site: 사이트당 최대 결과 수
             output_format: 출력 형식 ("json" 또는 "csv")
             save_results: 결과 저장 여부
+            parallel: 도메인별 병렬 크롤링 여부
+            use_cache: 크롤링 결과 캐시 사용 여부 (기본값: 사용 안 함)
             
         Returns:
             CrawlResult: 크롤링 결과
@@ -215,19 +413,45 @@ class EnhancedGameReviewCrawler:
         if sites is None:
             sites = self.DEFAULT_SITES.copy()
         
-        logger.info(f"게임 리뷰 크롤링 시작: keywords={keywords}, sites={sites}")
+        if use_cache:
+            key = _crawl_cache_key(keywords, sites, num_results_per_site, self.config)
+            with shelve.open(CRAWL_CACHE_PATH) as db:
+                cached = db.get(key)
+            
+            if cached and time.time() - cached["ts"] < CRAWL_CACHE_TTL:
+                self._cache_hits += 1
+                result = cached["result"]
+                self.orchestrator.get_data_store().add_posts(result.posts)
+                if save_results and result.posts:
+                    self.orchestrator._save_results(result.posts, output_format)
+                logger.info(
+                    "캐시된 크롤링 결과 사용: %d개 게시글 (적중 %d/%d)",
+                    result.total_crawled, self._cache_hits,
+                    self._cache_hits + self._cache_misses
+                )
+                return result
+            
+            self._cache_misses += 1
+        
+        logger.info("게임 리뷰 크롤링 시작: keywords=%s, sites=%s", keywords, sites)
         
         result = self.orchestrator.crawl(
             keywords=keywords,
             sites=sites,
             max_results_per_site=num_results_per_site,
             save_results=save_results,
-            output_format=output_format
+            output_format=output_format,
+            parallel=parallel
         )
         
+        # 게시글을 수집한 경우에만 캐시 (실패한 크롤링은 다음 호출에서 재시도)
+        if use_cache and result.posts:
+            with shelve.open(CRAWL_CACHE_PATH) as db:
+                db[key] = {"result": result, "ts": time.time()}
+        
         logger.info(
-            f"크롤링 완료: {result.total_crawled}개 게시글, "
-            f"{sum(len(p.comments) for p in result.posts)}개 댓글 수집"
+            "크롤링 완료: %d개 게시글, %d개 댓글 수집",
+            result.total_crawled, result.total_comments
         )
         
         return result
@@ -297,6 +521,49 @@ class EnhancedGameReviewCrawler:
         return False
 
 
+# 리뷰 변환에 사용하는 PostContent 속성 (기존 형식 필드 순서)
+_REVIEW_FIELDS = attrgetter(
+    "url", "created_at", "title", "body", "comments",
+    "keyword", "site", "author", "view_count", "like_count"
+)
+
+
+REVIEWS_OUTPUT_FILE = "data/game_reviews_keywords_with_sites.json"  # 기존 형식 결과 파일
+_DEFAULT_SITES = ("inven.co.kr", "ruliweb.com", "dcinside.com")  # 기존 인터페이스 기본 사이트
+_MAX_SITES = 5  # 기존 인터페이스 최대 사이트 수
+
+
+def _write_reviews(output_file: str, reviews: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """리뷰를 하나씩 직렬화하며 파일에 기록
+    
+    전체 목록을 한 번에 직렬화하지 않고 리뷰 단위로 기록한다.
+    .jsonl 경로면 한 줄에 리뷰 하나(NDJSON), 그 외에는 들여쓰기된 JSON 배열로 저장한다.
+    
+    Args:
+        output_file: 저장 경로
+        reviews: 리뷰 딕셔너리 iterable
+        
+    Returns:
+        기록한 리뷰 목록
+    """
+    written: List[Dict[str, Any]] = []
+    with open(output_file, "wb") as f:
+        if output_file.endswith(".jsonl"):
+            for review in reviews:
+                f.write(orjson.dumps(review, option=orjson.OPT_APPEND_NEWLINE))
+                written.append(review)
+            return written
+        
+        # orjson.dumps(리뷰 목록, OPT_INDENT_2)와 동일한 형식
+        # (문자열 안의 개행은 \n으로 이스케이프되므로 줄 단위 들여쓰기가 안전함)
+        for review in reviews:
+            f.write(b",\n  " if written else b"[\n  ")
+            f.write(orjson.dumps(review, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            written.append(review)
+        f.write(b"\n]" if written else b"[]")
+    return written
+
+
 # 기존 인터페이스 호환 함수들
 def generate_keywords(game_name: str = "몬스터헌터") -> List[str]:
     """키워드 생성 (기존 인터페이스 호환)
@@ -314,7 +581,8 @@ def generate_keywords(game_name: str = "몬스터헌터") -> List[str]:
 def crawl_game_reviews(
     keywords: List[str],
     num_results_per_query: int = 5,
-    additional_sites: Optional[List[str]] = None
+    additional_sites: Optional[List[str]] = None,
+    output_file: str = REVIEWS_OUTPUT_FILE
 ) -> List[Dict[str, Any]]:
     """게임 리뷰 크롤링 (기존 인터페이스 호환)
     
@@ -324,13 +592,20 @@ def crawl_game_reviews(
         keywords: 검색 키워드 목록
         num_results_per_query: 쿼리당 최대 결과 수
         additional_sites: 추가 사이트 목록
+        output_file: 결과 저장 경로 (.jsonl이면 NDJSON으로 저장)
         
     Returns:
         리뷰 데이터 목록 (기존 형식)
     """
-    default_sites = ["inven.co.kr", "ruliweb.com", "dcinside.com"]
-    sites = default_sites + (additional_sites if additional_sites else [])
-    sites = list(dict.fromkeys(sites))[:5]  # 중복 제거 및 최대 5개
+    sites = list(_DEFAULT_SITES)
+    if additional_sites:
+        # 중복 제거 및 최대 5개
+        seen = set(_DEFAULT_SITES)
+        for site in additional_sites:
+            if site not in seen:
+                seen.add(site)
+                sites.append(site)
+        sites = sites[:_MAX_SITES]
     
     crawler = EnhancedGameReviewCrawler()
     
@@ -342,31 +617,32 @@ def crawl_game_reviews(
             save_results=True
         )
         
-        # 기존 형식으로 변환
-        reviews = []
-        for post in result.posts:
-            review = {
-                "url": post.url,
-                "date": post.created_at.isoformat() if post.created_at else "날짜 없음",
-                "title": post.title,
-                "content": post.body,
-                "comment": [c.content for c in post.comments] if post.comments else None,
+        # 기존 형식으로 변환 (게시글당 속성 조회는 한 번의 attrgetter 호출로 처리)
+        reviews = (
+            {
+                "url": url,
+                "date": created_at.isoformat() if created_at else "날짜 없음",
+                "title": title,
+                "content": body,
+                "comment": tuple(c.content for c in comments) or None,
                 "source": "enhanced_crawler",
-                "keyword": post.keyword,
-                "site": post.site,
+                "keyword": keyword,
+                "site": site,
                 # 새로운 필드들
-                "author": post.author,
-                "view_count": post.view_count,
-                "like_count": post.like_count,
-                "comment_count": len(post.comments)
+                "author": author,
+                "view_count": view_count,
+                "like_count": like_count,
+                "comment_count": len(comments)
             }
-            reviews.append(review)
+            for (url, created_at, title, body, comments, keyword, site,
+                 author, view_count, like_count) in map(_REVIEW_FIELDS, result.posts)
+        )
         
-        # 결과 저장 (기존 형식)
-        output_file = "data/game_reviews_keywords_with_sites.json"
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(reviews, f, ensure_ascii=False, indent=2)
+        # 결과 저장 (기존 형식, 변환하면서 리뷰 단위로 기록)
+        output_dir = os.path.dirname(output_file)
+        if output_dir and Path(output_dir) != _DATA_DIR:
+            os.makedirs(output_dir, exist_ok=True)
+        reviews = _write_reviews(output_file, reviews)
         
         print(f"검색 완료! 결과가 {output_file}에 저장되었습니다.")
         print(f"총 {len(reviews)}개의 리뷰 수집됨.")
@@ -381,7 +657,7 @@ if __name__ == "__main__":
     try:
         # 키워드 생성
         keywords = generate_keywords("몬스터헌터")[:5]
-        print("기본 사이트:", ["inven.co.kr", "ruliweb.com", "dcinside.com"])
+        print("기본 사이트:", list(_DEFAULT_SITES))
         print("생성된 키워드:", keywords)
         
         # 추가 사이트
@@ -1,38 +1,68 @@
+import asyncio
 import json
 import time
 from duckduckgo_search import DDGS
 
+SEARCH_CONCURRENCY = 5  # 동시 검색 수
+SEARCH_HOST = "duckduckgo.com"
+HOST_MIN_INTERVAL = 1.0  # 같은 호스트에 대한 최소 요청 간격 (초)
+
+
+def _search_text(query):
+    # DDGS 인스턴스는 스레드 간 공유하지 않는다
+    with DDGS() as ddgs:
+        return list(ddgs.text(query, max_results=5, region='kr-kr'))
+
+
+async def _search_keyword(keyword, semaphore, next_request_at):
+    query = f"{keyword} 리뷰"
+    async with semaphore:
+        # 같은 호스트에 대한 직전 요청과 간격이 짧을 때만 대기
+        now = time.monotonic()
+        start_at = max(now, next_request_at[SEARCH_HOST])
+        next_request_at[SEARCH_HOST] = start_at + HOST_MIN_INTERVAL
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+        print(f"검색 중: {query}")
+        try:
+            search_results = await asyncio.to_thread(_search_text, query)
+        except Exception as e:
+            print(f"  - 검색 실패: {e}")
+            return []
+
+    print(f"  - {len(search_results)}개 결과 수집")
+    return [
+        {
+            "url": result["href"],
+            "title": result["title"],
+            "content": result["body"],
+            "keyword": keyword
+        }
+        for result in search_results
+    ]
+
+
+async def _search_keywords(keywords):
+    semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+    next_request_at = {SEARCH_HOST: 0.0}
+    keyword_results = await asyncio.gather(*(
+        _search_keyword(keyword, semaphore, next_request_at) for keyword in keywords
+    ))
+    return [result for results in keyword_results for result in results]
+
+
 def simple_crawl_test():
     """간단한 DuckDuckGo 검색 테스트"""
     try:
         print("DuckDuckGo 검색 테스트 시작...")
-        results = []
         
         # 몬스터헌터 관련 검색
         keywords = ["몬스터헌터", "몬헌"]
         sites = ["naver.com", "inven.co.kr", "dcinside.com"]
         
-        with DDGS() as ddgs:
-            for keyword in keywords:
-                query = f"{keyword} 리뷰"
-                print(f"검색 중: {query}")
-                
-                try:
-                    search_results = list(ddgs.text(query, max_results=5, region='kr-kr'))
-                    
-                    for result in search_results:
-                        results.append({
-                            "url": result["href"],
-                            "title": result["title"],
-                            "content": result["body"],
-                            "keyword": keyword
-                        })
-                    
-                    print(f"  - {len(search_results)}개 결과 수집")
-                    time.sleep(2)  # 요청 간 대기
-                    
-                except Exception as e:
-                    print(f"  - 검색 실패: {e}")
+        # 키워드별 검색을 동시에 수행 (결과는 키워드 순서 유지)
+        results = asyncio.run(_search_keywords(keywords))
         
         # 결과 저장
         output_file = "data/simple_crawl_results.json"
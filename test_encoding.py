@@ -1,76 +1,102 @@
 """인코딩 테스트"""
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 모듈 전체에서 재사용하는 HTTP 세션 (keep-alive 연결 풀)
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.3)))
+
+
+def _cls(name):
+    """CSS 클래스 선택자(.name)에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _compile(selectors):
+    """(CSS 선택자, XPath) 목록을 미리 컴파일된 (CSS 선택자, XPath) 목록으로 변환"""
+    return [(css, etree.XPath(xpath)) for css, xpath in selectors]
+
+
+# 제목 선택자 (CSS 선택자 -> 동일한 XPath, 모듈 로드 시 한 번만 컴파일)
+TITLE_XPATHS = _compile([
+    ('.board_main .subject_text', f"//*[{_cls('board_main')}]//*[{_cls('subject_text')}]"),
+    ('.subject_inner_text', f"//*[{_cls('subject_inner_text')}]"),
+    ('h1.subject', f"//h1[{_cls('subject')}]"),
+    ('.view_title', f"//*[{_cls('view_title')}]"),
+    ('.article_title', f"//*[{_cls('article_title')}]"),
+    ('h1', "//h1"),
+    ('.subject', f"//*[{_cls('subject')}]"),
+    ('.board_main_top .subject', f"//*[{_cls('board_main_top')}]//*[{_cls('subject')}]"),
+    ('span.subject_text', f"//span[{_cls('subject_text')}]"),
+])
+
+# 본문 선택자
+BODY_XPATHS = _compile([
+    ('.board_main .view_content', f"//*[{_cls('board_main')}]//*[{_cls('view_content')}]"),
+    ('.board_main_view .content', f"//*[{_cls('board_main_view')}]//*[{_cls('content')}]"),
+    ('.article_content', f"//*[{_cls('article_content')}]"),
+    ('.view_content', f"//*[{_cls('view_content')}]"),
+    ('.source_url + div', f"//*[{_cls('source_url')}]/following-sibling::*[1][self::div]"),
+])
+
+# 작성자 선택자
+AUTHOR_XPATHS = _compile([
+    ('.board_main .user_info .nick', f"//*[{_cls('board_main')}]//*[{_cls('user_info')}]//*[{_cls('nick')}]"),
+    ('.board_main_top .nick', f"//*[{_cls('board_main_top')}]//*[{_cls('nick')}]"),
+    ('.user_view .nick', f"//*[{_cls('user_view')}]//*[{_cls('nick')}]"),
+    ('.writer .nick', f"//*[{_cls('writer')}]//*[{_cls('nick')}]"),
+    ('.nickname', f"//*[{_cls('nickname')}]"),
+    ('.user_info a', f"//*[{_cls('user_info')}]//a"),
+])
+
+# 강제로 utf-8로 파싱하는 lxml 파서
+UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+# 요소 안의 텍스트 노드 (get_text처럼 script/style/template 내용과 주석은 제외)
+TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+
+def first_text(tree, xpath):
+    """XPath에 처음 일치하는 요소의 공백 제거 텍스트 (select_one + get_text(strip=True)와 동일)"""
+    elems = xpath(tree)
+    if not elems:
+        return ''
+    return ''.join(s.strip() for s in TEXT_XPATH(elems[0]))
+
 
 url = 'https://bbs.ruliweb.com/ps/board/300007/read/2339632'
-headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
 
-response = requests.get(url, headers=headers, timeout=30)
+response = SESSION.get(url, timeout=30)
 
 print(f'Status: {response.status_code}')
 print(f'Content-Type: {response.headers.get("Content-Type")}')
-print(f'apparent_encoding: {response.apparent_encoding}')
 print(f'encoding: {response.encoding}')
 
-# 강제로 utf-8 설정
-response.encoding = 'utf-8'
-html = response.text
-
-soup = BeautifulSoup(html, 'lxml')
+# 원본 바이트를 utf-8로 바로 파싱 (BeautifulSoup 트리 변환 생략)
+tree = lxml_html.fromstring(response.content, parser=UTF8_PARSER)
 
 # 제목 찾기
 print("\n=== 제목 찾기 ===")
-title_selectors = [
-    '.board_main .subject_text',
-    '.subject_inner_text', 
-    'h1.subject',
-    '.view_title',
-    '.article_title',
-    'h1',
-    '.subject',
-    '.board_main_top .subject',
-    'span.subject_text'
-]
-
-for selector in title_selectors:
-    elem = soup.select_one(selector)
-    if elem:
-        text = elem.get_text(strip=True)
-        if text:
-            print(f'{selector}: {text[:100]}')
+for selector, xpath in TITLE_XPATHS:
+    text = first_text(tree, xpath)
+    if text:
+        print(f'{selector}: {text[:100]}')
 
 # 본문 찾기
 print("\n=== 본문 찾기 ===")
-body_selectors = [
-    '.board_main .view_content',
-    '.board_main_view .content',
-    '.article_content',
-    '.view_content',
-    '.source_url + div'
-]
-
-for selector in body_selectors:
-    elem = soup.select_one(selector)
-    if elem:
-        text = elem.get_text(strip=True)
-        if text:
-            print(f'{selector}: {text[:200]}...')
-            break
+for selector, xpath in BODY_XPATHS:
+    text = first_text(tree, xpath)
+    if text:
+        print(f'{selector}: {text[:200]}...')
+        break
 
 # 작성자 찾기
 print("\n=== 작성자 찾기 ===")
-author_selectors = [
-    '.board_main .user_info .nick',
-    '.board_main_top .nick',
-    '.user_view .nick',
-    '.writer .nick',
-    '.nickname',
-    '.user_info a'
-]
-
-for selector in author_selectors:
-    elem = soup.select_one(selector)
-    if elem:
-        text = elem.get_text(strip=True)
-        if text:
-            print(f'{selector}: {text}')
+for selector, xpath in AUTHOR_XPATHS:
+    text = first_text(tree, xpath)
+    if text:
+        print(f'{selector}: {text}')
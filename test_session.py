@@ -1,11 +1,14 @@
 """세션 테스트"""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 url = 'https://bbs.ruliweb.com/ps/board/300007/read/2339632'
 
-# 세션 사용
-session = requests.Session()
-session.headers.update({
+# 세션 사용 (모듈 전역으로 두고 이후 요청에서도 연결 풀 재사용)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.3)))
+SESSION.headers.update({
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
@@ -13,7 +16,7 @@ session.headers.update({
     'Connection': 'keep-alive',
 })
 
-response = session.get(url, timeout=30)
+response = SESSION.get(url, timeout=30)
 print(f'Status: {response.status_code}')
 print(f'Content-Encoding: {response.headers.get("Content-Encoding")}')
 print(f'encoding: {response.encoding}')
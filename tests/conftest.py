@@ -0,0 +1,19 @@
+"""
+pytest 공통 설정
+
+Hypothesis 프로파일
+- dev: 로컬 반복 실행용 (예제 20개, 기본값)
+- ci: 전체 검증용 (예제 100개)
+
+HYPOTHESIS_PROFILE 환경 변수로 선택한다. (예: HYPOTHESIS_PROFILE=ci pytest tests)
+@settings에 max_examples를 직접 지정한 테스트는 프로파일과 관계없이 지정값을 사용한다.
+"""
+
+import os
+
+from hypothesis import settings
+
+
+settings.register_profile("dev", max_examples=20)
+settings.register_profile("ci", max_examples=100)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
@@ -8,11 +8,15 @@ For any 이슈에 대해 24시간 내 관련 게시글이 10개 이상이면
 긴급 알림으로 분류되어야 한다.
 """
 
+import dataclasses
+
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck, assume
+from hypothesis import given, strategies as st
 from datetime import datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
+from crawler.analysis import alert_manager as alert_manager_module
 from crawler.analysis.alert_manager import (
     AlertManager, 
     Alert, 
@@ -25,159 +29,74 @@ from crawler.models.analysis_models import (
     IssueSeverity,
     TrendPoint
 )
-from crawler.models.data_models import PostContent, Comment
+from crawler.models.data_models import PostContent
 
 
-# Custom strategies for generating test data
-@st.composite
-def post_content_strategy(draw, created_at: datetime = None):
-    """PostContent 객체 생성 전략"""
-    keywords = ["업데이트", "버그", "오류", "패치", "이벤트", "보상", "밸런스", "캐릭터"]
-    
-    title_words = draw(st.lists(
-        st.sampled_from(keywords),
-        min_size=1,
-        max_size=5
-    ))
-    body_words = draw(st.lists(
-        st.sampled_from(keywords),
-        min_size=1,
-        max_size=20
-    ))
-    
-    if created_at is None:
-        # 최근 48시간 내 랜덤 시간
-        hours_ago = draw(st.integers(min_value=0, max_value=48))
-        created_at = datetime.now() - timedelta(hours=hours_ago)
-    
-    post_id = draw(st.integers(min_value=1, max_value=100000))
-    
-    return PostContent(
-        url=f"https://example.com/post/{post_id}",
-        title=" ".join(title_words),
-        body=" ".join(body_words),
-        site="test_site",
-        keyword="test_keyword",
-        author="test_author",
-        created_at=created_at,
-        view_count=draw(st.integers(min_value=0, max_value=100000)),
-        like_count=draw(st.integers(min_value=0, max_value=10000)),
-        comments=[]
-    )
+# 테스트 기준 시간 (고정값이므로 같은 입력이면 항상 같은 PostContent가 생성됨)
+_TEST_EPOCH = datetime(2024, 1, 1)
 
+# 0~72시간 timedelta 테이블 (게시글 생성 시 매번 timedelta를 만들지 않도록)
+_HOUR_DELTAS = tuple(timedelta(hours=h) for h in range(73))
 
-@st.composite
-def recent_post_strategy(draw):
-    """최근 24시간 내 게시글 생성 전략"""
-    hours_ago = draw(st.integers(min_value=0, max_value=23))
-    created_at = datetime.now() - timedelta(hours=hours_ago)
-    return draw(post_content_strategy(created_at=created_at))
-
-
-@st.composite
-def old_post_strategy(draw):
-    """24시간 이전 게시글 생성 전략"""
-    hours_ago = draw(st.integers(min_value=25, max_value=72))
-    created_at = datetime.now() - timedelta(hours=hours_ago)
-    return draw(post_content_strategy(created_at=created_at))
-
-
-@st.composite
-def keyword_cluster_strategy(draw):
-    """KeywordCluster 객체 생성 전략"""
-    keywords = draw(st.lists(
-        st.text(min_size=2, max_size=10, alphabet="가나다라마바사아자차카타파하"),
-        min_size=1,
-        max_size=5,
-        unique=True
-    ))
-    assume(len(keywords) >= 1)
-    
-    return KeywordCluster(
-        cluster_id=f"cluster_{draw(st.integers(min_value=1, max_value=1000))}",
-        keywords=keywords,
-        representative=keywords[0],
-        post_count=draw(st.integers(min_value=0, max_value=100)),
-        total_views=draw(st.integers(min_value=0, max_value=100000)),
-        total_comments=draw(st.integers(min_value=0, max_value=1000))
+
+# 긴급 알림 테스트용 게시글 원형 (url, created_at만 바꿔서 복사해 사용, comments 리스트는 공유됨)
+_PROTO = PostContent(
+    url="",
+    title="버그 발생",
+    body="게임에서 버그가 발생했습니다",
+    site="test_site",
+    keyword="test",
+    created_at=_TEST_EPOCH,
+    view_count=100
+)
+
+
+def _fast_post(i: int, created_at: datetime, kind: str = "post") -> PostContent:
+    """_PROTO를 복사해 URL(https://example.com/{kind}/{i})과 작성일만 바꾼 게시글 생성"""
+    return dataclasses.replace(
+        _PROTO,
+        url=f"https://example.com/{kind}/{i}",
+        created_at=created_at
     )
 
 
-@st.composite
-def detected_issue_with_posts_strategy(draw, post_urls: List[str]):
-    """관련 게시글 URL이 있는 DetectedIssue 생성 전략"""
-    cluster = draw(keyword_cluster_strategy())
+@lru_cache(maxsize=None)
+def _build_posts(num_recent: int, num_old: int) -> Tuple[PostContent, ...]:
+    """최근 게시글 num_recent개와 24시간 이전 게시글 num_old개 생성 (개수 조합별 캐시)
     
-    return DetectedIssue(
-        issue_id=f"issue_{draw(st.integers(min_value=1, max_value=10000))}",
-        title=cluster.representative,
-        cluster=cluster,
-        priority_score=draw(st.floats(min_value=0.0, max_value=1.0)),
-        is_hot=False,
-        is_bug=draw(st.booleans()),
-        severity=draw(st.sampled_from(list(IssueSeverity))),
-        related_posts=post_urls,
-        first_seen=datetime.now(),
-        sentiment_avg=draw(st.floats(min_value=-1.0, max_value=1.0))
+    created_at은 _TEST_EPOCH 기준이므로 같은 개수 조합은 항상 같은 게시글을 반환한다.
+    classify_urgent_alert는 입력을 변경하지 않으므로 예제 간에 공유해도 안전하다.
+    """
+    recent_posts = tuple(
+        _fast_post(i, _TEST_EPOCH - _HOUR_DELTAS[i % 24], "recent")  # 0~23시간 전
+        for i in range(num_recent)
+    )
+    old_posts = tuple(
+        _fast_post(i, _TEST_EPOCH - _HOUR_DELTAS[25 + i], "old")  # 25시간 이상 전
+        for i in range(num_old)
     )
+    return recent_posts + old_posts
 
 
-class TestUrgentAlertClassification:
-    """
-    **Feature: game-analytics-dashboard, Property 19: Urgent Alert Classification**
-    **Validates: Requirements 8.4**
+# (최근 게시글 수, 이전 게시글 수, hours, min_posts) -> classify_urgent_alert 결과
+_cache = {}
+
+
+def _classify_posts(
+    manager: AlertManager,
+    num_recent: int,
+    num_old: int,
+    hours: int = 24,
+    min_posts: int = 10
+) -> bool:
+    """_build_posts 게시글 전체를 관련 게시글로 하는 이슈의 긴급 여부 (개수 조합별 캐시)
     
-    For any 이슈에 대해 24시간 내 관련 게시글이 10개 이상이면 
-    긴급 알림으로 분류되어야 한다.
+    _build_posts와 마찬가지로 입력이 개수 조합만으로 결정되므로,
+    Hypothesis가 shrink/replay로 같은 조합을 다시 시도하면 저장된 결과를 반환한다.
     """
-    
-    @given(
-        num_recent_posts=st.integers(min_value=10, max_value=30),
-        num_old_posts=st.integers(min_value=0, max_value=10)
-    )
-    @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
-    def test_urgent_alert_when_10_or_more_recent_posts(
-        self, 
-        num_recent_posts: int, 
-        num_old_posts: int
-    ):
-        """24시간 내 10개 이상 게시글이 있으면 긴급 알림으로 분류되는지 검증"""
-        manager = AlertManager()
-        
-        # 최근 24시간 내 게시글 생성
-        recent_posts = []
-        for i in range(num_recent_posts):
-            hours_ago = i % 24  # 0~23시간 전
-            created_at = datetime.now() - timedelta(hours=hours_ago)
-            post = PostContent(
-                url=f"https://example.com/recent/{i}",
-                title="버그 발생",
-                body="게임에서 버그가 발생했습니다",
-                site="test_site",
-                keyword="test",
-                created_at=created_at,
-                view_count=100
-            )
-            recent_posts.append(post)
-        
-        # 24시간 이전 게시글 생성
-        old_posts = []
-        for i in range(num_old_posts):
-            hours_ago = 25 + i  # 25시간 이상 전
-            created_at = datetime.now() - timedelta(hours=hours_ago)
-            post = PostContent(
-                url=f"https://example.com/old/{i}",
-                title="버그 발생",
-                body="게임에서 버그가 발생했습니다",
-                site="test_site",
-                keyword="test",
-                created_at=created_at,
-                view_count=100
-            )
-            old_posts.append(post)
-        
-        all_posts = recent_posts + old_posts
-        all_urls = [p.url for p in all_posts]
+    key = (num_recent, num_old, hours, min_posts)
+    if key not in _cache:
+        all_posts = _build_posts(num_recent, num_old)
         
         # 이슈 생성 (모든 게시글을 관련 게시글로 설정)
         issue = DetectedIssue(
@@ -190,119 +109,99 @@ class TestUrgentAlertClassification:
                 post_count=len(all_posts)
             ),
             priority_score=0.8,
-            related_posts=all_urls
+            related_posts=[p.url for p in all_posts]
         )
         
-        # 긴급 알림 분류 확인
-        is_urgent = manager.classify_urgent_alert(
+        _cache[key] = manager.classify_urgent_alert(
             posts=all_posts,
             issue=issue,
-            hours=24,
-            min_posts=10
+            hours=hours,
+            min_posts=min_posts
         )
-        
-        assert is_urgent is True, \
-            f"Should be urgent with {num_recent_posts} recent posts (>= 10)"
+    return _cache[key]
+
+
+class _FrozenDatetime(datetime):
+    """now()가 항상 _TEST_EPOCH를 반환하는 datetime"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return _TEST_EPOCH
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_clock():
+    """AlertManager의 현재 시간을 _TEST_EPOCH로 고정
+    
+    Hypothesis 테스트에서는 함수 스코프 monkeypatch를 쓸 수 없으므로 모듈 스코프로 적용한다.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(alert_manager_module, "datetime", _FrozenDatetime)
+        yield
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """모듈 전체에서 공유하는 AlertManager (테스트에서 상태를 변경하지 않음)"""
+    return AlertManager()
+
+
+class TestUrgentAlertClassification:
+    """
+    **Feature: game-analytics-dashboard, Property 19: Urgent Alert Classification**
+    **Validates: Requirements 8.4**
+    
+    For any 이슈에 대해 24시간 내 관련 게시글이 10개 이상이면 
+    긴급 알림으로 분류되어야 한다.
+    """
     
     @given(
-        num_recent_posts=st.integers(min_value=0, max_value=9),
+        num_recent_posts=st.integers(min_value=0, max_value=30),
         num_old_posts=st.integers(min_value=0, max_value=20)
     )
-    @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
-    def test_not_urgent_when_less_than_10_recent_posts(
+    def test_urgent_iff_10_or_more_recent_posts(
         self, 
+        manager: AlertManager,
         num_recent_posts: int, 
         num_old_posts: int
     ):
-        """24시간 내 10개 미만 게시글이면 긴급 알림이 아닌지 검증"""
-        manager = AlertManager()
-        
-        # 최근 24시간 내 게시글 생성
-        recent_posts = []
-        for i in range(num_recent_posts):
-            hours_ago = i % 24
-            created_at = datetime.now() - timedelta(hours=hours_ago)
-            post = PostContent(
-                url=f"https://example.com/recent/{i}",
-                title="버그 발생",
-                body="게임에서 버그가 발생했습니다",
-                site="test_site",
-                keyword="test",
-                created_at=created_at,
-                view_count=100
-            )
-            recent_posts.append(post)
-        
-        # 24시간 이전 게시글 생성
-        old_posts = []
-        for i in range(num_old_posts):
-            hours_ago = 25 + i
-            created_at = datetime.now() - timedelta(hours=hours_ago)
-            post = PostContent(
-                url=f"https://example.com/old/{i}",
-                title="버그 발생",
-                body="게임에서 버그가 발생했습니다",
-                site="test_site",
-                keyword="test",
-                created_at=created_at,
-                view_count=100
-            )
-            old_posts.append(post)
-        
-        all_posts = recent_posts + old_posts
-        all_urls = [p.url for p in all_posts]
+        """24시간 내 게시글이 10개 이상일 때만 긴급 알림으로 분류되는지 검증"""
+        expected_urgent = num_recent_posts >= 10
         
-        issue = DetectedIssue(
-            issue_id="issue_1",
-            title="버그",
-            cluster=KeywordCluster(
-                cluster_id="cluster_1",
-                keywords=["버그"],
-                representative="버그",
-                post_count=len(all_posts)
-            ),
-            priority_score=0.8,
-            related_posts=all_urls
-        )
-        
-        is_urgent = manager.classify_urgent_alert(
-            posts=all_posts,
-            issue=issue,
-            hours=24,
-            min_posts=10
-        )
+        # 긴급 알림 분류 확인 (24시간 이전 게시글은 개수에 포함되지 않음)
+        is_urgent = _classify_posts(manager, num_recent_posts, num_old_posts)
         
-        assert is_urgent is False, \
-            f"Should NOT be urgent with {num_recent_posts} recent posts (< 10)"
+        assert is_urgent is expected_urgent, \
+            f"urgent={is_urgent} with {num_recent_posts} recent posts (expected {expected_urgent})"
+    
+    @pytest.mark.parametrize("num_recent_posts,expected_urgent", [(10, True), (9, False)])
+    def test_urgent_threshold_boundary(
+        self,
+        manager: AlertManager,
+        num_recent_posts: int,
+        expected_urgent: bool
+    ):
+        """경계값 검증: 최근 게시글 10개는 긴급, 9개는 긴급이 아님 (이전 게시글이 많아도 동일)"""
+        assert _classify_posts(manager, num_recent_posts, 20) is expected_urgent
     
     @given(
         hours=st.integers(min_value=1, max_value=72),
         min_posts=st.integers(min_value=1, max_value=20)
     )
-    @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
     def test_urgent_classification_respects_parameters(
         self, 
+        manager: AlertManager,
         hours: int, 
         min_posts: int
     ):
         """긴급 알림 분류가 파라미터를 올바르게 적용하는지 검증"""
-        manager = AlertManager()
+        now = _TEST_EPOCH
         
         # 정확히 min_posts 개의 게시글을 hours 시간 내에 생성
-        posts = []
-        for i in range(min_posts):
-            hours_ago = i % hours if hours > 0 else 0
-            created_at = datetime.now() - timedelta(hours=hours_ago)
-            post = PostContent(
-                url=f"https://example.com/post/{i}",
-                title="테스트",
-                body="테스트 본문",
-                site="test_site",
-                keyword="test",
-                created_at=created_at,
-                view_count=100
-            )
-            posts.append(post)
+        posts = [
+            _fast_post(i, now - _HOUR_DELTAS[i % hours if hours > 0 else 0])
+            for i in range(min_posts)
+        ]
         
         issue = DetectedIssue(
             issue_id="issue_1",
@@ -328,10 +227,8 @@ class TestUrgentAlertClassification:
         assert is_urgent is True, \
             f"Should be urgent with exactly {min_posts} posts in {hours} hours"
     
-    def test_empty_posts_not_urgent(self):
+    def test_empty_posts_not_urgent(self, manager: AlertManager):
         """빈 게시글 목록은 긴급 알림이 아닌지 검증"""
-        manager = AlertManager()
-        
         issue = DetectedIssue(
             issue_id="issue_1",
             title="테스트",
@@ -351,22 +248,11 @@ class TestUrgentAlertClassification:
         
         assert is_urgent is False
     
-    def test_issue_without_related_posts_not_urgent(self):
+    def test_issue_without_related_posts_not_urgent(self, manager: AlertManager):
         """관련 게시글이 없는 이슈는 긴급 알림이 아닌지 검증"""
-        manager = AlertManager()
+        now = _TEST_EPOCH
         
-        posts = [
-            PostContent(
-                url=f"https://example.com/post/{i}",
-                title="테스트",
-                body="테스트",
-                site="test",
-                keyword="test",
-                created_at=datetime.now(),
-                view_count=100
-            )
-            for i in range(20)
-        ]
+        posts = [_fast_post(i, now) for i in range(20)]
         
         issue = DetectedIssue(
             issue_id="issue_1",
@@ -387,37 +273,15 @@ class TestUrgentAlertClassification:
         
         assert is_urgent is False
     
-    def test_count_posts_in_period_accuracy(self):
+    def test_count_posts_in_period_accuracy(self, manager: AlertManager):
         """기간 내 게시글 수 계산이 정확한지 검증"""
-        manager = AlertManager()
+        now = _TEST_EPOCH
         
         # 12시간 전 게시글 5개
-        recent_posts = [
-            PostContent(
-                url=f"https://example.com/recent/{i}",
-                title="테스트",
-                body="테스트",
-                site="test",
-                keyword="test",
-                created_at=datetime.now() - timedelta(hours=12),
-                view_count=100
-            )
-            for i in range(5)
-        ]
+        recent_posts = [_fast_post(i, now - _HOUR_DELTAS[12], "recent") for i in range(5)]
         
         # 36시간 전 게시글 5개
-        old_posts = [
-            PostContent(
-                url=f"https://example.com/old/{i}",
-                title="테스트",
-                body="테스트",
-                site="test",
-                keyword="test",
-                created_at=datetime.now() - timedelta(hours=36),
-                view_count=100
-            )
-            for i in range(5)
-        ]
+        old_posts = [_fast_post(i, now - _HOUR_DELTAS[36], "old") for i in range(5)]
         
         all_posts = recent_posts + old_posts
         
@@ -442,23 +306,11 @@ class TestUrgentAlertClassification:
         assert count == 5, f"Expected 5 recent posts, got {count}"
     
     @given(num_posts=st.integers(min_value=10, max_value=30))
-    @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
-    def test_urgent_alert_has_correct_properties(self, num_posts: int):
+    def test_urgent_alert_has_correct_properties(self, manager: AlertManager, num_posts: int):
         """긴급 알림이 올바른 속성을 가지는지 검증"""
-        manager = AlertManager()
+        now = _TEST_EPOCH
         
-        posts = [
-            PostContent(
-                url=f"https://example.com/post/{i}",
-                title="버그 발생",
-                body="게임에서 버그가 발생했습니다",
-                site="test_site",
-                keyword="test",
-                created_at=datetime.now() - timedelta(hours=i % 24),
-                view_count=100
-            )
-            for i in range(num_posts)
-        ]
+        posts = [_fast_post(i, now - _HOUR_DELTAS[i % 24]) for i in range(num_posts)]
         
         issue = DetectedIssue(
             issue_id="issue_1",
@@ -493,10 +345,8 @@ class TestUrgentAlertClassification:
 class TestHotIssueAlert:
     """Hot Issue 알림 생성 테스트"""
     
-    def test_hot_issue_alert_creation(self):
+    def test_hot_issue_alert_creation(self, manager: AlertManager):
         """Hot Issue 알림이 올바르게 생성되는지 검증"""
-        manager = AlertManager()
-        
         issue = DetectedIssue(
             issue_id="issue_1",
             title="업데이트 문제",
@@ -522,10 +372,8 @@ class TestHotIssueAlert:
         assert alert.game_id == "test_game"
         assert alert.related_issue_id == issue.issue_id
     
-    def test_bug_hot_issue_has_higher_priority(self):
+    def test_bug_hot_issue_has_higher_priority(self, manager: AlertManager):
         """버그 관련 Hot Issue가 더 높은 우선순위를 가지는지 검증"""
-        manager = AlertManager()
-        
         bug_issue = DetectedIssue(
             issue_id="bug_issue",
             title="버그",
@@ -549,10 +397,8 @@ class TestHotIssueAlert:
 class TestSentimentSpikeAlert:
     """부정적 감성 급증 알림 테스트"""
     
-    def test_sentiment_spike_alert_creation(self):
+    def test_sentiment_spike_alert_creation(self, manager: AlertManager):
         """부정적 감성 급증 알림이 올바르게 생성되는지 검증"""
-        manager = AlertManager()
-        
         spike_point = TrendPoint(
             date=datetime.now(),
             value=-0.5,
@@ -570,11 +416,8 @@ class TestSentimentSpikeAlert:
         assert alert.game_id == "test_game"
     
     @given(sentiment_value=st.floats(min_value=-1.0, max_value=-0.3))
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
-    def test_sentiment_spike_priority_based_on_severity(self, sentiment_value: float):
+    def test_sentiment_spike_priority_based_on_severity(self, manager: AlertManager, sentiment_value: float):
         """감성 급증 심각도에 따른 우선순위 검증"""
-        manager = AlertManager()
-        
         spike_point = TrendPoint(
             date=datetime.now(),
             value=sentiment_value,
@@ -598,10 +441,8 @@ class TestSentimentSpikeAlert:
 class TestAlertSummary:
     """알림 요약 테스트"""
     
-    def test_empty_alerts_summary(self):
+    def test_empty_alerts_summary(self, manager: AlertManager):
         """빈 알림 목록의 요약 검증"""
-        manager = AlertManager()
-        
         summary = manager.get_alerts_summary([])
         
         assert summary["total_alerts"] == 0
@@ -610,10 +451,8 @@ class TestAlertSummary:
         assert summary["sentiment_spike_count"] == 0
         assert summary["top_alert"] is None
     
-    def test_alerts_summary_counts(self):
+    def test_alerts_summary_counts(self, manager: AlertManager):
         """알림 요약의 카운트가 정확한지 검증"""
-        manager = AlertManager()
-        
         alerts = [
             Alert(
                 alert_id="1",
@@ -7,9 +7,9 @@ Requirements: 1.1
 """
 
 import pytest
+import gzip
+import json
 import os
-import shutil
-import tempfile
 from datetime import datetime
 
 from crawler.exporters.analysis_store import AnalysisDataStore
@@ -25,11 +25,9 @@ from crawler.models.analysis_models import (
 
 
 @pytest.fixture
-def temp_dir():
-    """임시 디렉토리 생성 및 정리"""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    """임시 디렉토리 (pytest tmp_path, 정리는 pytest가 담당)"""
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -38,9 +36,9 @@ def analysis_store(temp_dir):
     return AnalysisDataStore(base_dir=temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis_result():
-    """샘플 분석 결과 생성"""
+    """샘플 분석 결과 생성 (모듈 전체에서 공유, 테스트에서 변경하지 않음)"""
     cluster = KeywordCluster(
         cluster_id="cluster-001",
         keywords=["버그", "오류", "에러"],
@@ -133,6 +131,10 @@ class TestAnalysisDataStoreSaveLoad:
         assert loaded_issue.is_hot == original_issue.is_hot
         assert loaded_issue.is_bug == original_issue.is_bug
         assert loaded_issue.severity == original_issue.severity
+        
+        # issues/hot_issues/bug_issues에 중복 저장된 같은 이슈는 하나의 객체로 복원
+        assert loaded.hot_issues[0] is loaded_issue
+        assert loaded.bug_issues[0] is loaded_issue
     
     def test_save_and_load_trend_data(self, analysis_store, sample_analysis_result):
         """트렌드 데이터 저장/로드 검증"""
@@ -147,6 +149,32 @@ class TestAnalysisDataStoreSaveLoad:
         assert loaded.sentiment_trend.period == sample_analysis_result.sentiment_trend.period
         assert len(loaded.sentiment_trend.data_points) == len(sample_analysis_result.sentiment_trend.data_points)
     
+    def test_saved_file_is_gzip_compressed(self, analysis_store, sample_analysis_result):
+        """분석 결과가 gzip 압축 JSON으로 저장되는지 검증"""
+        filepath = analysis_store.save_analysis("test-game", sample_analysis_result)
+        
+        assert filepath.endswith(".json.gz")
+        with gzip.open(filepath, "rb") as f:
+            data = json.loads(f.read())
+        assert data["game_id"] == sample_analysis_result.game_id
+    
+    def test_legacy_json_file_listed_and_loaded(self, analysis_store, sample_analysis_result, temp_dir):
+        """이전 버전의 비압축 .json 파일도 조회/로드되는지 검증"""
+        game_dir = os.path.join(temp_dir, "test-game")
+        os.makedirs(game_dir)
+        legacy_path = os.path.join(game_dir, "analysis_20240115_120000.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump(sample_analysis_result.to_dict(), f, ensure_ascii=False, indent=2)
+        
+        assert analysis_store.list_analyses("test-game") == [legacy_path]
+        loaded = analysis_store.get_latest_analysis("test-game")
+        assert loaded is not None
+        assert loaded.analyzed_at == sample_analysis_result.analyzed_at
+        
+        # 같은 분석 시간으로 다시 저장하면 압축 파일로 대체
+        filepath = analysis_store.save_analysis("test-game", sample_analysis_result)
+        assert analysis_store.list_analyses("test-game") == [filepath]
+    
     def test_load_nonexistent_file(self, analysis_store):
         """존재하지 않는 파일 로드 시 None 반환"""
         result = analysis_store.load_analysis("/nonexistent/path/file.json")
@@ -160,10 +188,7 @@ class TestAnalysisDataStoreLatest:
         """최신 분석 결과 조회 (Requirements: 1.1)"""
         game_id = "test-game"
         
-        # 첫 번째 분석 저장
-        analysis_store.save_analysis(game_id, sample_analysis_result)
-        
-        # 두 번째 분석 저장 (더 최신)
+        # 더 최신 분석 결과
         newer_result = GameAnalysisResult(
             game_id=game_id,
             analyzed_at=datetime(2024, 1, 16, 12, 0, 0),  # 하루 뒤
@@ -175,7 +200,9 @@ class TestAnalysisDataStoreLatest:
             hot_issues=[],
             bug_issues=[]
         )
-        analysis_store.save_analysis(game_id, newer_result)
+        
+        # 두 분석 결과 한 번에 저장
+        analysis_store.save_analyses(game_id, [sample_analysis_result, newer_result])
         
         # 최신 결과 조회
         latest = analysis_store.get_latest_analysis(game_id)
@@ -196,9 +223,6 @@ class TestAnalysisDataStoreList:
         """분석 결과 파일 목록 조회"""
         game_id = "test-game"
         
-        # 여러 분석 저장
-        analysis_store.save_analysis(game_id, sample_analysis_result)
-        
         newer_result = GameAnalysisResult(
             game_id=game_id,
             analyzed_at=datetime(2024, 1, 16, 12, 0, 0),
@@ -210,12 +234,14 @@ class TestAnalysisDataStoreList:
             hot_issues=[],
             bug_issues=[]
         )
-        analysis_store.save_analysis(game_id, newer_result)
+        
+        # 여러 분석 한 번에 저장
+        saved = analysis_store.save_analyses(game_id, [sample_analysis_result, newer_result])
         
         # 목록 조회
         files = analysis_store.list_analyses(game_id)
         assert len(files) == 2
-        assert all(os.path.exists(f) for f in files)
+        assert files == saved
     
     def test_list_analyses_empty(self, analysis_store):
         """데이터가 없는 게임의 목록 조회"""
@@ -269,9 +295,6 @@ class TestAnalysisDataStoreDelete:
         """게임의 모든 분석 결과 삭제"""
         game_id = "test-game"
         
-        # 여러 분석 저장
-        analysis_store.save_analysis(game_id, sample_analysis_result)
-        
         newer_result = GameAnalysisResult(
             game_id=game_id,
             analyzed_at=datetime(2024, 1, 16, 12, 0, 0),
@@ -283,7 +306,9 @@ class TestAnalysisDataStoreDelete:
             hot_issues=[],
             bug_issues=[]
         )
-        analysis_store.save_analysis(game_id, newer_result)
+        
+        # 여러 분석 한 번에 저장
+        analysis_store.save_analyses(game_id, [sample_analysis_result, newer_result])
         
         # 모두 삭제
         deleted_count = analysis_store.delete_game_analyses(game_id)
@@ -314,6 +339,34 @@ class TestAnalysisDataStoreSummary:
         assert summary["hot_issue_count"] == len(sample_analysis_result.hot_issues)
         assert summary["bug_issue_count"] == len(sample_analysis_result.bug_issues)
     
+    def test_get_analysis_summary_refreshes_after_save(self, analysis_store, sample_analysis_result):
+        """새 분석 저장 후에는 캐시된 요약 대신 최신 요약 반환"""
+        game_id = "test-game"
+        
+        analysis_store.save_analysis(game_id, sample_analysis_result)
+        first = analysis_store.get_analysis_summary(game_id)
+        
+        # 반환된 딕셔너리를 변경해도 캐시에는 영향 없음
+        first["total_posts"] = -1
+        assert analysis_store.get_analysis_summary(game_id)["total_posts"] == sample_analysis_result.total_posts
+        
+        newer_result = GameAnalysisResult(
+            game_id=game_id,
+            analyzed_at=datetime(2024, 1, 16, 12, 0, 0),
+            total_posts=150,
+            total_comments=700,
+            sentiment_distribution={"positive": 50, "negative": 30, "neutral": 20},
+            sentiment_avg=0.2,
+            issues=[],
+            hot_issues=[],
+            bug_issues=[]
+        )
+        analysis_store.save_analysis(game_id, newer_result)
+        
+        summary = analysis_store.get_analysis_summary(game_id)
+        assert summary["total_analyses"] == 2
+        assert summary["total_posts"] == 150
+    
     def test_get_analysis_summary_no_data(self, analysis_store):
         """데이터가 없는 게임의 요약 조회"""
         summary = analysis_store.get_analysis_summary("nonexistent-game")
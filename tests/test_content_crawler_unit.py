@@ -7,13 +7,12 @@ Requirements: 1.3, 4.4
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 from requests.exceptions import Timeout, HTTPError, RequestException
 
 from crawler.content_crawler import ContentCrawler
 from crawler.models.data_models import CrawlerConfig, PostContent, Comment
 from crawler.parsers.base import ContentParser, ParserRegistry
-from crawler.parsers.generic import GenericParser
 
 
 class FailingParser(ContentParser):
@@ -32,6 +31,36 @@ class FailingParser(ContentParser):
         return self.domains
 
 
+def _no_wait(domain: str) -> float:
+    """대기 없이 바로 반환하는 RateLimiter.wait 대체 함수"""
+    return 0
+
+
+@pytest.fixture(scope="module")
+def shared_crawler():
+    """모듈 전체에서 공유하는 ContentCrawler (세션/파서 레지스트리를 한 번만 생성)"""
+    with ContentCrawler(CrawlerConfig(default_delay=0.1)) as crawler:
+        yield crawler
+
+
+@pytest.fixture
+def crawler(shared_crawler):
+    """공유 ContentCrawler (테스트가 변경한 파서 등록/도메인 중단 상태는 테스트 후 복원)"""
+    registry = shared_crawler.parser_registry
+    rate_limiter = shared_crawler.rate_limiter
+    parsers = dict(registry._parsers)
+    generic_parser = registry._generic_parser
+    suspended_domains = rate_limiter._suspended_domains.copy()
+    
+    yield shared_crawler
+    
+    registry._parsers.clear()
+    registry._parsers.update(parsers)
+    registry._generic_parser = generic_parser
+    rate_limiter._suspended_domains.clear()
+    rate_limiter._suspended_domains.update(suspended_domains)
+
+
 class TestContentCrawlerFallback:
     """ContentCrawler 폴백 동작 테스트
     
@@ -39,7 +68,7 @@ class TestContentCrawlerFallback:
     - Content_Parser가 파싱에 실패하면 범용 파서로 폴백
     """
     
-    def test_fallback_to_generic_parser_on_parse_failure(self):
+    def test_fallback_to_generic_parser_on_parse_failure(self, crawler, monkeypatch):
         """전용 파서 실패 시 GenericParser로 폴백
         
         Requirements: 4.4
@@ -57,23 +86,20 @@ class TestContentCrawlerFallback:
         </html>
         """
         
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         # 실패하는 파서 등록
         failing_parser = FailingParser(["test.com"])
         crawler.parser_registry.register(failing_parser)
         
         # HTTP 요청 모킹
-        with patch.object(crawler, '_fetch_html', return_value=test_html):
-            result = crawler.crawl_post("https://test.com/post/1", "테스트")
+        monkeypatch.setattr(crawler, "_fetch_html", Mock(return_value=test_html))
+        result = crawler.crawl_post("https://test.com/post/1", "테스트")
         
         # GenericParser로 폴백하여 파싱 성공해야 함
         assert result is not None
         assert result.title == "테스트 게시글 제목"
         assert "테스트 본문" in result.body
     
-    def test_returns_none_when_both_parsers_fail(self):
+    def test_returns_none_when_both_parsers_fail(self, crawler, monkeypatch):
         """전용 파서와 GenericParser 모두 실패 시 None 반환
         
         Requirements: 1.3
@@ -81,20 +107,15 @@ class TestContentCrawlerFallback:
         # 파싱 불가능한 HTML
         invalid_html = "<html><body></body></html>"
         
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         # 실패하는 파서 등록
         failing_parser = FailingParser(["test.com"])
         crawler.parser_registry.register(failing_parser)
         
-        # GenericParser도 실패하도록 모킹
-        mock_generic = Mock(spec=GenericParser)
-        mock_generic.parse_post.side_effect = ValueError("GenericParser도 실패")
-        crawler.parser_registry._generic_parser = mock_generic
+        # 범용 파서도 실패하는 파서로 교체 (공유 crawler 픽스처가 테스트 후 복원)
+        crawler.parser_registry.set_generic_parser(FailingParser([]))
         
-        with patch.object(crawler, '_fetch_html', return_value=invalid_html):
-            result = crawler.crawl_post("https://test.com/post/1", "테스트")
+        monkeypatch.setattr(crawler, "_fetch_html", Mock(return_value=invalid_html))
+        result = crawler.crawl_post("https://test.com/post/1", "테스트")
         
         assert result is None
 
@@ -106,52 +127,43 @@ class TestContentCrawlerErrorHandling:
     - 게시글 본문 추출 실패 시 에러 로깅 후 다음 URL로 진행
     """
     
-    def test_returns_none_on_fetch_failure(self):
+    def test_returns_none_on_fetch_failure(self, crawler, monkeypatch):
         """HTML 가져오기 실패 시 None 반환
         
         Requirements: 1.3
         """
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
-        with patch.object(crawler, '_fetch_html', return_value=None):
-            result = crawler.crawl_post("https://example.com/post/1", "테스트")
+        monkeypatch.setattr(crawler, "_fetch_html", Mock(return_value=None))
+        result = crawler.crawl_post("https://example.com/post/1", "테스트")
         
         assert result is None
     
-    def test_returns_none_on_timeout(self):
+    def test_returns_none_on_timeout(self, crawler, monkeypatch):
         """타임아웃 발생 시 None 반환
         
         Requirements: 1.3
         """
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
-        with patch.object(crawler.session, 'get', side_effect=Timeout("타임아웃")):
-            with patch.object(crawler.rate_limiter, 'wait', return_value=0):
-                result = crawler.crawl_post("https://example.com/post/1", "테스트")
+        monkeypatch.setattr(crawler.session, "get", Mock(side_effect=Timeout("타임아웃")))
+        monkeypatch.setattr(crawler.rate_limiter, "wait", _no_wait)
+        result = crawler.crawl_post("https://example.com/post/1", "테스트")
         
         assert result is None
     
-    def test_returns_none_on_http_error(self):
+    def test_returns_none_on_http_error(self, crawler, monkeypatch):
         """HTTP 에러 발생 시 None 반환
         
         Requirements: 1.3
         """
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         mock_response = Mock()
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = HTTPError("500 Server Error")
         
-        with patch.object(crawler.session, 'get', return_value=mock_response):
-            with patch.object(crawler.rate_limiter, 'wait', return_value=0):
-                result = crawler.crawl_post("https://example.com/post/1", "테스트")
+        monkeypatch.setattr(crawler.session, "get", Mock(return_value=mock_response))
+        monkeypatch.setattr(crawler.rate_limiter, "wait", _no_wait)
+        result = crawler.crawl_post("https://example.com/post/1", "테스트")
         
         assert result is None
     
-    def test_crawl_multiple_continues_on_failure(self):
+    def test_crawl_multiple_continues_on_failure(self, crawler, monkeypatch):
         """여러 URL 크롤링 시 실패해도 계속 진행
         
         Requirements: 1.3
@@ -168,21 +180,18 @@ class TestContentCrawlerErrorHandling:
         </html>
         """
         
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         # 첫 번째는 실패, 두 번째는 성공
         def mock_fetch(url):
             if "fail" in url:
                 return None
             return test_html
         
-        with patch.object(crawler, '_fetch_html', side_effect=mock_fetch):
-            results = crawler.crawl_multiple_posts([
-                "https://example.com/fail/1",
-                "https://example.com/success/2",
-                "https://example.com/fail/3",
-            ], "테스트")
+        monkeypatch.setattr(crawler, "_fetch_html", mock_fetch)
+        results = crawler.crawl_multiple_posts([
+            "https://example.com/fail/1",
+            "https://example.com/success/2",
+            "https://example.com/fail/3",
+        ], "테스트")
         
         # 성공한 것만 결과에 포함
         assert len(results) == 1
@@ -195,20 +204,17 @@ class TestContentCrawlerComments:
     Requirements: 2.1, 2.3, 2.4
     """
     
-    def test_returns_empty_list_on_fetch_failure(self):
+    def test_returns_empty_list_on_fetch_failure(self, crawler, monkeypatch):
         """HTML 가져오기 실패 시 빈 배열 반환
         
         Requirements: 2.4
         """
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
-        with patch.object(crawler, '_fetch_html', return_value=None):
-            result = crawler.crawl_comments("https://example.com/post/1")
+        monkeypatch.setattr(crawler, "_fetch_html", Mock(return_value=None))
+        result = crawler.crawl_comments("https://example.com/post/1")
         
         assert result == []
     
-    def test_fallback_on_comment_parse_failure(self):
+    def test_fallback_on_comment_parse_failure(self, crawler, monkeypatch):
         """댓글 파싱 실패 시 GenericParser로 폴백
         
         Requirements: 4.4
@@ -226,15 +232,12 @@ class TestContentCrawlerComments:
         </html>
         """
         
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         # 실패하는 파서 등록
         failing_parser = FailingParser(["test.com"])
         crawler.parser_registry.register(failing_parser)
         
-        with patch.object(crawler, '_fetch_html', return_value=test_html):
-            result = crawler.crawl_comments("https://test.com/post/1")
+        monkeypatch.setattr(crawler, "_fetch_html", Mock(return_value=test_html))
+        result = crawler.crawl_comments("https://test.com/post/1")
         
         # GenericParser로 폴백하여 댓글 파싱 시도
         # (실제 결과는 HTML 구조에 따라 다를 수 있음)
@@ -247,16 +250,13 @@ class TestContentCrawlerRateLimiting:
     Requirements: 5.1, 5.2, 5.3
     """
     
-    def test_returns_none_when_domain_suspended(self):
+    def test_returns_none_when_domain_suspended(self, crawler):
         """도메인이 일시 중단 상태일 때 None 반환
         
         Requirements: 5.3
         """
-        config = CrawlerConfig(default_delay=0.1)
-        crawler = ContentCrawler(config)
-        
         # 도메인 일시 중단 상태로 설정
-        crawler.rate_limiter._suspended_domains["example.com"] = True
+        crawler.rate_limiter.suspend("example.com")
         
         result = crawler.crawl_post("https://example.com/post/1", "테스트")
         
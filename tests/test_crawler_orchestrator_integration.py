@@ -106,6 +106,7 @@ class TestCrawlResultDataClass:
         assert result.total_searched == 0
         assert result.total_crawled == 0
         assert result.total_failed == 0
+        assert result.total_comments == 0
         assert result.keywords_used == []
         assert result.sites_crawled == []
         assert result.errors == []
@@ -236,6 +237,7 @@ class TestCrawlerOrchestratorCrawlUrls:
             assert len(result.posts) == 1
             assert result.posts[0].title == "Test Title"
             assert len(result.posts[0].comments) == 2
+            assert result.total_comments == 2
             
             orchestrator.close()
     
@@ -470,6 +472,7 @@ class TestIntegrationWorkflow:
             assert post.title == "몬스터헌터 리뷰"
             assert post.site == "inven.co.kr"
             assert len(post.comments) == 2
+            assert result.total_comments == 2
             
             # 저장된 파일 확인
             files = os.listdir(tmpdir)
@@ -639,9 +642,22 @@ class TestGameAnalyzerIntegration:
         Requirements: 1.1, 2.1, 3.1, 4.1
         - 크롤링 후 자동 분석 수행
         """
+        from crawler.analysis.game_analyzer import GameAnalyzer
+        from crawler.exporters.analysis_store import AnalysisDataStore
+        from crawler.models.game_profile import GameProfileManager
+        
         with tempfile.TemporaryDirectory() as tmpdir:
             config = CrawlerConfig(output_dir=tmpdir)
-            orchestrator = CrawlerOrchestrator(config)
+            # 크롤링/분석 결과가 작업 디렉토리가 아닌 임시 디렉토리에 저장되도록 설정
+            profile_manager = GameProfileManager(
+                base_data_dir=os.path.join(tmpdir, "data"),
+                base_quicksight_dir=os.path.join(tmpdir, "quicksight_data")
+            )
+            orchestrator = CrawlerOrchestrator(config, profile_manager=profile_manager)
+            orchestrator._game_analyzer = GameAnalyzer(
+                analysis_store=AnalysisDataStore(base_dir=os.path.join(tmpdir, "analysis_data")),
+                profile_manager=profile_manager
+            )
             
             # Mock 게시글
             mock_posts = [
@@ -5,8 +5,6 @@ Requirements: 6.2
 import os
 import json
 import csv
-import tempfile
-import shutil
 from datetime import datetime
 from typing import List
 import pytest
@@ -14,10 +12,8 @@ from crawler.models.data_models import PostContent, Comment
 from crawler.exporters.exporters import JSONExporter, CSVExporter, ExporterFactory
 
 @pytest.fixture
-def temp_dir():
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    return str(tmp_path)
 
 @pytest.fixture
 def sample_posts():
@@ -37,6 +37,9 @@ from crawler.models.analysis_models import KeywordCluster, DetectedIssue, IssueS
 from crawler.models.data_models import PostContent, Comment
 
 
+_SEVERITIES = tuple(IssueSeverity)
+
+
 # Custom strategies for generating test data
 @st.composite
 def keyword_strategy(draw):
@@ -146,7 +149,7 @@ def detected_issue_strategy(draw):
         priority_score=draw(st.floats(min_value=0.0, max_value=1.0)),
         is_hot=False,
         is_bug=draw(st.booleans()),
-        severity=draw(st.sampled_from(list(IssueSeverity))),
+        severity=draw(st.sampled_from(_SEVERITIES)),
         related_posts=[],
         first_seen=datetime.now(),
         sentiment_avg=draw(st.floats(min_value=-1.0, max_value=1.0))
@@ -34,6 +34,9 @@ from crawler.models.analysis_models import (
 from crawler.exporters.quicksight_exporter import GameQuickSightExporter
 
 
+_SEVERITIES = tuple(IssueSeverity)
+
+
 # Custom strategies for generating test data
 @st.composite
 def comment_strategy(draw):
@@ -142,7 +145,7 @@ def detected_issue_strategy(draw):
     priority_score = draw(st.floats(min_value=0.0, max_value=100.0, allow_nan=False))
     is_hot = draw(st.booleans())
     is_bug = draw(st.booleans())
-    severity = draw(st.sampled_from(list(IssueSeverity)))
+    severity = draw(st.sampled_from(_SEVERITIES))
     related_posts = draw(st.lists(
         st.text(min_size=5, max_size=50).filter(lambda x: x.strip()),
         min_size=0,
@@ -211,6 +211,25 @@ class TestExponentialBackoff:
             rate_limiter.reset_retry_count(domain)
             
             assert rate_limiter.get_retry_count(domain) == 0
+    
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow], deadline=None)
+    @given(
+        domain=domain_strategy
+    )
+    def test_suspend_and_resume_domain(self, domain: str):
+        """suspend()된 도메인은 wait()에서 -1을 반환하고, resume_domain() 후 재개되어야 한다"""
+        rate_limiter = RateLimiter(CrawlerConfig(default_delay=0.0))
+        rate_limiter.set_jitter_enabled(False)
+        
+        rate_limiter.suspend(domain)
+        
+        assert rate_limiter.is_domain_suspended(domain)
+        assert rate_limiter.wait(domain) == -1.0
+        
+        rate_limiter.resume_domain(domain)
+        
+        assert not rate_limiter.is_domain_suspended(domain)
+        assert rate_limiter.wait(domain) >= 0
 
 
 class TestDomainSpecificRateLimitSettings:
@@ -0,0 +1,128 @@
+"""
+robots.txt 유틸리티 Unit Tests
+
+- 허용/차단 판정 및 응답 코드별 동작 검증
+- ContentCrawler가 크롤러 세션으로 robots.txt를 가져오는지 검증
+"""
+
+from unittest.mock import Mock, patch
+from requests.exceptions import RequestException
+
+from crawler.content_crawler import ContentCrawler
+from crawler.models.data_models import CrawlerConfig
+from crawler.utils.robots import fetch_robots_parser
+
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /private/
+"""
+
+
+def make_response(status_code: int = 200, text: str = ROBOTS_TXT) -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    return response
+
+
+def fetch(response=None, error=None):
+    """지정한 응답(또는 예외)을 돌려주는 GET 함수로 robots.txt 파서 생성"""
+    get = Mock(return_value=response, side_effect=error)
+    return fetch_robots_parser("https://example.com/robots.txt", get)
+
+
+class TestFetchRobotsParser:
+    """robots.txt 응답 코드별 파서 생성 테스트"""
+
+    def test_allowed_and_disallowed_paths(self):
+        """Disallow 경로만 차단"""
+        parser = fetch(make_response())
+        assert parser.can_fetch("*", "https://example.com/board/1")
+        assert not parser.can_fetch("*", "https://example.com/private/1")
+
+    def test_request_failure_returns_none(self):
+        """robots.txt 요청 실패 시 None 반환"""
+        assert fetch(error=RequestException("fail")) is None
+
+    def test_missing_robots_allows(self):
+        """robots.txt가 없으면(404) 허용"""
+        assert fetch(make_response(404, "")).can_fetch("*", "https://example.com/private/1")
+
+    def test_forbidden_robots_allows(self):
+        """robots.txt 접근 거부(401/403)는 규칙 없음으로 간주하여 허용"""
+        for status_code in (401, 403):
+            assert fetch(make_response(status_code, "")).can_fetch("*", "https://example.com/board/1")
+
+    def test_server_error_disallows(self):
+        """robots.txt 서버 에러(5xx)는 전체 차단"""
+        assert not fetch(make_response(503, "")).can_fetch("*", "https://example.com/board/1")
+
+
+def make_crawler(respect_robots_txt: bool = True) -> ContentCrawler:
+    return ContentCrawler(CrawlerConfig(
+        default_delay=0.01, jitter_range=(0.0, 0.0), respect_robots_txt=respect_robots_txt
+    ))
+
+
+def page_response() -> Mock:
+    return Mock(status_code=200, encoding='utf-8', text="<html></html>")
+
+
+def route(url, **kwargs):
+    """robots.txt 요청과 게시글 요청에 각각 응답"""
+    return make_response() if url.endswith("/robots.txt") else page_response()
+
+
+class TestContentCrawlerRobots:
+    """ContentCrawler robots.txt 준수 테스트"""
+    
+    def test_disallowed_url_not_fetched(self):
+        """respect_robots_txt 설정 시 차단된 URL은 요청하지 않음"""
+        crawler = make_crawler()
+        
+        with patch.object(crawler.session, 'get', side_effect=route) as mock_session_get:
+            assert crawler._fetch_html("https://example.com/private/1") is None
+        
+        # robots.txt만 크롤러 세션으로 요청
+        requested = [c.args[0] for c in mock_session_get.call_args_list]
+        assert requested == ["https://example.com/robots.txt"]
+        crawler.close()
+    
+    def test_robots_fetched_with_crawler_session_once_per_domain(self):
+        """robots.txt는 브라우저 User-Agent로 도메인별 한 번만 요청"""
+        crawler = make_crawler()
+        
+        with patch.object(crawler.session, 'get', side_effect=route) as mock_session_get:
+            for i in range(3):
+                assert crawler._fetch_html(f"https://example.com/board/{i}") == "<html></html>"
+        
+        robots_calls = [
+            c for c in mock_session_get.call_args_list
+            if c.args[0] == "https://example.com/robots.txt"
+        ]
+        assert len(robots_calls) == 1
+        assert "python-requests" not in robots_calls[0].kwargs["headers"]["User-Agent"]
+        crawler.close()
+    
+    def test_forbidden_robots_does_not_block_crawl(self):
+        """robots.txt가 403이어도 게시글은 크롤링"""
+        crawler = make_crawler()
+        
+        def forbidden_robots(url, **kwargs):
+            return make_response(403, "") if url.endswith("/robots.txt") else page_response()
+        
+        with patch.object(crawler.session, 'get', side_effect=forbidden_robots):
+            assert crawler._fetch_html("https://example.com/private/1") == "<html></html>"
+        
+        crawler.close()
+    
+    def test_robots_ignored_by_default(self):
+        """기본 설정에서는 robots.txt를 요청하지 않음"""
+        crawler = make_crawler(respect_robots_txt=False)
+        
+        with patch.object(crawler.session, 'get', return_value=page_response()) as mock_session_get:
+            assert crawler._fetch_html("https://example.com/private/1") == "<html></html>"
+        
+        mock_session_get.assert_called_once()
+        crawler.close()
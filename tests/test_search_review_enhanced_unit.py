@@ -0,0 +1,88 @@
+"""
+EnhancedGameReviewCrawler 크롤링 결과 캐시 Unit Tests
+
+- 캐시는 명시적으로 요청한 경우에만 사용
+- 캐시 적중/미스 및 적중 시 결과 저장 검증
+- 크롤러 설정이 다르면 캐시를 공유하지 않음
+"""
+
+import pytest
+from unittest.mock import patch
+
+import search_review_enhanced
+from search_review_enhanced import EnhancedGameReviewCrawler
+from crawler import CrawlerConfig, CrawlResult, PostContent
+
+
+KEYWORDS = ["몬스터헌터 리뷰"]
+SITES = ["example.com"]
+
+
+def make_result() -> CrawlResult:
+    post = PostContent(
+        url="https://example.com/post/1",
+        title="리뷰",
+        body="재미있어요",
+        site="example.com",
+        keyword=KEYWORDS[0]
+    )
+    return CrawlResult(posts=[post], total_searched=1, total_crawled=1)
+
+
+@pytest.fixture(autouse=True)
+def crawl_cache_path(tmp_path, monkeypatch):
+    """크롤링 결과 캐시를 테스트별 임시 파일로 지정"""
+    monkeypatch.setattr(search_review_enhanced, "CRAWL_CACHE_PATH", str(tmp_path / "crawl.cache"))
+
+
+def make_crawler(**config_kwargs) -> EnhancedGameReviewCrawler:
+    return EnhancedGameReviewCrawler(CrawlerConfig(default_delay=0.1, **config_kwargs))
+
+
+class TestCrawlResultCache:
+    """크롤링 결과 캐시 테스트"""
+
+    def test_cache_disabled_by_default(self):
+        """기본 설정에서는 매번 크롤링"""
+        with make_crawler() as crawler, \
+             patch.object(crawler.orchestrator, 'crawl', return_value=make_result()) as mock_crawl:
+            crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False)
+            crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False)
+
+        assert mock_crawl.call_count == 2
+
+    def test_cache_miss_then_hit(self):
+        """첫 호출은 크롤링하고, 같은 조건의 다음 호출은 캐시된 결과 반환"""
+        with make_crawler() as crawler, \
+             patch.object(crawler.orchestrator, 'crawl', return_value=make_result()) as mock_crawl:
+            crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False, use_cache=True)
+            cached = crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False, use_cache=True)
+
+            assert mock_crawl.call_count == 1
+            assert [p.url for p in cached.posts] == ["https://example.com/post/1"]
+            # 캐시된 게시글도 데이터 저장소에 추가
+            assert len(crawler.get_posts()) == 1
+
+    def test_cache_hit_still_saves_results(self):
+        """캐시 적중 시에도 save_results면 결과 파일 저장"""
+        with make_crawler() as crawler, \
+             patch.object(crawler.orchestrator, 'crawl', return_value=make_result()), \
+             patch.object(crawler.orchestrator, '_save_results') as mock_save:
+            crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False, use_cache=True)
+            cached = crawler.crawl_game_reviews(
+                KEYWORDS, SITES, output_format="csv", save_results=True, use_cache=True
+            )
+
+        mock_save.assert_called_once_with(cached.posts, "csv")
+
+    def test_cache_not_shared_across_configs(self):
+        """크롤러 설정이 다르면 캐시된 결과를 사용하지 않음"""
+        with make_crawler() as crawler, \
+             patch.object(crawler.orchestrator, 'crawl', return_value=make_result()):
+            crawler.crawl_game_reviews(KEYWORDS, SITES, save_results=False, use_cache=True)
+
+        with make_crawler(relevance_threshold=0.9) as other, \
+             patch.object(other.orchestrator, 'crawl', return_value=make_result()) as mock_crawl:
+            other.crawl_game_reviews(KEYWORDS, SITES, save_results=False, use_cache=True)
+
+        mock_crawl.assert_called_once()